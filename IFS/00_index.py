@@ -3,6 +3,33 @@
 #
 # 00_index.py:
 #
+# chaos_game.py:
+# Vectorized chaos game renderer of IFS with density histogram.
+#
+# colorizer.py:
+# Conversion of iteration or intensity buffers into images via palette lookup table.
+#
 # ifs.py:
 # IFS systémy.
 #
+# measure_transform.py:
+# Deterministic IFS renderer based on iterated transform of invariant measure.
+#
+# palette_blues.py:
+# Color palette taken from Fractint.
+#
+# palette_gold.py:
+# Color palette taken from Fractint.
+#
+# palette_greens.py:
+# Color palette taken from Fractint.
+#
+# palette_ice.py:
+# Color palette taken from Fractint.
+#
+# palette_mandmap.py:
+# Color palette taken from Fractint.
+#
+# render_cache.py:
+# Content-addressed on-disk cache for computed buffers and rendered images.
+#
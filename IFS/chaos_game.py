@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+"""Vectorized chaos game renderer of IFS with density histogram."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from time import time
+
+import numpy as np
+from PIL import Image
+
+from colorizer import apply_palette
+from ifs import IFS, IFS_SYSTEMS, Bounds, Seed, fit_bounds, system_bounds
+
+# rozměry obrázku s fraktálem
+IMAGE_WIDTH = 512
+IMAGE_HEIGHT = 512
+
+# number of independent walkers advanced in one step
+WALKERS = 1 << 16
+
+# iterations of each walker before its points are drawn
+WARMUP = 20
+
+
+def transformation_tables(ifs: IFS) -> tuple[np.ndarray, np.ndarray]:
+    """Return coefficients of all transformations and cumulative probabilities."""
+    table = np.array(ifs, dtype=np.float64)
+    return table[:, :6], np.cumsum(table[:, 6])
+
+
+def choose_transformations(
+    cumulative: np.ndarray, rng: np.random.Generator, count: int
+) -> np.ndarray:
+    """Choose transformation for each walker according to probabilities.
+
+    Result is the same as the linear scan over cumulative probabilities
+    used by generate_ifs, the last transformation takes the rest up to 1.0.
+    """
+    chosen = np.searchsorted(cumulative, rng.random(count), side="right")
+    return np.minimum(chosen, len(cumulative) - 1)
+
+
+def chaos_game(
+    ifs: IFS,
+    points: int,
+    width: int,
+    height: int,
+    bounds: Bounds,
+    walkers: int = WALKERS,
+    seed: Seed = None,
+) -> np.ndarray:
+    """Compute histogram with number of hits of each pixel by chaos game.
+
+    All walkers are advanced at once, each one picks its own random
+    transformation in each step. Number of points is rounded up to whole
+    steps. Bounds (xmin, ymin, xmax, ymax) of the plane are mapped onto the
+    whole histogram.
+    """
+    rng = np.random.default_rng(seed)
+    coefficients, cumulative = transformation_tables(ifs)
+    a, b, c, d, e, f = coefficients.T
+
+    xmin, ymin, xmax, ymax = bounds
+    scale_x = width / (xmax - xmin)
+    scale_y = height / (ymax - ymin)
+
+    histogram = np.zeros(width * height, dtype=np.int64)
+    walkers = max(1, min(walkers, points))
+    x = np.zeros(walkers)
+    y = np.zeros(walkers)
+
+    steps = WARMUP + -(-points // walkers)
+    for step in range(steps):
+        j = choose_transformations(cumulative, rng, walkers)
+        x, y = x * a[j] + y * b[j] + e[j], x * c[j] + y * d[j] + f[j]
+        if step < WARMUP:
+            continue
+
+        # vypočítat souřadnice bodů v histogramu
+        px = ((x - xmin) * scale_x).astype(np.int64)
+        py = ((y - ymin) * scale_y).astype(np.int64)
+        visible = (px >= 0) & (py >= 0) & (px < width) & (py < height)
+        histogram += np.bincount(
+            py[visible] * width + px[visible], minlength=width * height
+        )
+    return histogram.reshape(height, width)
+
+
+def tone_map(histogram: np.ndarray) -> np.ndarray:
+    """Convert histogram into palette indices by logarithm of density."""
+    maximum = histogram.max()
+    if maximum == 0:
+        return np.zeros(histogram.shape, dtype=np.int32)
+    return (np.log1p(histogram) * (255.0 / np.log1p(maximum))).astype(np.int32)
+
+
+def render_ifs(
+    image: Image.Image,
+    palette: tuple[tuple[int, int, int], ...],
+    ifs: IFS,
+    points: int,
+    bounds: Bounds,
+    seed: Seed = None,
+) -> None:
+    """Render IFS by chaos game into given image, colors are given by point density."""
+    width, height = image.size
+    histogram = chaos_game(ifs, points, width, height, bounds, seed=seed)
+    apply_palette(image, tone_map(histogram), palette)
+
+
+def main() -> None:
+    """Function called after the script initialization."""
+    import palette_blues
+
+    image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
+
+    for name, transformations in IFS_SYSTEMS.items():
+        print(name)
+        # obdélník opsaný IFS se stejným poměrem stran jako obrázek
+        bounds = fit_bounds(system_bounds(name), IMAGE_WIDTH, IMAGE_HEIGHT)
+        t1 = time()
+        render_ifs(image, palette_blues.palette, transformations, 10_000_000, bounds, seed=0)
+        t2 = time()
+        difftime = t2 - t1
+        print(f"Calculation finished in {difftime:4.1f} seconds")
+
+        # uložení obrázku do souboru
+        image.save(name + "_density.png")
+
+
+if __name__ == "__main__":
+    # call the main function
+    main()
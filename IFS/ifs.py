@@ -15,14 +15,34 @@
 
 """IFS systémy."""
 
-from random import random
+from functools import cache
 
+import numpy as np
 from PIL import Image
 
+from render_cache import RenderCache
+
 # rozměry obrázku s fraktálem
 IMAGE_WIDTH = 512
 IMAGE_HEIGHT = 512
 
+# seed generátoru náhodných čísel: cokoli, co akceptuje np.random.default_rng,
+# nezávislé proudy pro paralelní výpočty lze vytvořit přes SeedSequence.spawn
+Seed = int | np.random.SeedSequence | np.random.Generator | None
+
+# IFS je dán n-ticí transformací (a, b, c, d, e, f, pravděpodobnost)
+IFS = tuple[tuple[float, float, float, float, float, float, float], ...]
+
+# obdélník v rovině (xmin, ymin, xmax, ymax)
+Bounds = tuple[float, float, float, float]
+
+# počet bodů náhodné procházky, ze kterých se odhaduje obdélník opsaný IFS
+BOUNDS_WALKERS = 1024
+BOUNDS_STEPS = 50
+
+# okraj kolem odhadnutého obdélníku (relativně k jeho rozměrům)
+BOUNDS_MARGIN = 0.02
+
 # transformace a jejich pravděpodobnosti
 IFS_SYSTEMS = {
     "binary": (
@@ -83,26 +103,108 @@ IFS_SYSTEMS = {
 }
 
 
+def fixed_points(ifs: IFS) -> np.ndarray:
+    """Pevné body všech transformací, všechny leží na atraktoru IFS."""
+    table = np.array(ifs, dtype=np.float64)
+    matrices = table[:, :4].reshape(-1, 2, 2)
+    return np.linalg.solve(np.eye(2) - matrices, table[:, 4:6, np.newaxis])[..., 0]
+
+
+def estimate_bounds(ifs: IFS) -> Bounds:
+    """Odhad obdélníku opsaného IFS krátkou náhodnou procházkou mnoha bodů.
+
+    Procházka začíná v pevných bodech transformací, které na atraktoru
+    leží, takže není nutné zahazovat startovní iterace. Transformace se
+    vybírají se stejnými pravděpodobnostmi jako při vykreslování.
+    """
+    rng = np.random.default_rng(0)
+    table = np.array(ifs, dtype=np.float64)
+    a, b, c, d, e, f = table[:, :6].T
+    cumulative = np.cumsum(table[:, 6])
+
+    start = fixed_points(ifs)[np.arange(BOUNDS_WALKERS) % len(table)]
+    x, y = start[:, 0], start[:, 1]
+    xmin, ymin = x.min(), y.min()
+    xmax, ymax = x.max(), y.max()
+    for _ in range(BOUNDS_STEPS):
+        # stejný výběr transformace jako v generate_ifs
+        j = np.searchsorted(cumulative, rng.random(BOUNDS_WALKERS), side="right")
+        j = np.minimum(j, len(table) - 1)
+        x, y = x * a[j] + y * b[j] + e[j], x * c[j] + y * d[j] + f[j]
+        xmin = min(xmin, x.min())
+        ymin = min(ymin, y.min())
+        xmax = max(xmax, x.max())
+        ymax = max(ymax, y.max())
+
+    # přidat okraj, aby body na hranici nepadly mimo obrázek
+    margin_x = (xmax - xmin) * BOUNDS_MARGIN
+    margin_y = (ymax - ymin) * BOUNDS_MARGIN
+    return (
+        float(xmin - margin_x),
+        float(ymin - margin_y),
+        float(xmax + margin_x),
+        float(ymax + margin_y),
+    )
+
+
+@cache
+def system_bounds(name: str) -> Bounds:
+    """Obdélník opsaný IFS z IFS_SYSTEMS, pro každé jméno se počítá jen jednou."""
+    return estimate_bounds(IFS_SYSTEMS[name])
+
+
+def fit_bounds(bounds: Bounds, width: int, height: int) -> Bounds:
+    """Rozšířit obdélník tak, aby měl stejný poměr stran jako obrázek.
+
+    Atraktor je v obrázku vycentrován a není deformován.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    # ochrana proti degenerovanému atraktoru (úsečka nebo bod)
+    size_x = max(xmax - xmin, 1e-9)
+    size_y = max(ymax - ymin, 1e-9)
+    scale = max(size_x / width, size_y / height)
+    xc = (xmin + xmax) / 2.0
+    yc = (ymin + ymax) / 2.0
+    return (
+        xc - scale * width / 2.0,
+        yc - scale * height / 2.0,
+        xc + scale * width / 2.0,
+        yc + scale * height / 2.0,
+    )
+
+
 def generate_ifs(
     image: Image.Image,
     width: int,
     height: int,
     maxiter: int,
     startiter: int,
-    ifs: tuple[tuple[float, float, float, float, float, float, float], ...],
+    ifs: IFS,
+    seed: Seed = None,
+    bounds: Bounds | None = None,
 ) -> None:
-    delitel = 12.0
+    """Vykreslení IFS metodou náhodné procházky, stejný seed dává stejný obrázek.
+
+    Pokud není obdélník opsaný IFS zadán, odhadne se pomocí estimate_bounds.
+    """
+    if bounds is None:
+        bounds = estimate_bounds(ifs)
 
-    # obdélník opsaný IFS
-    xmin = -7.0
-    ymin = -1.0
+    # všechna náhodná čísla se vygenerují najednou
+    rng = np.random.default_rng(seed)
+    randoms = rng.random(maxiter).tolist()
+
+    # obdélník opsaný IFS se stejným poměrem stran jako obrázek
+    xmin, ymin, xmax, ymax = fit_bounds(bounds, width, height)
+    scale_x = width / (xmax - xmin)
+    scale_y = height / (ymax - ymin)
 
     # libovolné počáteční souřadnice v rovině
     x1 = y1 = 0.0
 
     for i in range(maxiter):
         # pp leží v rozsahu 0.0 - 1.0
-        pp = random()
+        pp = randoms[i]
 
         # na základě náhodného čísla najít transformaci
         suma = 0.0
@@ -121,25 +223,37 @@ def generate_ifs(
         # pokud byl překročen počet startovních iterací
         if i > startiter:
             # vypočítat a zobrazit bod
-            x2 = (x1 - xmin) * width / delitel
-            y2 = (y1 - ymin) * height / delitel
+            x2 = (x1 - xmin) * scale_x
+            y2 = (y1 - ymin) * scale_y
 
             x = int(x2)
             y = int(y2)
-            if x >= 0 and y >= 0 and x < IMAGE_WIDTH and y < IMAGE_HEIGHT:
+            if x >= 0 and y >= 0 and x < width and y < height:
                 image.putpixel((x, y), 0xFFFFFF)  # type: ignore
 
 
 def main() -> None:
+    # obrázky se vykreslují jen tehdy, pokud nejsou uloženy v cache
+    cache = RenderCache()
+
     # vykreslit všechny IFS
     for name, transformations in IFS_SYSTEMS.items():
         print(name)
 
-        # inicializace prázdného obrázku
-        image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
+        bounds = system_bounds(name)
+        key = cache.key(
+            generate_ifs, IMAGE_WIDTH, IMAGE_HEIGHT, 100000, 1000, transformations, 0, bounds
+        )
+        image = cache.load_image(key)
+        if image is None:
+            # inicializace prázdného obrázku
+            image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
 
-        # vykreslení IFS
-        generate_ifs(image, IMAGE_WIDTH, IMAGE_HEIGHT, 100000, 1000, transformations)
+            # vykreslení IFS
+            generate_ifs(
+                image, IMAGE_WIDTH, IMAGE_HEIGHT, 100000, 1000, transformations, 0, bounds
+            )
+            cache.save_image(key, image)
 
         # uložení obrázku do souboru
         image.save(name + ".png")
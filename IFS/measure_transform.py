@@ -0,0 +1,420 @@
+#!/usr/bin/env python
+
+"""Deterministic IFS renderer based on iterated transform of invariant measure."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+# Each pass applies all affine maps, weighted by their probabilities, to
+# the measure stored in a raster, until the raster stops changing. Simple
+# raster, where the mass of each pixel is spread over its neighbours by
+# every pass, diffuses the measure. So each pixel stores not only its mass,
+# but also the centre of mass and covariance of the mass inside of it.
+# Affine maps transform both exactly. The image of one pixel is approximated
+# by a box with the same centre and variances, split by pixel borders into
+# at most four pieces, and the first and second moments of the pieces are
+# added to the pixels where they fall, so no pass changes the spread of the
+# measure. The measure is also mapped to itself by compositions of the maps
+# weighted by products of their probabilities, so compositions that shrink
+# pixels enough are used instead of the maps themselves. The measure is
+# computed on a coarse raster first, the first pass for each finer raster
+# reads the previous one, until the full resolution is reached.
+
+from time import time
+
+import numpy as np
+from PIL import Image
+
+from chaos_game import tone_map
+from colorizer import apply_palette
+from ifs import IFS, IFS_SYSTEMS, Bounds, fit_bounds, system_bounds
+
+# rozměry obrázku s fraktálem
+IMAGE_WIDTH = 2048
+IMAGE_HEIGHT = 2048
+
+# passes stop when L1 distance of successive densities drops below this value
+TOLERANCE = 1e-3
+
+# maximum number of passes for one resolution of the raster
+MAX_PASSES = 100
+
+# maps are composed until they shrink the raster at least by this factor
+CONTRACTION = 0.45
+
+# maximum number of maps composed together
+MAX_DEPTH = 16
+
+# the coarsest raster used at the beginning has at least this size
+MIN_SIZE = 64
+
+# number of pixels transformed at once, chunks fit into the processor cache
+CHUNK_SIZE = 1 << 15
+
+# density is converted to histogram of chaos game with this mean number of points per pixel
+POINTS_PER_PIXEL = 8
+
+# affine maps in pixel coordinates: matrices, offsets and probabilities
+Transformations = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# measure in raster: indices of pixels with nonzero mass, their masses and
+# rows with centres of mass relative to pixel corners, var(x), var(y), cov(x, y)
+Raster = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def transformation_probabilities(ifs: IFS) -> np.ndarray:
+    """Return probabilities of transformations as they are used by generate_ifs.
+
+    Stored probabilities do not always sum to one, the last transformation
+    takes the rest up to 1.0 and transformations beyond 1.0 are never used.
+    """
+    cumulative = np.minimum(np.cumsum([t[6] for t in ifs]), 1.0)
+    cumulative[-1] = 1.0
+    return np.diff(cumulative, prepend=0.0)
+
+
+def operator_norm(matrices: np.ndarray) -> np.ndarray:
+    """Return largest singular values of 2x2 matrices, i.e. how much they can stretch."""
+    squares = np.sum(matrices * matrices, axis=(-2, -1))
+    determinants = np.linalg.det(matrices)
+    discriminant = np.maximum(squares * squares - 4.0 * determinants * determinants, 0.0)
+    return np.sqrt(0.5 * (squares + np.sqrt(discriminant)))
+
+
+def pixel_transformations(ifs: IFS, width: int, height: int, bounds: Bounds) -> Transformations:
+    """Return used transformations of IFS expressed in pixel coordinates of the raster."""
+    probabilities = transformation_probabilities(ifs)
+    used = probabilities > 0.0
+    table = np.array(ifs, dtype=np.float64)[used]
+    matrices = table[:, :4].reshape(-1, 2, 2)
+    offsets = table[:, 4:6]
+
+    xmin, ymin, xmax, ymax = bounds
+    scale = np.array([width / (xmax - xmin), height / (ymax - ymin)])
+    origin = np.array([xmin, ymin])
+    pixel_matrices = scale[:, np.newaxis] * matrices / scale[np.newaxis, :]
+    pixel_offsets = scale * (matrices @ origin + offsets - origin)
+    return pixel_matrices, pixel_offsets, probabilities[used]
+
+
+def compose_transformations(
+    transformations: Transformations, contraction: float = CONTRACTION
+) -> Transformations:
+    """Compose transformations until each composition shrinks at least by given factor.
+
+    The measure is the sum of its images by all compositions, weighted by
+    products of probabilities, for any set of compositions that covers all
+    infinite sequences of maps, so compositions are expanded independently.
+    """
+    matrices, offsets, probabilities = transformations
+    done = []
+    # rozpracované složené transformace, jako první identita
+    stack = [(np.eye(2), np.zeros(2), 1.0, 0)]
+    while stack:
+        matrix, offset, probability, depth = stack.pop()
+        for k in range(len(probabilities)):
+            composed = (
+                matrix @ matrices[k],
+                matrix @ offsets[k] + offset,
+                probability * probabilities[k],
+                depth + 1,
+            )
+            if operator_norm(composed[0]) <= contraction or depth + 1 >= MAX_DEPTH:
+                done.append(composed)
+            else:
+                stack.append(composed)
+    return (
+        np.array([c[0] for c in done]),
+        np.array([c[1] for c in done]),
+        np.array([c[2] for c in done]),
+    )
+
+
+def split_footprint(centres: np.ndarray, variances: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Split boxes with given centres and variances along one axis by pixel borders.
+
+    Return index of the first pixel, centre and variance of the box relative
+    to it, and for boxes crossing the border into the next pixel also their
+    indices, fractions of mass in the first pixel and centre and variance of
+    the rest relative to the next pixel. The first pixel keeps only its part.
+    """
+    half_widths = np.minimum(np.sqrt(3.0 * variances), 0.5)
+    lows = centres - half_widths
+    first = np.floor(lows)
+    offsets = centres - first
+    spreads = half_widths * half_widths / 3.0
+
+    crossing = np.flatnonzero(offsets + half_widths > 1.0)
+    low = lows[crossing] - first[crossing]
+    lengths = 1.0 - low
+    rests = 2.0 * half_widths[crossing] - lengths
+    offsets[crossing] = 0.5 * (low + 1.0)
+    spreads[crossing] = lengths * lengths / 12.0
+    fractions = lengths / (2.0 * half_widths[crossing])
+    return first, offsets, spreads, crossing, fractions, 0.5 * rests, rests * rests / 12.0
+
+
+def moment_columns(
+    masses: np.ndarray,
+    offsets_x: np.ndarray,
+    offsets_y: np.ndarray,
+    variances_x: np.ndarray,
+    variances_y: np.ndarray,
+    correlations: np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    """Return mass and its first and second moments relative to pixel corners."""
+    moment_x = masses * offsets_x
+    moment_y = masses * offsets_y
+    return (
+        masses,
+        moment_x,
+        moment_y,
+        masses * variances_x + moment_x * offsets_x,
+        masses * variances_y + moment_y * offsets_y,
+        masses * correlations * np.sqrt(variances_x * variances_y) + moment_x * offsets_y,
+    )
+
+
+def transform_raster(
+    raster: Raster,
+    transformations: Transformations,
+    width: int,
+    height: int,
+    source_width: int | None = None,
+) -> Raster:
+    """Apply all transformations to the measure, return new raster with given size.
+
+    Source raster has the same size unless its width is given. Mass leaving
+    the raster is dropped and the rest is normalized again.
+    """
+    indices, masses, properties = raster
+    matrices, shifts, probabilities = transformations
+    corners_y, corners_x = np.divmod(indices, source_width or width)
+    x = corners_x + properties[0]
+    y = corners_y + properties[1]
+    # raster with border of two pixels, everything outside lands in the border
+    padded_width = width + 4
+    size = padded_width * (height + 4)
+
+    count = len(masses)
+    whole: list[np.ndarray] = [np.empty(count * len(probabilities), dtype=np.int64)]
+    whole += [np.empty(count * len(probabilities)) for _ in range(6)]
+    spilled: list[list[np.ndarray]] = [[] for _ in range(7)]
+
+    for k in range(len(probabilities)):
+        (a, b), (c, d) = matrices[k]
+        for start in range(0, count, CHUNK_SIZE):
+            chunk = slice(start, start + CHUNK_SIZE)
+            vxx, vyy, vxy = properties[2:, chunk]
+            mass = masses[chunk] * probabilities[k]
+            new_vxx = np.maximum(a * a * vxx + 2.0 * a * b * vxy + b * b * vyy, 0.0)
+            new_vyy = np.maximum(c * c * vxx + 2.0 * c * d * vxy + d * d * vyy, 0.0)
+            new_vxy = a * c * vxx + (a * d + b * c) * vxy + b * d * vyy
+            product = new_vxx * new_vyy
+            correlations = np.divide(
+                new_vxy, np.sqrt(product), out=np.zeros_like(product), where=product > 0.0
+            )
+            np.clip(correlations, -1.0, 1.0, out=correlations)
+
+            px, ux, wx, cross_x, fx, ux1, wx1 = split_footprint(
+                a * x[chunk] + b * y[chunk] + shifts[k, 0], new_vxx
+            )
+            py, uy, wy, cross_y, fy, uy1, wy1 = split_footprint(
+                c * x[chunk] + d * y[chunk] + shifts[k, 1], new_vyy
+            )
+            np.clip(px, -2, width, out=px)
+            np.clip(py, -2, height, out=py)
+            pixels = ((py + 2) * padded_width + px + 2).astype(np.int64)
+            fractions_x = np.ones_like(mass)
+            fractions_x[cross_x] = fx
+            fractions_y = np.ones_like(mass)
+            fractions_y[cross_y] = fy
+
+            # část v prvním pixelu každé stopy
+            target = slice(k * count + start, k * count + start + len(mass))
+            whole[0][target] = pixels
+            columns = moment_columns(mass * fractions_x * fractions_y, ux, uy, wx, wy, correlations)
+            for column, values in zip(whole[1:], columns):
+                column[target] = values
+
+            # části přesahující do sousedních pixelů
+            pieces = []
+            if len(cross_x):
+                s = cross_x
+                rest = mass[s] * (1.0 - fx) * fractions_y[s]
+                pieces.append((pixels[s] + 1, rest, ux1, uy[s], wx1, wy[s], correlations[s]))
+            if len(cross_y):
+                s = cross_y
+                rest = mass[s] * fractions_x[s] * (1.0 - fy)
+                pieces.append(
+                    (pixels[s] + padded_width, rest, ux[s], uy1, wx[s], wy1, correlations[s])
+                )
+            if len(cross_x) and len(cross_y):
+                s, jx, jy = np.intersect1d(
+                    cross_x, cross_y, assume_unique=True, return_indices=True
+                )
+                rest = mass[s] * (1.0 - fx[jx]) * (1.0 - fy[jy])
+                pieces.append(
+                    (
+                        pixels[s] + padded_width + 1,
+                        rest,
+                        ux1[jx],
+                        uy1[jy],
+                        wx1[jx],
+                        wy1[jy],
+                        correlations[s],
+                    )
+                )
+            for piece_pixels, *piece in pieces:
+                spilled[0].append(piece_pixels)
+                for column_list, values in zip(spilled[1:], moment_columns(*piece)):
+                    column_list.append(values)
+
+    spilled_pixels = np.concatenate(spilled[0]) if spilled[0] else None
+    sums = []
+    for column, column_list in zip(whole[1:], spilled[1:]):
+        total = np.bincount(whole[0], column, size)
+        if spilled_pixels is not None:
+            total += np.bincount(spilled_pixels, np.concatenate(column_list), size)
+        sums.append(total.reshape(height + 4, padded_width)[2:-2, 2:-2].ravel())
+
+    mass_sums, sum_x, sum_y, sum_xx, sum_yy, sum_xy = sums
+    indices = np.flatnonzero(mass_sums)
+    masses = mass_sums[indices]
+    offsets_x = sum_x[indices] / masses
+    offsets_y = sum_y[indices] / masses
+    properties = np.array(
+        [
+            offsets_x,
+            offsets_y,
+            sum_xx[indices] / masses - offsets_x * offsets_x,
+            sum_yy[indices] / masses - offsets_y * offsets_y,
+            sum_xy[indices] / masses - offsets_x * offsets_y,
+        ]
+    )
+    return indices, masses / masses.sum(), properties
+
+
+def uniform_raster(width: int, height: int) -> Raster:
+    """Return raster with mass spread uniformly over all its pixels."""
+    count = width * height
+    properties = np.array([0.5, 0.5, 1.0 / 12.0, 1.0 / 12.0, 0.0])
+    return (
+        np.arange(count),
+        np.full(count, 1.0 / count),
+        np.repeat(properties[:, np.newaxis], count, axis=1),
+    )
+
+
+def raster_density(raster: Raster, width: int, height: int) -> np.ndarray:
+    """Return masses of all pixels of the raster."""
+    density = np.zeros(width * height, dtype=np.float64)
+    density[raster[0]] = raster[1]
+    return density.reshape(height, width)
+
+
+def raster_sizes(width: int, height: int) -> list[tuple[int, int]]:
+    """Return sizes of rasters from the coarsest one up to the given size."""
+    sizes = [(width, height)]
+    while min(sizes[-1]) >= 2 * MIN_SIZE:
+        sizes.append((sizes[-1][0] // 2, sizes[-1][1] // 2))
+    return sizes[::-1]
+
+
+def measure_transform(
+    ifs: IFS,
+    width: int,
+    height: int,
+    bounds: Bounds,
+    tolerance: float = TOLERANCE,
+    max_passes: int = MAX_PASSES,
+) -> tuple[np.ndarray, int]:
+    """Compute invariant measure of IFS as density raster.
+
+    The measure is transformed until L1 distance of densities after two
+    successive passes is below tolerance, first in a coarse raster, then
+    in finer ones up to the given size. Bounds (xmin, ymin, xmax, ymax)
+    of the plane are mapped onto the whole raster. Return density and
+    the total number of passes.
+    """
+    sizes = raster_sizes(width, height)
+    old_width, old_height = sizes[0]
+    raster = uniform_raster(old_width, old_height)
+    passes = 0
+    for level_width, level_height in sizes:
+        matrices, offsets, probabilities = compose_transformations(
+            pixel_transformations(ifs, level_width, level_height, bounds)
+        )
+        # první průchod čte míru z předchozího hrubšího rastru
+        scale = np.diag([level_width / old_width, level_height / old_height])
+        raster = transform_raster(
+            raster, (matrices @ scale, offsets, probabilities), level_width, level_height, old_width
+        )
+        density = raster_density(raster, level_width, level_height)
+        passes += 1
+        for _ in range(max_passes - 1):
+            raster = transform_raster(
+                raster, (matrices, offsets, probabilities), level_width, level_height
+            )
+            new_density = raster_density(raster, level_width, level_height)
+            change = np.abs(new_density - density).sum()
+            density = new_density
+            passes += 1
+            if change < tolerance:
+                break
+        old_width, old_height = level_width, level_height
+    return density, passes
+
+
+def render_ifs(
+    image: Image.Image,
+    palette: tuple[tuple[int, int, int], ...],
+    ifs: IFS,
+    bounds: Bounds,
+    tolerance: float = TOLERANCE,
+) -> int:
+    """Render invariant measure of IFS into given image, return the number of passes.
+
+    Density is converted to expected number of hits of chaos game, pixels
+    with less than one hit stay black, so the image looks like the one
+    computed by chaos game, but without noise.
+    """
+    width, height = image.size
+    density, passes = measure_transform(ifs, width, height, bounds, tolerance)
+    histogram = np.floor(density * (POINTS_PER_PIXEL * width * height))
+    apply_palette(image, tone_map(histogram), palette)
+    return passes
+
+
+def main() -> None:
+    """Function called after the script initialization."""
+    import palette_blues
+
+    image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
+
+    for name, transformations in IFS_SYSTEMS.items():
+        print(name)
+        # obdélník opsaný IFS se stejným poměrem stran jako obrázek
+        bounds = fit_bounds(system_bounds(name), IMAGE_WIDTH, IMAGE_HEIGHT)
+        t1 = time()
+        passes = render_ifs(image, palette_blues.palette, transformations, bounds)
+        t2 = time()
+        difftime = t2 - t1
+        print(f"{passes} passes finished in {difftime:4.1f} seconds")
+
+        # uložení obrázku do souboru
+        image.save(name + "_measure.png")
+
+
+if __name__ == "__main__":
+    # call the main function
+    main()
@@ -0,0 +1,263 @@
+"""Color palette taken from Fractint."""
+
+# taken from Fractint
+# see https://www.fractint.org/
+# Author: Daniel Egnor
+palette = (
+    (000, 000, 0),
+    (000, 000, 0),
+    (000, 000, 4),
+    (000, 000, 12),
+    (000, 000, 16),
+    (000, 000, 24),
+    (000, 000, 32),
+    (000, 000, 36),
+    (000, 000, 44),
+    (000, 000, 48),
+    (000, 000, 56),
+    (000, 000, 64),
+    (000, 000, 68),
+    (000, 000, 76),
+    (000, 000, 80),
+    (000, 000, 88),
+    (000, 000, 96),
+    (000, 000, 100),
+    (000, 000, 108),
+    (000, 000, 116),
+    (000, 000, 120),
+    (000, 000, 128),
+    (000, 000, 132),
+    (000, 000, 140),
+    (000, 000, 148),
+    (000, 000, 152),
+    (000, 000, 160),
+    (000, 000, 164),
+    (000, 000, 172),
+    (000, 000, 180),
+    (000, 000, 184),
+    (000, 000, 192),
+    (000, 000, 200),
+    (000, 4, 200),
+    (000, 12, 200),
+    (000, 16, 204),
+    (000, 24, 204),
+    (000, 28, 208),
+    (000, 36, 208),
+    (000, 40, 208),
+    (000, 48, 212),
+    (000, 56, 212),
+    (000, 60, 216),
+    (000, 68, 216),
+    (000, 72, 216),
+    (000, 80, 220),
+    (000, 84, 220),
+    (000, 92, 224),
+    (000, 100, 224),
+    (000, 104, 224),
+    (000, 112, 228),
+    (000, 116, 228),
+    (000, 124, 232),
+    (000, 128, 232),
+    (000, 136, 232),
+    (000, 140, 236),
+    (000, 148, 236),
+    (000, 156, 240),
+    (000, 160, 240),
+    (000, 168, 240),
+    (000, 172, 244),
+    (000, 180, 244),
+    (000, 184, 248),
+    (000, 192, 248),
+    (000, 200, 252),
+    (4, 200, 252),
+    (12, 200, 252),
+    (20, 204, 252),
+    (28, 204, 252),
+    (36, 208, 252),
+    (44, 208, 252),
+    (52, 208, 252),
+    (60, 212, 252),
+    (68, 212, 252),
+    (76, 216, 252),
+    (84, 216, 252),
+    (92, 216, 252),
+    (100, 220, 252),
+    (108, 220, 252),
+    (116, 224, 252),
+    (124, 224, 252),
+    (132, 224, 252),
+    (140, 228, 252),
+    (148, 228, 252),
+    (156, 232, 252),
+    (164, 232, 252),
+    (172, 232, 252),
+    (180, 236, 252),
+    (188, 236, 252),
+    (196, 240, 252),
+    (204, 240, 252),
+    (212, 240, 252),
+    (220, 244, 252),
+    (228, 244, 252),
+    (236, 248, 252),
+    (244, 248, 252),
+    (252, 252, 252),
+    (248, 252, 252),
+    (244, 252, 252),
+    (240, 252, 252),
+    (232, 252, 252),
+    (228, 252, 252),
+    (224, 252, 252),
+    (216, 252, 252),
+    (212, 252, 252),
+    (208, 252, 252),
+    (200, 252, 252),
+    (196, 252, 252),
+    (192, 252, 252),
+    (184, 252, 252),
+    (180, 252, 252),
+    (176, 252, 252),
+    (168, 252, 252),
+    (164, 252, 252),
+    (160, 252, 252),
+    (156, 252, 252),
+    (148, 252, 252),
+    (144, 252, 252),
+    (140, 252, 252),
+    (132, 252, 252),
+    (128, 252, 252),
+    (124, 252, 252),
+    (116, 252, 252),
+    (112, 252, 252),
+    (108, 252, 252),
+    (100, 252, 252),
+    (96, 252, 252),
+    (92, 252, 252),
+    (84, 252, 252),
+    (80, 252, 252),
+    (76, 252, 252),
+    (72, 252, 252),
+    (64, 252, 252),
+    (60, 252, 252),
+    (56, 252, 252),
+    (48, 252, 252),
+    (44, 252, 252),
+    (40, 252, 252),
+    (32, 252, 252),
+    (28, 252, 252),
+    (24, 252, 252),
+    (16, 252, 252),
+    (12, 252, 252),
+    (8, 252, 252),
+    (000, 252, 252),
+    (000, 248, 252),
+    (000, 244, 252),
+    (000, 240, 252),
+    (000, 232, 252),
+    (000, 228, 252),
+    (000, 224, 252),
+    (000, 216, 252),
+    (000, 212, 252),
+    (000, 208, 252),
+    (000, 200, 252),
+    (000, 196, 252),
+    (000, 192, 252),
+    (000, 184, 252),
+    (000, 180, 252),
+    (000, 176, 252),
+    (000, 168, 252),
+    (000, 164, 252),
+    (000, 160, 252),
+    (000, 156, 252),
+    (000, 148, 252),
+    (000, 144, 252),
+    (000, 140, 252),
+    (000, 132, 252),
+    (000, 128, 252),
+    (000, 124, 252),
+    (000, 116, 252),
+    (000, 112, 252),
+    (000, 108, 252),
+    (000, 100, 252),
+    (000, 96, 252),
+    (000, 92, 252),
+    (000, 84, 252),
+    (000, 80, 252),
+    (000, 76, 252),
+    (000, 72, 252),
+    (000, 64, 252),
+    (000, 60, 252),
+    (000, 56, 252),
+    (000, 48, 252),
+    (000, 44, 252),
+    (000, 40, 252),
+    (000, 32, 252),
+    (000, 28, 252),
+    (000, 24, 252),
+    (000, 16, 252),
+    (000, 12, 252),
+    (000, 8, 252),
+    (000, 000, 252),
+    (000, 000, 248),
+    (000, 000, 244),
+    (000, 000, 240),
+    (000, 000, 236),
+    (000, 000, 232),
+    (000, 000, 228),
+    (000, 000, 224),
+    (000, 000, 220),
+    (000, 000, 216),
+    (000, 000, 212),
+    (000, 000, 208),
+    (000, 000, 204),
+    (000, 000, 200),
+    (000, 000, 196),
+    (000, 000, 192),
+    (000, 000, 188),
+    (000, 000, 184),
+    (000, 000, 180),
+    (000, 000, 176),
+    (000, 000, 172),
+    (000, 000, 168),
+    (000, 000, 164),
+    (000, 000, 160),
+    (000, 000, 156),
+    (000, 000, 152),
+    (000, 000, 148),
+    (000, 000, 144),
+    (000, 000, 140),
+    (000, 000, 136),
+    (000, 000, 132),
+    (000, 000, 128),
+    (000, 000, 124),
+    (000, 000, 120),
+    (000, 000, 116),
+    (000, 000, 112),
+    (000, 000, 108),
+    (000, 000, 104),
+    (000, 000, 100),
+    (000, 000, 96),
+    (000, 000, 92),
+    (000, 000, 88),
+    (000, 000, 84),
+    (000, 000, 80),
+    (000, 000, 76),
+    (000, 000, 72),
+    (000, 000, 68),
+    (000, 000, 64),
+    (000, 000, 60),
+    (000, 000, 56),
+    (000, 000, 52),
+    (000, 000, 48),
+    (000, 000, 44),
+    (000, 000, 40),
+    (000, 000, 36),
+    (000, 000, 32),
+    (000, 000, 28),
+    (000, 000, 24),
+    (000, 000, 20),
+    (000, 000, 16),
+    (000, 000, 12),
+    (000, 000, 8),
+    (000, 000, 0),
+    (000, 000, 0),
+)
@@ -0,0 +1,262 @@
+"""Color palette taken from Fractint."""
+
+# taken from Fractint
+# see https://www.fractint.org/
+palette = (
+    (255, 255, 128),
+    (252, 252, 128),
+    (252, 252, 128),
+    (252, 248, 124),
+    (252, 248, 124),
+    (252, 244, 120),
+    (248, 244, 120),
+    (248, 240, 116),
+    (248, 240, 112),
+    (248, 236, 112),
+    (244, 236, 108),
+    (244, 232, 108),
+    (244, 232, 104),
+    (244, 228, 104),
+    (240, 228, 100),
+    (240, 224, 96),
+    (240, 224, 96),
+    (240, 220, 92),
+    (236, 220, 92),
+    (236, 216, 88),
+    (236, 216, 84),
+    (236, 212, 84),
+    (236, 212, 80),
+    (232, 208, 80),
+    (232, 208, 76),
+    (232, 204, 76),
+    (232, 204, 72),
+    (228, 200, 68),
+    (228, 200, 68),
+    (228, 196, 64),
+    (228, 196, 64),
+    (224, 192, 60),
+    (224, 192, 56),
+    (224, 188, 56),
+    (224, 188, 52),
+    (220, 184, 52),
+    (220, 184, 48),
+    (220, 180, 48),
+    (220, 180, 44),
+    (220, 176, 40),
+    (216, 176, 40),
+    (216, 172, 36),
+    (216, 172, 36),
+    (216, 168, 32),
+    (212, 168, 28),
+    (212, 164, 28),
+    (212, 164, 24),
+    (212, 160, 24),
+    (208, 160, 20),
+    (208, 156, 20),
+    (208, 156, 16),
+    (208, 152, 12),
+    (204, 152, 12),
+    (204, 148, 8),
+    (204, 148, 8),
+    (204, 144, 4),
+    (200, 140, 0),
+    (196, 136, 0),
+    (196, 136, 0),
+    (196, 136, 0),
+    (196, 136, 0),
+    (192, 132, 0),
+    (192, 132, 0),
+    (192, 132, 0),
+    (192, 132, 0),
+    (188, 128, 0),
+    (188, 128, 0),
+    (188, 128, 0),
+    (188, 128, 0),
+    (184, 124, 0),
+    (184, 124, 0),
+    (184, 124, 0),
+    (184, 124, 0),
+    (180, 120, 0),
+    (180, 120, 0),
+    (180, 120, 0),
+    (180, 120, 0),
+    (176, 116, 0),
+    (176, 116, 0),
+    (176, 116, 0),
+    (176, 116, 0),
+    (172, 112, 0),
+    (172, 112, 0),
+    (172, 112, 0),
+    (172, 112, 0),
+    (168, 108, 0),
+    (168, 108, 0),
+    (168, 108, 0),
+    (168, 108, 0),
+    (164, 104, 0),
+    (164, 104, 0),
+    (164, 104, 0),
+    (164, 104, 0),
+    (160, 100, 0),
+    (160, 100, 0),
+    (160, 100, 0),
+    (160, 100, 0),
+    (156, 96, 0),
+    (156, 96, 0),
+    (156, 96, 0),
+    (156, 96, 0),
+    (152, 92, 0),
+    (152, 92, 0),
+    (152, 92, 0),
+    (152, 92, 0),
+    (148, 88, 0),
+    (148, 88, 0),
+    (148, 88, 0),
+    (148, 88, 0),
+    (144, 84, 0),
+    (144, 84, 0),
+    (144, 84, 0),
+    (144, 84, 0),
+    (140, 80, 0),
+    (140, 80, 0),
+    (140, 80, 0),
+    (140, 80, 0),
+    (136, 76, 0),
+    (136, 76, 0),
+    (136, 76, 0),
+    (136, 76, 0),
+    (132, 72, 0),
+    (132, 72, 0),
+    (132, 72, 0),
+    (132, 72, 0),
+    (128, 68, 0),
+    (128, 68, 0),
+    (128, 68, 0),
+    (128, 68, 0),
+    (124, 64, 0),
+    (124, 64, 0),
+    (124, 64, 0),
+    (124, 64, 0),
+    (120, 60, 0),
+    (120, 60, 0),
+    (120, 60, 0),
+    (120, 60, 0),
+    (116, 56, 0),
+    (116, 56, 0),
+    (116, 56, 0),
+    (116, 56, 0),
+    (112, 52, 0),
+    (112, 52, 0),
+    (112, 52, 0),
+    (112, 52, 0),
+    (108, 48, 0),
+    (108, 48, 0),
+    (108, 48, 0),
+    (108, 48, 0),
+    (104, 44, 0),
+    (104, 44, 0),
+    (104, 44, 0),
+    (104, 44, 0),
+    (100, 40, 0),
+    (100, 40, 0),
+    (100, 40, 0),
+    (100, 40, 0),
+    (96, 36, 0),
+    (96, 36, 0),
+    (96, 36, 0),
+    (96, 36, 0),
+    (92, 32, 0),
+    (92, 32, 0),
+    (92, 32, 0),
+    (92, 32, 0),
+    (88, 28, 0),
+    (88, 28, 0),
+    (88, 28, 0),
+    (88, 28, 0),
+    (84, 24, 0),
+    (84, 24, 0),
+    (84, 24, 0),
+    (84, 24, 0),
+    (80, 20, 0),
+    (80, 20, 0),
+    (80, 20, 0),
+    (80, 20, 0),
+    (76, 16, 0),
+    (76, 16, 0),
+    (76, 16, 0),
+    (76, 16, 0),
+    (72, 12, 0),
+    (72, 12, 0),
+    (72, 12, 0),
+    (72, 12, 0),
+    (68, 8, 0),
+    (68, 8, 0),
+    (68, 8, 0),
+    (68, 8, 0),
+    (64, 4, 0),
+    (64, 4, 0),
+    (64, 4, 0),
+    (64, 4, 0),
+    (60, 000, 0),
+    (60, 000, 0),
+    (60, 000, 0),
+    (60, 000, 0),
+    (56, 000, 0),
+    (56, 000, 0),
+    (56, 000, 0),
+    (56, 000, 0),
+    (52, 000, 0),
+    (52, 000, 0),
+    (52, 000, 0),
+    (52, 000, 0),
+    (48, 000, 0),
+    (48, 000, 0),
+    (48, 000, 0),
+    (48, 000, 0),
+    (44, 000, 0),
+    (44, 000, 0),
+    (44, 000, 0),
+    (44, 000, 0),
+    (40, 000, 0),
+    (40, 000, 0),
+    (40, 000, 0),
+    (40, 000, 0),
+    (36, 000, 0),
+    (36, 000, 0),
+    (36, 000, 0),
+    (36, 000, 0),
+    (32, 000, 0),
+    (32, 000, 0),
+    (32, 000, 0),
+    (32, 000, 0),
+    (28, 000, 0),
+    (28, 000, 0),
+    (28, 000, 0),
+    (28, 000, 0),
+    (24, 000, 0),
+    (24, 000, 0),
+    (24, 000, 0),
+    (24, 000, 0),
+    (20, 000, 0),
+    (20, 000, 0),
+    (20, 000, 0),
+    (20, 000, 0),
+    (16, 000, 0),
+    (16, 000, 0),
+    (16, 000, 0),
+    (16, 000, 0),
+    (12, 000, 0),
+    (12, 000, 0),
+    (12, 000, 0),
+    (12, 000, 0),
+    (8, 000, 0),
+    (8, 000, 0),
+    (8, 000, 0),
+    (8, 000, 0),
+    (4, 000, 0),
+    (4, 000, 0),
+    (4, 000, 0),
+    (4, 000, 0),
+    (000, 000, 0),
+    (000, 000, 0),
+    (000, 000, 0),
+)
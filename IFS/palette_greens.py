@@ -0,0 +1,262 @@
+"""Color palette taken from Fractint."""
+
+# taken from Fractint
+# see https://www.fractint.org/
+palette = (
+    (000, 000, 0),
+    (000, 000, 0),
+    (000, 4, 0),
+    (000, 12, 0),
+    (000, 16, 0),
+    (000, 24, 0),
+    (000, 32, 0),
+    (000, 36, 0),
+    (000, 44, 0),
+    (000, 48, 0),
+    (000, 56, 0),
+    (000, 64, 0),
+    (000, 68, 0),
+    (000, 76, 0),
+    (000, 80, 0),
+    (000, 88, 0),
+    (000, 96, 0),
+    (000, 100, 0),
+    (000, 108, 0),
+    (000, 116, 0),
+    (000, 120, 0),
+    (000, 128, 0),
+    (000, 132, 0),
+    (000, 140, 0),
+    (000, 148, 0),
+    (000, 152, 0),
+    (000, 160, 0),
+    (000, 164, 0),
+    (000, 172, 0),
+    (000, 180, 0),
+    (000, 184, 0),
+    (000, 192, 0),
+    (000, 200, 0),
+    (4, 200, 0),
+    (12, 200, 0),
+    (16, 204, 0),
+    (24, 204, 0),
+    (28, 208, 0),
+    (36, 208, 0),
+    (40, 208, 0),
+    (48, 212, 0),
+    (56, 212, 0),
+    (60, 216, 0),
+    (68, 216, 0),
+    (72, 216, 0),
+    (80, 220, 0),
+    (84, 220, 0),
+    (92, 224, 0),
+    (100, 224, 0),
+    (104, 224, 0),
+    (112, 228, 0),
+    (116, 228, 0),
+    (124, 232, 0),
+    (128, 232, 0),
+    (136, 232, 0),
+    (140, 236, 0),
+    (148, 236, 0),
+    (156, 240, 0),
+    (160, 240, 0),
+    (168, 240, 0),
+    (172, 244, 0),
+    (180, 244, 0),
+    (184, 248, 0),
+    (192, 248, 0),
+    (200, 252, 0),
+    (200, 252, 4),
+    (200, 252, 12),
+    (204, 252, 20),
+    (204, 252, 28),
+    (208, 252, 36),
+    (208, 252, 44),
+    (208, 252, 52),
+    (212, 252, 60),
+    (212, 252, 68),
+    (216, 252, 76),
+    (216, 252, 84),
+    (216, 252, 92),
+    (220, 252, 100),
+    (220, 252, 108),
+    (224, 252, 116),
+    (224, 252, 124),
+    (224, 252, 132),
+    (228, 252, 140),
+    (228, 252, 148),
+    (232, 252, 156),
+    (232, 252, 164),
+    (232, 252, 172),
+    (236, 252, 180),
+    (236, 252, 188),
+    (240, 252, 196),
+    (240, 252, 204),
+    (240, 252, 212),
+    (244, 252, 220),
+    (244, 252, 228),
+    (248, 252, 236),
+    (248, 252, 244),
+    (252, 252, 252),
+    (252, 252, 248),
+    (252, 252, 244),
+    (252, 252, 240),
+    (252, 252, 232),
+    (252, 252, 228),
+    (252, 252, 224),
+    (252, 252, 216),
+    (252, 252, 212),
+    (252, 252, 208),
+    (252, 252, 200),
+    (252, 252, 196),
+    (252, 252, 192),
+    (252, 252, 184),
+    (252, 252, 180),
+    (252, 252, 176),
+    (252, 252, 168),
+    (252, 252, 164),
+    (252, 252, 160),
+    (252, 252, 156),
+    (252, 252, 148),
+    (252, 252, 144),
+    (252, 252, 140),
+    (252, 252, 132),
+    (252, 252, 128),
+    (252, 252, 124),
+    (252, 252, 116),
+    (252, 252, 112),
+    (252, 252, 108),
+    (252, 252, 100),
+    (252, 252, 96),
+    (252, 252, 92),
+    (252, 252, 84),
+    (252, 252, 80),
+    (252, 252, 76),
+    (252, 252, 72),
+    (252, 252, 64),
+    (252, 252, 60),
+    (252, 252, 56),
+    (252, 252, 48),
+    (252, 252, 44),
+    (252, 252, 40),
+    (252, 252, 32),
+    (252, 252, 28),
+    (252, 252, 24),
+    (252, 252, 16),
+    (252, 252, 12),
+    (252, 252, 8),
+    (252, 252, 0),
+    (248, 252, 0),
+    (244, 252, 0),
+    (240, 252, 0),
+    (232, 252, 0),
+    (228, 252, 0),
+    (224, 252, 0),
+    (216, 252, 0),
+    (212, 252, 0),
+    (208, 252, 0),
+    (200, 252, 0),
+    (196, 252, 0),
+    (192, 252, 0),
+    (184, 252, 0),
+    (180, 252, 0),
+    (176, 252, 0),
+    (168, 252, 0),
+    (164, 252, 0),
+    (160, 252, 0),
+    (156, 252, 0),
+    (148, 252, 0),
+    (144, 252, 0),
+    (140, 252, 0),
+    (132, 252, 0),
+    (128, 252, 0),
+    (124, 252, 0),
+    (116, 252, 0),
+    (112, 252, 0),
+    (108, 252, 0),
+    (100, 252, 0),
+    (96, 252, 0),
+    (92, 252, 0),
+    (84, 252, 0),
+    (80, 252, 0),
+    (76, 252, 0),
+    (72, 252, 0),
+    (64, 252, 0),
+    (60, 252, 0),
+    (56, 252, 0),
+    (48, 252, 0),
+    (44, 252, 0),
+    (40, 252, 0),
+    (32, 252, 0),
+    (28, 252, 0),
+    (24, 252, 0),
+    (16, 252, 0),
+    (12, 252, 0),
+    (8, 252, 0),
+    (000, 252, 0),
+    (000, 248, 0),
+    (000, 244, 0),
+    (000, 240, 0),
+    (000, 236, 0),
+    (000, 232, 0),
+    (000, 228, 0),
+    (000, 224, 0),
+    (000, 220, 0),
+    (000, 216, 0),
+    (000, 212, 0),
+    (000, 208, 0),
+    (000, 204, 0),
+    (000, 200, 0),
+    (000, 196, 0),
+    (000, 192, 0),
+    (000, 188, 0),
+    (000, 184, 0),
+    (000, 180, 0),
+    (000, 176, 0),
+    (000, 172, 0),
+    (000, 168, 0),
+    (000, 164, 0),
+    (000, 160, 0),
+    (000, 156, 0),
+    (000, 152, 0),
+    (000, 148, 0),
+    (000, 144, 0),
+    (000, 140, 0),
+    (000, 136, 0),
+    (000, 132, 0),
+    (000, 128, 0),
+    (000, 124, 0),
+    (000, 120, 0),
+    (000, 116, 0),
+    (000, 112, 0),
+    (000, 108, 0),
+    (000, 104, 0),
+    (000, 100, 0),
+    (000, 96, 0),
+    (000, 92, 0),
+    (000, 88, 0),
+    (000, 84, 0),
+    (000, 80, 0),
+    (000, 76, 0),
+    (000, 72, 0),
+    (000, 68, 0),
+    (000, 64, 0),
+    (000, 60, 0),
+    (000, 56, 0),
+    (000, 52, 0),
+    (000, 48, 0),
+    (000, 44, 0),
+    (000, 40, 0),
+    (000, 36, 0),
+    (000, 32, 0),
+    (000, 28, 0),
+    (000, 24, 0),
+    (000, 20, 0),
+    (000, 16, 0),
+    (000, 12, 0),
+    (000, 8, 0),
+    (000, 000, 0),
+    (000, 000, 0),
+)
@@ -0,0 +1,182 @@
+"""Content-addressed on-disk cache for computed buffers and rendered images."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import hashlib
+import inspect
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+# cache directory can be changed by this environment variable
+CACHE_DIRECTORY_VARIABLE = "FRACTALS_CACHE"
+
+# default cache directory
+DEFAULT_DIRECTORY = Path.home() / ".cache" / "fractals"
+
+# default maximum size of all files stored in cache (in bytes)
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+# code versions of source directories, computed just once per process
+_code_versions: dict[Path, str] = {}
+
+
+def code_version(function: Callable[..., Any]) -> str:
+    """Return hash of all Python sources stored in the directory with given function.
+
+    Renderers import helpers from the same directory, so any change there
+    changes the code version too.
+    """
+    directory = Path(str(inspect.getsourcefile(function))).resolve().parent
+    version = _code_versions.get(directory)
+    if version is None:
+        hasher = hashlib.sha256()
+        for path in sorted(directory.glob("*.py")):
+            hasher.update(path.name.encode())
+            hasher.update(path.read_bytes())
+        version = hasher.hexdigest()
+        _code_versions[directory] = version
+    return version
+
+
+def _update(hasher: Any, value: Any) -> None:
+    """Feed hasher by canonical representation of given value."""
+    if isinstance(value, np.ndarray):
+        hasher.update(f"ndarray{value.dtype}{value.shape}".encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (tuple, list)):
+        hasher.update(f"{type(value).__name__}{len(value)}(".encode())
+        for item in value:
+            _update(hasher, item)
+        hasher.update(b")")
+    elif isinstance(value, dict):
+        _update(hasher, sorted(value.items()))
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+class RenderCache:
+    """Content-addressed on-disk cache for computed buffers and rendered images.
+
+    Keys are hashes of the renderer identity, its parameters, and the code
+    version of the directory where the renderer is defined, so any change in
+    the code invalidates old entries. Buffers are stored as compressed .npz files,
+    images as PNG. When the total size of cached files exceeds the limit,
+    the least recently used files are deleted.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize the cache, the directory is created on first write."""
+        if directory is None:
+            directory = os.environ.get(CACHE_DIRECTORY_VARIABLE) or DEFAULT_DIRECTORY
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def key(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+        """Compute cache key for renderer called with given arguments."""
+        hasher = hashlib.sha256()
+        # module name is __main__ when the renderer is run as script, so file name is used
+        filename = Path(str(inspect.getsourcefile(function)))
+        _update(hasher, (filename.stem, function.__qualname__, code_version(function)))
+        _update(hasher, args)
+        _update(hasher, kwargs)
+        return hasher.hexdigest()
+
+    def path(self, key: str, suffix: str) -> Path:
+        """Return path to cached file for given key."""
+        return self.directory / key[:2] / (key + suffix)
+
+    def _hit(self, path: Path) -> bool:
+        """Check if file exists in cache and mark it as recently used."""
+        try:
+            os.utime(path)
+        except OSError:
+            return False
+        return True
+
+    def load_array(self, key: str) -> np.ndarray | None:
+        """Load buffer stored under given key, or None on cache miss."""
+        path = self.path(key, ".npz")
+        if not self._hit(path):
+            return None
+        try:
+            with np.load(path) as data:
+                return data["buffer"]
+        except (OSError, ValueError, KeyError):
+            # incomplete or damaged file
+            return None
+
+    def save_array(self, key: str, buffer: Any) -> None:
+        """Store buffer under given key."""
+        path = self.path(key, ".npz")
+        self._write(path, lambda fout: np.savez_compressed(fout, buffer=np.asarray(buffer)))
+
+    def load_image(self, key: str) -> Image.Image | None:
+        """Load image stored under given key, or None on cache miss."""
+        path = self.path(key, ".png")
+        if not self._hit(path):
+            return None
+        try:
+            with Image.open(path) as image:
+                image.load()
+                return image
+        except OSError:
+            return None
+
+    def save_image(self, key: str, image: Image.Image) -> None:
+        """Store image under given key."""
+        path = self.path(key, ".png")
+        self._write(path, lambda fout: image.save(fout, format="PNG"))
+
+    def call(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> np.ndarray:
+        """Return buffer computed by function, it is called only on cache miss."""
+        key = self.key(function, *args, **kwargs)
+        buffer = self.load_array(key)
+        if buffer is None:
+            buffer = np.asarray(function(*args, **kwargs))
+            self.save_array(key, buffer)
+        return buffer
+
+    def _write(self, path: Path, writer: Callable[[Any], None]) -> None:
+        """Write file atomically, so other processes never see incomplete file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temporary, "wb") as fout:
+            writer(fout)
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used files until the cache fits its size limit."""
+        files = []
+        total = 0
+        for path in self.directory.glob("*/*"):
+            # temporary files being written by other processes are never deleted
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
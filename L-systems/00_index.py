@@ -1,6 +1,15 @@
 # List of source files stored in this directory
 # ---------------------------------------------
 #
+# lsystem.py:
+# Streaming expansion of L-systems, control string is never stored as a whole.
+#
 # snowflake.py:
 # Snowflake L-system.
 #
+# snowflake2.py:
+# Snowflake L-system.
+#
+# turtle_geometry.py:
+# Turtle graphics for L-systems producing polylines stored in NumPy arrays.
+#
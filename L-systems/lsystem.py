@@ -0,0 +1,70 @@
+"""Streaming expansion of L-systems, control string is never stored as a whole."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from collections.abc import Iterator
+from itertools import chain
+
+# maximální délka úseku řídicího řetězce, který se vytváří najednou
+CHUNK_SIZE = 4096
+
+
+def produce_control_string(axiom: str, rewrite_rules: dict[str, str], n: int) -> str:
+    """Výpočet celého řídicího řetězce, vhodné jen pro malý počet iterací."""
+    table = str.maketrans(rewrite_rules)
+    s = axiom
+    for _ in range(n):
+        s = s.translate(table)
+    return s
+
+
+def expand(
+    axiom: str, rewrite_rules: dict[str, str], n: int, chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """Postupné generování řídicího řetězce po úsecích.
+
+    Posledních několik iterací se pro každý symbol předpočítá najednou
+    pomocí str.translate, dokud délka výsledku nepřekročí chunk_size.
+    Zbylé iterace se procházejí do hloubky s využitím explicitního
+    zásobníku, takže paměťová náročnost je úměrná počtu iterací,
+    nikoli délce řídicího řetězce.
+    """
+    table = str.maketrans(rewrite_rules)
+    symbols = set(axiom).union(*rewrite_rules.values(), rewrite_rules)
+
+    # expanze každého symbolu o posledních tail iterací
+    expansions = {symbol: symbol for symbol in symbols}
+    tail = 0
+    while tail < n:
+        longer = {symbol: s.translate(table) for symbol, s in expansions.items()}
+        if max(map(len, longer.values())) > chunk_size:
+            break
+        expansions = longer
+        tail += 1
+
+    # symboly v hloubce depth se přepisují, dokud nezbývá jen tail iterací
+    depth = n - tail
+    stack = [iter(axiom)]
+    while stack:
+        for symbol in stack[-1]:
+            if len(stack) <= depth and symbol in rewrite_rules:
+                stack.append(iter(rewrite_rules[symbol]))
+                break
+            yield expansions[symbol]
+        else:
+            stack.pop()
+
+
+def control_symbols(axiom: str, rewrite_rules: dict[str, str], n: int) -> Iterator[str]:
+    """Postupné generování jednotlivých symbolů řídicího řetězce."""
+    return chain.from_iterable(expand(axiom, rewrite_rules, n))
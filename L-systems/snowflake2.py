@@ -2,8 +2,8 @@
 
 """Snowflake L-system."""
 
-import math
 import sys
+from collections.abc import Iterable
 
 import pygame
 from pygame import draw
@@ -11,6 +11,9 @@ from pygame import draw
 # Nutno importovat kvůli konstantám QUIT atd.
 from pygame.locals import K_ESCAPE, KEYDOWN, QUIT
 
+from lsystem import expand
+from turtle_geometry import turtle_polylines
+
 # Velikost okna aplikace
 WIDTH = 512
 HEIGHT = 512
@@ -37,60 +40,21 @@ MAGENTA = (255, 0, 255)
 WHITE = (255, 255, 255)
 
 
-def apply_rule(rules: dict[str, str], c: str) -> str:
-    """Aplikace přepisovacího pravidla."""
-    output = ""
-    for rule, result in rules.items():
-        if c == rule:
-            return result
-        else:
-            output = c
-    return output
-
-
-def produce_control_string(axiom: str, rewrite_rules: dict[str, str], n: int) -> str:
-    """Výpočet řídicího řetězce."""
-    s = axiom
-    for i in range(n):
-        tmp = ""
-        for c in s:
-            tmp += apply_rule(rewrite_rules, c)
-        s = tmp
-    return s
-
-
 def draw_l_system(
     surface: pygame.Surface,
     color: tuple[int, int, int],
-    control_string: str,
+    control_string: Iterable[str],
     step: int,
     angle_delta: float,
     start_x: float,
     start_y: float,
 ) -> None:
     """Vykreslení L-systému na obrazovku s využitím želví grafiky."""
-    x = start_x
-    y = start_y
-    angle = 0.0
-
-    # projít všemi příkazy z řídicího řetězce
-    for command in control_string:
-        if command == "F":
-            xn = x + step * math.cos(angle)
-            yn = y + step * math.sin(angle)
-            draw.aaline(surface, color, (x, y), (xn, yn))
-            x = xn
-            y = yn
-        elif command == "B":
-            xn = x - step * math.cos(angle)
-            yn = y - step * math.sin(angle)
-            draw.aaline(surface, color, (x, y), (xn, yn))
-            x = xn
-            y = yn
-        elif command == "+":
-            angle -= angle_delta * math.pi / 180.0
-        elif command == "-":
-            angle += angle_delta * math.pi / 180.0
+    polylines = turtle_polylines(control_string, step, angle_delta, start_x, start_y)
+
+    # každá lomená čára se vykreslí jediným voláním
+    for polyline in polylines:
+        draw.aalines(surface, color, False, polyline.tolist())
 
 
 def draw_snowflake(surface: pygame.Surface, color: tuple[int, int, int]) -> None:
@@ -114,9 +78,8 @@ def draw_snowflake(surface: pygame.Surface, color: tuple[int, int, int]) -> None
     start_x = 50
     start_y = HEIGHT - 370
 
-    # výpočet řídicího řetězce
-    control_string = produce_control_string(axiom, rewrite_rules, iterations)
-    print(control_string)
+    # řídicí řetězec se generuje postupně po úsecích během vykreslování
+    control_string = expand(axiom, rewrite_rules, iterations)
 
     # vykreslení L-systému
     draw_l_system(surface, color, control_string, step, angle, start_x, start_y)
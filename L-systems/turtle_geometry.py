@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+
+"""Turtle graphics for L-systems producing polylines stored in NumPy arrays."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+# Supported commands:
+#
+# F  move forward and draw line
+# B  move backward and draw line
+# +  turn by angle_delta (the angle is decremented)
+# -  turn by angle_delta (the angle is incremented)
+# [  push turtle state to stack
+# ]  pop turtle state from stack, new polyline is started there
+#
+# All other symbols are ignored.
+
+from collections.abc import Iterable
+from fractions import Fraction
+from time import time
+from typing import Any
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from lsystem import expand
+
+# maximální počet různých směrů želvy
+MAX_DIRECTIONS = 1 << 16
+
+# počáteční kapacita bufferu s vrcholy
+INITIAL_CAPACITY = 1024
+
+
+def direction_table(step: float, angle_delta: float) -> tuple[np.ndarray, np.ndarray] | None:
+    """Tabulky posunů želvy pro všechny směry, do kterých se může natočit.
+
+    Směr želvy je uložen jako index do těchto tabulek, takže se funkce
+    sin a cos počítají jen jednou pro každý směr. Pokud úhel není přesně
+    racionálním zlomkem plného otočení, nebo by směrů bylo příliš mnoho,
+    vrátí se None a posuny se musí počítat přímo.
+    """
+    directions = (Fraction(360) / Fraction(angle_delta)).numerator
+    if directions > MAX_DIRECTIONS:
+        return None
+    angles = np.arange(directions) * np.radians(angle_delta)
+    return step * np.cos(angles), step * np.sin(angles)
+
+
+class DirectOffsets:
+    """Posuny želvy pro libovolný počet otočení počítané přímo funkcí sin nebo cos.
+
+    Používají se místo tabulek, pokud se směry želvy neopakují. Indexem je
+    počet otočení (skalár nebo pole), stejně jako u tabulek.
+    """
+
+    def __init__(self, step: float, angle_delta: float, function: np.ufunc):
+        """Inicializace pro zadanou délku kroku, úhel otočení a funkci sin nebo cos."""
+        self.step = step
+        self.angle = np.radians(angle_delta)
+        self.function = function
+
+    def __getitem__(self, headings: Any) -> Any:
+        """Vrátit posuny pro zadaný počet otočení."""
+        return self.step * self.function(headings * self.angle)
+
+
+class Turtle:
+    """Želva zapisující vrcholy lomených čar do předalokovaného bufferu.
+
+    Úseky řídicího řetězce bez větvení se zpracují vektorově, úseky
+    s příkazy [ a ] se procházejí po jednotlivých symbolech.
+    """
+
+    def __init__(self, step: float, angle_delta: float, start_x: float, start_y: float):
+        """Inicializace želvy v zadané pozici, natočené ve směru osy x."""
+        table = direction_table(step, angle_delta)
+        self.dx: np.ndarray | DirectOffsets
+        self.dy: np.ndarray | DirectOffsets
+        if table is not None:
+            self.dx, self.dy = table
+            self.directions = len(self.dx)
+        else:
+            # směry se neopakují, počet otočení se nezmenšuje modulo
+            self.dx = DirectOffsets(step, angle_delta, np.cos)
+            self.dy = DirectOffsets(step, angle_delta, np.sin)
+            self.directions = 0
+        self.x = float(start_x)
+        self.y = float(start_y)
+        self.heading = 0
+        self.stack: list[tuple[float, float, int]] = []
+        self.vertices = np.empty((INITIAL_CAPACITY, 2), dtype=np.float64)
+        self.count = 0
+        # indexy vrcholů, kterými začínají jednotlivé lomené čáry
+        self.starts: list[int] = []
+        self.start_polyline()
+
+    def start_polyline(self) -> None:
+        """Začít novou lomenou čáru v aktuální pozici želvy."""
+        # předchozí čára bez úseček se zahodí
+        if self.starts and self.starts[-1] == self.count - 1:
+            self.count -= 1
+            self.starts.pop()
+        self.starts.append(self.count)
+        self.emit(np.array([self.x]), np.array([self.y]))
+
+    def emit(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """Připojit vrcholy na konec bufferu, buffer se v případě potřeby zvětší."""
+        end = self.count + len(xs)
+        if end > len(self.vertices):
+            capacity = max(end, 2 * len(self.vertices))
+            vertices = np.empty((capacity, 2), dtype=np.float64)
+            vertices[: self.count] = self.vertices[: self.count]
+            self.vertices = vertices
+        self.vertices[self.count : end, 0] = xs
+        self.vertices[self.count : end, 1] = ys
+        self.count = end
+
+    def run(self, chunks: Iterable[str]) -> None:
+        """Provést všechny příkazy z řídicího řetězce zadaného po úsecích."""
+        for chunk in chunks:
+            if "[" in chunk or "]" in chunk:
+                self.run_commands(chunk)
+            else:
+                self.run_vectorized(chunk)
+
+    def run_vectorized(self, chunk: str) -> None:
+        """Provést úsek řídicího řetězce bez větvení najednou."""
+        codes = np.frombuffer(chunk.encode("ascii"), dtype=np.uint8)
+        turns = (codes == ord("-")).astype(np.int64) - (codes == ord("+"))
+        headings = self.heading + np.cumsum(turns)
+        if self.directions:
+            headings %= self.directions
+        moves = (codes == ord("F")).astype(np.int64) - (codes == ord("B"))
+        if len(codes):
+            self.heading = int(headings[-1])
+
+        drawn = np.flatnonzero(moves)
+        if len(drawn) == 0:
+            return
+        sign = moves[drawn]
+        xs = self.x + np.cumsum(sign * self.dx[headings[drawn]])
+        ys = self.y + np.cumsum(sign * self.dy[headings[drawn]])
+        self.emit(xs, ys)
+        self.x = float(xs[-1])
+        self.y = float(ys[-1])
+
+    def run_commands(self, chunk: str) -> None:
+        """Provést úsek řídicího řetězce po jednotlivých příkazech."""
+        dx = self.dx.tolist() if isinstance(self.dx, np.ndarray) else self.dx
+        dy = self.dy.tolist() if isinstance(self.dy, np.ndarray) else self.dy
+        directions = self.directions
+        x = self.x
+        y = self.y
+        heading = self.heading
+        xs: list[float] = []
+        ys: list[float] = []
+
+        for command in chunk:
+            if command == "F":
+                x += dx[heading]
+                y += dy[heading]
+                xs.append(x)
+                ys.append(y)
+            elif command == "B":
+                x -= dx[heading]
+                y -= dy[heading]
+                xs.append(x)
+                ys.append(y)
+            elif command == "+":
+                heading = (heading - 1) % directions if directions else heading - 1
+            elif command == "-":
+                heading = (heading + 1) % directions if directions else heading + 1
+            elif command == "[":
+                self.stack.append((x, y, heading))
+            elif command == "]":
+                self.emit(np.array(xs), np.array(ys))
+                xs.clear()
+                ys.clear()
+                x, y, heading = self.stack.pop()
+                self.x = x
+                self.y = y
+                self.start_polyline()
+
+        self.emit(np.array(xs), np.array(ys))
+        self.x = x
+        self.y = y
+        self.heading = heading
+
+    def polylines(self) -> list[np.ndarray]:
+        """Vrátit všechny lomené čáry, každá alespoň se dvěma vrcholy."""
+        ends = self.starts[1:] + [self.count]
+        return [
+            self.vertices[start:end] for start, end in zip(self.starts, ends) if end - start > 1
+        ]
+
+
+def turtle_polylines(
+    chunks: Iterable[str], step: float, angle_delta: float, start_x: float, start_y: float
+) -> list[np.ndarray]:
+    """Interpretace řídicího řetězce želvou, výsledkem jsou lomené čáry."""
+    turtle = Turtle(step, angle_delta, start_x, start_y)
+    turtle.run(chunks)
+    return turtle.polylines()
+
+
+def draw_polylines(
+    image: Image.Image,
+    color: tuple[int, int, int],
+    polylines: list[np.ndarray],
+    fit: bool = True,
+) -> None:
+    """Vykreslení lomených čar do obrázku bez nutnosti otevírat okno.
+
+    Při fit=True se lomené čáry zvětší nebo zmenší tak, aby se vešly do obrázku.
+    """
+    width, height = image.size
+    offset = np.zeros(2)
+    scale = 1.0
+    if fit and polylines:
+        vertices = np.concatenate(polylines)
+        low = vertices.min(axis=0)
+        size = np.maximum(vertices.max(axis=0) - low, 1e-9)
+        # ponechat okraj jeden pixel na každé straně
+        scale = float(min((width - 3) / size[0], (height - 3) / size[1]))
+        offset = (np.array([width, height]) - 1 - size * scale) / 2.0 - low * scale
+
+    draw = ImageDraw.Draw(image)
+    for polyline in polylines:
+        draw.line((polyline * scale + offset).ravel().tolist(), fill=color)
+
+
+def main() -> None:
+    """Vykreslení L-systémů s miliony úseček do souborů."""
+    systems = (
+        ("snowflake", "F--F--F", {"F": "F+F--F+F"}, 60.0, 9),
+        ("plant", "X", {"X": "F+[[X]-X]-F[-FX]+X", "F": "FF"}, 25.0, 8),
+    )
+    for name, axiom, rewrite_rules, angle, iterations in systems:
+        t1 = time()
+        polylines = turtle_polylines(expand(axiom, rewrite_rules, iterations), 1.0, angle, 0, 0)
+        image = Image.new("RGB", (2048, 2048))
+        draw_polylines(image, (255, 255, 255), polylines)
+        t2 = time()
+        segments = sum(len(polyline) - 1 for polyline in polylines)
+        print(f"{name}: {segments} segments rendered in {t2 - t1:4.1f} seconds")
+        image.save(name + ".png")
+
+
+if __name__ == "__main__":
+    # call the main function
+    main()
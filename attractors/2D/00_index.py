@@ -46,3 +46,6 @@
 # Threeply.py:
 # Výpočet a vykreslení podivného atraktoru nazvaného Threeply.
 #
+# attractor_engine.py:
+# Výpočet hustoty bodů 2D podivných atraktorů pro mnoho orbit současně.
+#
@@ -24,12 +24,12 @@
 
 # De Jong attractor
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
-from math import cos, sin
-
+# Import všech potřebných knihoven - Matplotlibu a Numpy, ze kterého se
+# využijí jen některé vybrané funkce pracující i s celými poli.
 import matplotlib.pyplot as plt
-import numpy as np
+from numpy import cos, sin
+
+from attractor_engine import density_histogram, estimate_bounds, plot_density
 
 
 def bedhead(x, y, a, b):
@@ -39,31 +39,31 @@ def bedhead(x, y, a, b):
     return x_dot, y_dot
 
 
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
 # Celkový počet vypočtených bodů na atraktoru.
-n = 500000
+n = 20_000_000
 
 # Počet bodů ze začátku výpočtu, které se nevykreslí.
 settle_down_points = 1000
 
-# Prozatím prázdné pole připravené pro uložení výsledků výpočtu.
-x = np.zeros((n,))
-y = np.zeros((n,))
-
 # Počáteční hodnoty pro výpočet podivného atraktoru.
-x[0], y[0] = (1.0, 1.0)
+start = (1.0, 1.0)
 
 # Parametry ovlivňující výpočet prvního podivného atraktoru.
 A = 0.06
 B = 0.98
 
 # Vlastní výpočet podivného atraktoru.
-for i in range(n - 1):
-    x_dot, y_dot = bedhead(x[i], y[i], A, B)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+bounds = estimate_bounds(bedhead, (A, B), start)
+histogram = density_histogram(
+    bedhead, (A, B), WIDTH, HEIGHT, bounds, n, start, settle_down=settle_down_points
+)
 
 # Vykreslení grafu s atraktorem.
-plt.plot(x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1)
+plot_density(histogram, bounds)
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -85,18 +85,16 @@ A = -0.67
 B = 0.83
 
 # Počáteční hodnoty pro výpočet podivného atraktoru.
-x[0], y[0] = (1.0, 1.0)
+start = (1.0, 1.0)
 
 # Vlastní výpočet atraktoru - druhá varianta.
-for i in range(n - 1):
-    x_dot, y_dot = bedhead(x[i], y[i], A, B)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+bounds = estimate_bounds(bedhead, (A, B), start)
+histogram = density_histogram(
+    bedhead, (A, B), WIDTH, HEIGHT, bounds, n, start, settle_down=settle_down_points
+)
 
 # Vykreslení grafu.
-plt.plot(
-    x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1, color="red"
-)
+plot_density(histogram, bounds, "red")
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -24,12 +24,12 @@
 
 # De Jong attractor
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
-from math import cos, sin
-
+# Import všech potřebných knihoven - Matplotlibu a Numpy, ze kterého se
+# využijí jen některé vybrané funkce pracující i s celými poli.
 import matplotlib.pyplot as plt
-import numpy as np
+from numpy import cos, sin
+
+from attractor_engine import density_histogram, estimate_bounds, plot_density
 
 
 def de_jong(x, y, a, b, c, d):
@@ -39,18 +39,18 @@ def de_jong(x, y, a, b, c, d):
     return x_dot, y_dot
 
 
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
 # Celkový počet vypočtených bodů na atraktoru.
-n = 500000
+n = 20_000_000
 
 # Počet bodů ze začátku výpočtu, které se nevykreslí.
 settle_down_points = 1000
 
-# Prozatím prázdné pole připravené pro uložení výsledků výpočtu.
-x = np.zeros((n,))
-y = np.zeros((n,))
-
 # Počáteční hodnoty pro výpočet De Jongova atraktoru.
-x[0], y[0] = (0.0, 0.0)
+start = (0.0, 0.0)
 
 # Parametry ovlivňující výpočet prvního podivného atraktoru.
 A = -2.7
@@ -59,13 +59,13 @@ C = -0.86
 D = -2.20
 
 # Vlastní výpočet podivného atraktoru.
-for i in range(n - 1):
-    x_dot, y_dot = de_jong(x[i], y[i], A, B, C, D)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+bounds = estimate_bounds(de_jong, (A, B, C, D), start)
+histogram = density_histogram(
+    de_jong, (A, B, C, D), WIDTH, HEIGHT, bounds, n, start, settle_down=settle_down_points
+)
 
 # Vykreslení grafu s atraktorem.
-plt.plot(x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1)
+plot_density(histogram, bounds)
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -89,18 +89,16 @@ C = 0.316
 D = 1.525
 
 # Počáteční hodnoty pro výpočet De Jongova atraktoru.
-x[0], y[0] = (0.0, 0.0)
+start = (0.0, 0.0)
 
 # Vlastní výpočet atraktoru - druhá varianta.
-for i in range(n - 1):
-    x_dot, y_dot = de_jong(x[i], y[i], A, B, C, D)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+bounds = estimate_bounds(de_jong, (A, B, C, D), start)
+histogram = density_histogram(
+    de_jong, (A, B, C, D), WIDTH, HEIGHT, bounds, n, start, settle_down=settle_down_points
+)
 
 # Vykreslení grafu.
-plt.plot(
-    x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1, color="red"
-)
+plot_density(histogram, bounds, "red")
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -24,12 +24,13 @@
 
 # Dynamic system renderer
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
-from math import sin
-
+# Import všech potřebných knihoven - Matplotlibu a Numpy, ze kterého se
+# využijí jen některé vybrané funkce pracující i s celými poli.
 import matplotlib.pyplot as plt
 import numpy as np
+from numpy import sin
+
+from attractor_engine import density_histogram, estimate_bounds, plot_density
 
 
 def dynamic(x, y, a, b):
@@ -39,6 +40,22 @@ def dynamic(x, y, a, b):
     return x_dot, y_dot
 
 
+def dynamic_step(x, y, a, b, dt):
+    """Jeden krok numerické integrace dynamického systému."""
+    x_dot, y_dot = dynamic(x, y, a, b)
+    return x + dt * x_dot, y + dt * y_dot
+
+
+def grid_starts(max_x, step_x, max_y, step_y):
+    """Počáteční body orbit ležící v pravidelné mřížce."""
+    x0, y0 = np.meshgrid(np.arange(0, max_x, step_x), np.arange(0, max_y, step_y))
+    return x0.ravel(), y0.ravel()
+
+
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
 # Konstanta pro numerickou integraci. Menší hodnoty znamenají přesnější
 # výpočty, ovšem na úkor výpočetního času.
 dt = 0.3
@@ -52,35 +69,32 @@ step_y = 5
 # Počet iterací pro zadané počáteční podmínky.
 maxiter = 1000
 
-# Počet vypočtených bodů na podivném atraktoru.
-n = maxiter * max_x // step_x * max_y // step_y
-
-# Prozatím prázdné pole připravené pro výpočet.
-x = np.zeros((n,))
-y = np.zeros((n,))
-
-# Počáteční hodnoty pro výpočet.
-# x[0], y[0] = (10, 10)
-
 # Parametry ovlivňující výpočet podivného atraktoru.
 A = -2.7
 B = 2.8
 
-i = 0
-# Vlastní výpočet podivného atraktoru  pro různé počáteční podmínky.
-for x0 in range(0, max_x, step_x):
-    for y0 in range(0, max_y, step_y):
-        # Počáteční hodnoty pro výpočet.
-        x[i], y[i] = (x0, y0)
-        # Jedno "vlákno" atraktoru.
-        for r in range(1, maxiter):
-            x_dot, y_dot = dynamic(x[i], y[i], A, B)
-            x[i + 1] = x[i] + dt * x_dot
-            y[i + 1] = y[i] + dt * y_dot
-            i += 1
+# Vlastní výpočet podivného atraktoru pro různé počáteční podmínky,
+# každá orbita představuje jedno "vlákno" atraktoru.
+start = grid_starts(max_x, step_x, max_y, step_y)
+orbits = len(start[0])
+bounds = estimate_bounds(
+    dynamic_step, (A, B, dt), start, 0.0, settle_down=0, iterations=maxiter, orbits=orbits
+)
+histogram = density_histogram(
+    dynamic_step,
+    (A, B, dt),
+    WIDTH,
+    HEIGHT,
+    bounds,
+    orbits * maxiter,
+    start,
+    0.0,
+    orbits=orbits,
+    settle_down=0,
+)
 
 # Vykreslení grafu s podivným atraktorem.
-plt.plot(x, y, "o", markersize=0.1)
+plot_density(histogram, bounds)
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -104,21 +118,28 @@ step_x = step_x // 2
 step_y = step_y * 2
 maxiter = maxiter // 2
 
-i = 0
-# Vlastní výpočet podivného atraktoru  pro různé počáteční podmínky.
-for x0 in range(0, max_x, step_x):
-    for y0 in range(0, max_y, step_y):
-        # Počáteční hodnoty pro výpočet.
-        x[i], y[i] = (x0, y0)
-        # Jedno "vlákno" atraktoru.
-        for r in range(1, maxiter):
-            x_dot, y_dot = dynamic(x[i], y[i], A, B)
-            x[i + 1] = x[i] + dt * x_dot
-            y[i + 1] = y[i] + dt * y_dot
-            i += 1
+# Vlastní výpočet podivného atraktoru pro různé počáteční podmínky,
+# každá orbita představuje jedno "vlákno" atraktoru.
+start = grid_starts(max_x, step_x, max_y, step_y)
+orbits = len(start[0])
+bounds = estimate_bounds(
+    dynamic_step, (A, B, dt), start, 0.0, settle_down=0, iterations=maxiter, orbits=orbits
+)
+histogram = density_histogram(
+    dynamic_step,
+    (A, B, dt),
+    WIDTH,
+    HEIGHT,
+    bounds,
+    orbits * maxiter,
+    start,
+    0.0,
+    orbits=orbits,
+    settle_down=0,
+)
 
 # Vykreslení grafu s podivným atraktorem.
-plt.plot(x, y, "o", markersize=0.1, color="red")
+plot_density(histogram, bounds, "red")
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -24,12 +24,12 @@
 
 # Fractal dream attractor
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
-from math import sin
-
+# Import všech potřebných knihoven - Matplotlibu a Numpy, ze kterého se
+# využijí jen některé vybrané funkce pracující i s celými poli.
 import matplotlib.pyplot as plt
-import numpy as np
+from numpy import sin
+
+from attractor_engine import density_histogram, estimate_bounds, plot_density
 
 
 def fractal_dream(x, y, a, b, c, d):
@@ -39,18 +39,18 @@ def fractal_dream(x, y, a, b, c, d):
     return x_dot, y_dot
 
 
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
 # Celkový počet vypočtených bodů na atraktoru.
-n = 100000
+n = 20_000_000
 
 # Počet bodů ze začátku výpočtu, které se nevykreslí.
 settle_down_points = 1000
 
-# Prozatím prázdné pole připravené pro uložení výsledků výpočtu.
-x = np.zeros((n,))
-y = np.zeros((n,))
-
 # Počáteční hodnoty pro výpočet podivného atraktoru.
-x[0], y[0] = (0.1, 0.0)
+start = (0.1, 0.0)
 
 # Parametry ovlivňující výpočet podivného atraktoru.
 A = -0.97
@@ -59,13 +59,13 @@ C = 0.77
 D = 0.74
 
 # Vlastní výpočet podivného atraktoru.
-for i in range(n - 1):
-    x_dot, y_dot = fractal_dream(x[i], y[i], A, B, C, D)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+bounds = estimate_bounds(fractal_dream, (A, B, C, D), start)
+histogram = density_histogram(
+    fractal_dream, (A, B, C, D), WIDTH, HEIGHT, bounds, n, start, settle_down=settle_down_points
+)
 
 # Vykreslení grafu.
-plt.plot(x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1)
+plot_density(histogram, bounds)
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
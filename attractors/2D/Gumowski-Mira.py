@@ -24,10 +24,11 @@
 
 # Gumowki-Mira attractor
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
+# Import všech potřebných knihoven - Matplotlibu a modulu pro výpočet
+# hustoty bodů atraktoru.
 import matplotlib.pyplot as plt
-import numpy as np
+
+from attractor_engine import orbit_density, plot_density
 
 
 def Gumowski(x, mu):
@@ -43,18 +44,19 @@ def gumowski_mira(x, y, a, b, mu):
     return x_dot, y_dot
 
 
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
 # Celkový počet vypočtených bodů na atraktoru.
-n = 1000000
+n = 1_000_000
 
 # Počet bodů ze začátku výpočtu, které se nevykreslí.
 settle_down_points = 10
 
-# Prozatím prázdné pole připravené pro uložení výsledků výpočtu.
-x = np.zeros((n,))
-y = np.zeros((n,))
-
-# Počáteční hodnoty pro výpočet.
-x[0], y[0] = (0, 0.1)
+# Počáteční hodnoty pro výpočet. Zobrazení nemá přitahující atraktor, obrázek
+# tvoří jediná orbita, proto se počáteční bod nerozptyluje do více orbit.
+start = (0, 0.1)
 
 # Parametry ovlivňující výpočet podivného atraktoru.
 A = 0.01
@@ -62,13 +64,12 @@ B = 0.5
 mu = -0.8
 
 # Vlastní výpočet podivného atraktoru.
-for i in range(n - 1):
-    x_dot, y_dot = gumowski_mira(x[i], y[i], A, B, mu)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+histogram, bounds = orbit_density(
+    gumowski_mira, (A, B, mu), WIDTH, HEIGHT, n, start, settle_down_points
+)
 
 # Vykreslení grafu.
-plt.plot(x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1)
+plot_density(histogram, bounds)
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -91,15 +92,12 @@ B = 0.15
 mu = -0.9
 
 # Vlastní výpočet druhého podivného atraktoru.
-for i in range(n - 1):
-    x_dot, y_dot = gumowski_mira(x[i], y[i], A, B, mu)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+histogram, bounds = orbit_density(
+    gumowski_mira, (A, B, mu), WIDTH, HEIGHT, n, start, settle_down_points
+)
 
 # Vykreslení grafu.
-plt.plot(
-    x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1, color="red"
-)
+plot_density(histogram, bounds, "red")
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
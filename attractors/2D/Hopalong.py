@@ -24,12 +24,13 @@
 
 # Hopalong attractor
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
+# Import všech potřebných knihoven - Matplotlibu a standardní matematické
+# knihovny, ze které se využijí jen některé vybrané funkce.
 from math import sqrt
 
 import matplotlib.pyplot as plt
-import numpy as np
+
+from attractor_engine import orbit_density, plot_density
 
 
 def sign(x):
@@ -57,18 +58,19 @@ def hopalong(x, y, a, b, c):
     return x_dot, y_dot
 
 
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
 # Celkový počet vypočtených bodů na atraktoru.
-n = 200000
+n = 200_000
 
 # Počet bodů ze začátku výpočtu, které se nevykreslí.
 settle_down_points = 10
 
-# Prozatím prázdné pole připravené pro uložení výsledků výpočtu.
-x = np.zeros((n,))
-y = np.zeros((n,))
-
-# Počáteční hodnoty pro výpočet.
-x[0], y[0] = (0.0, 0.0)
+# Počáteční hodnoty pro výpočet. Zobrazení nemá přitahující atraktor, obrázek
+# tvoří jediná orbita, proto se počáteční bod nerozptyluje do více orbit.
+start = (0.0, 0.0)
 
 # Parametry ovlivňující výpočet podivného atraktoru.
 A = 3.1
@@ -76,13 +78,10 @@ B = 1.8
 C = -0.9
 
 # Vlastní výpočet podivného atraktoru.
-for i in range(n - 1):
-    x_dot, y_dot = hopalong(x[i], y[i], A, B, C)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+histogram, bounds = orbit_density(hopalong, (A, B, C), WIDTH, HEIGHT, n, start, settle_down_points)
 
 # Vykreslení grafu.
-plt.plot(x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1)
+plot_density(histogram, bounds)
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -100,7 +99,7 @@ plt.show()
 # Druhý atraktor.
 
 # Počáteční hodnoty pro výpočet.
-x[0], y[0] = (0.0, 0.0)
+start = (0.0, 0.0)
 
 # Parametry ovlivňující výpočet podivného atraktoru.
 A = 7.16878197155893
@@ -108,15 +107,10 @@ B = 8.43659746693447
 C = 2.55983412731439
 
 # Vlastní výpočet podivného atraktoru.
-for i in range(n - 1):
-    x_dot, y_dot = hopalong(x[i], y[i], A, B, C)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+histogram, bounds = orbit_density(hopalong, (A, B, C), WIDTH, HEIGHT, n, start, settle_down_points)
 
 # Vykreslení grafu.
-plt.plot(
-    x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1, color="red"
-)
+plot_density(histogram, bounds, "red")
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
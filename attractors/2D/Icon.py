@@ -24,10 +24,11 @@
 
 # Icon attractor
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
+# Import všech potřebných knihoven - Matplotlibu a Numpy, ze kterého se
+# využijí jen některé vybrané funkce pracující i s celými poli.
 import matplotlib.pyplot as plt
-import numpy as np
+
+from attractor_engine import density_histogram, estimate_bounds, plot_density
 
 
 def icon(x, y, lambda_, alpha, beta, gamma, omega, degree):
@@ -48,34 +49,34 @@ def icon(x, y, lambda_, alpha, beta, gamma, omega, degree):
     return x_dot, y_dot
 
 
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
+
 def draw_icon(filename, lambda_, alfa, beta, gamma, omega, degree, color):
     """Vykreslení atraktoru se zadanými parametry."""
     # Celkový počet vypočtených bodů na atraktoru.
-    n = 100000
+    n = 20_000_000
 
     # Počet bodů ze začátku výpočtu, které se nevykreslí.
     settle_down_points = 10
 
-    # Prozatím prázdné pole připravené pro uložení výsledků výpočtu.
-    x = np.zeros((n,))
-    y = np.zeros((n,))
-
     # Počáteční hodnoty pro výpočet.
-    x[0], y[0] = (0.01, 0.01)
+    start = (0.01, 0.01)
 
     # Vlastní výpočet podivného atraktoru.
-    for i in range(n - 1):
-        x_dot, y_dot = icon(x[i], y[i], LAMBDA, ALFA, BETA, GAMMA, OMEGA, DEGREE)
-        x[i + 1] = x_dot
-        y[i + 1] = y_dot
+    params = (lambda_, alfa, beta, gamma, omega, degree)
+    bounds = estimate_bounds(icon, params, start)
+    histogram = density_histogram(
+        icon, params, WIDTH, HEIGHT, bounds, n, start, settle_down=settle_down_points
+    )
 
     # Změna velikosti komponent v grafu.
     plt.figure(figsize=(6.4, 4.8))
 
     # Vykreslení grafu.
-    plt.plot(
-        x[settle_down_points:], y[settle_down_points:], "o", markersize=0.1, color=color
-    )
+    plot_density(histogram, bounds, color)
 
     # Uložení grafu pro jeho další zpracování.
     plt.savefig(filename)
@@ -25,12 +25,12 @@
 # Jason Rampe attractor #1
 # https://softologyblog.wordpress.com/2017/03/04/2d-strange-attractors/
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
-from math import cos, sin
-
+# Import všech potřebných knihoven - Matplotlibu a Numpy, ze kterého se
+# využijí jen některé vybrané funkce pracující i s celými poli.
 import matplotlib.pyplot as plt
-import numpy as np
+from numpy import cos, sin
+
+from attractor_engine import density_histogram, estimate_bounds, plot_density
 
 
 def rason_rampe_1(x, y, a, b, c, d):
@@ -40,18 +40,18 @@ def rason_rampe_1(x, y, a, b, c, d):
     return x_dot, y_dot
 
 
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
 # Celkový počet vypočtených bodů na atraktoru.
-n = 400000
+n = 20_000_000
 
 # Počet bodů ze začátku výpočtu, které se nevykreslí.
 settle_down_points = 1
 
-# Prozatím prázdné pole připravené pro uložení výsledků výpočtu.
-x = np.zeros((n,))
-y = np.zeros((n,))
-
 # Počáteční hodnoty pro výpočet.
-x[0], y[0] = (0.1, 0.1)
+start = (0.1, 0.1)
 
 # Parametry ovlivňující výpočet podivného atraktoru.
 A = -2.7918
@@ -60,13 +60,13 @@ C = 1.0284
 D = 0.1384
 
 # Vlastní výpočet podivného atraktoru.
-for i in range(n - 1):
-    x_dot, y_dot = rason_rampe_1(x[i], y[i], A, B, C, D)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+bounds = estimate_bounds(rason_rampe_1, (A, B, C, D), start)
+histogram = density_histogram(
+    rason_rampe_1, (A, B, C, D), WIDTH, HEIGHT, bounds, n, start, settle_down=settle_down_points
+)
 
 # Vykreslení grafu.
-plt.plot(x[settle_down_points:], y[settle_down_points:], "o", markersize=0.03)
+plot_density(histogram, bounds)
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -24,12 +24,13 @@
 
 # Kam torus attractor
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
-from math import cos, sin
-
+# Import všech potřebných knihoven - Matplotlibu a Numpy, ze kterého se
+# využijí jen některé vybrané funkce pracující i s celými poli.
 import matplotlib.pyplot as plt
 import numpy as np
+from numpy import cos, sin
+
+from attractor_engine import density_histogram, estimate_bounds, plot_density
 
 
 def frange(start, stop, step):
@@ -50,37 +51,35 @@ points_per_orbit = 2000
 a = 1.3
 
 
-def kam_torus(orbit_start, orbit_end, orbit_step, points_per_orbit, a):
-    """Výpočet atraktoru."""
-    # Celkový počet vypočtených bodů na podivném atraktoru.
-    n = 100000
-
-    # Prozatím prázdné pole připravené pro výpočet.
-    x = np.zeros((n,))
-    y = np.zeros((n,))
-
-    # Vlastní výpočet podivného atraktoru.
-    i = 0
-    for orbit in frange(orbit_start, orbit_end, orbit_step):
-        x[i] = orbit / 3.0
-        y[i] = orbit / 3.0
-        i += 1
-        if i >= n:
-            return x, y
-        for p in range(1, points_per_orbit):
-            x[i] = x[i - 1] * cos(a) + (x[i - 1] * x[i - 1] - y[i - 1]) * sin(a)
-            y[i] = x[i - 1] * sin(a) - (x[i - 1] * x[i - 1] - y[i - 1]) * cos(a)
-            i += 1
-            if i >= n:
-                return x, y
-    return x, y
+def kam_torus(x, y, a):
+    """Funkce pro výpočet dalšího bodu atraktoru."""
+    x_dot = x * cos(a) + (x * x - y) * sin(a)
+    y_dot = x * sin(a) - (x * x - y) * cos(a)
+    return x_dot, y_dot
+
+
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
+# Počáteční body všech orbit, orbity se počítají současně.
+starts = np.array(list(frange(orbit_start, orbit_end, orbit_step))) / 3.0
+start = (starts, starts)
+orbits = len(starts)
 
+# Celkový počet vypočtených bodů na podivném atraktoru.
+n = orbits * points_per_orbit
 
 # Vlastní výpočet podivného atraktoru.
-x, y = kam_torus(orbit_start, orbit_end, orbit_step, points_per_orbit, a)
+bounds = estimate_bounds(
+    kam_torus, (a,), start, 0.0, settle_down=0, iterations=points_per_orbit, orbits=orbits
+)
+histogram = density_histogram(
+    kam_torus, (a,), WIDTH, HEIGHT, bounds, n, start, 0.0, orbits=orbits, settle_down=0
+)
 
 # Vykreslení grafu.
-plt.plot(x, y, "o", markersize=0.1)
+plot_density(histogram, bounds)
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
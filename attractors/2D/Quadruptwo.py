@@ -24,17 +24,17 @@
 
 # Quadruptwo attractor
 
-# Import všech potřebných knihoven - Numpy, Matplotlibu a standardní
-# matematické knihovny, ze které se využijí jen některé vybrané funkce.
-from math import atan, sin
-
+# Import všech potřebných knihoven - Matplotlibu a Numpy, ze kterého se
+# využijí jen některé vybrané funkce pracující i s celými poli.
 import matplotlib.pyplot as plt
-import numpy as np
-from numpy import abs, sign
+from numpy import abs, sign, sin
+from numpy import arctan as atan
 
 # Dále se načtou i některé funkce pro výpočty nad maticemi a vektory.
 from numpy import log as ln
 
+from attractor_engine import density_histogram, estimate_bounds, plot_density
+
 
 def sqr(x):
     """Výpočet druhé mocniny vstupní hodnoty x."""
@@ -48,18 +48,18 @@ def quadruptwo(x, y, a, b, c):
     return x_dot, y_dot
 
 
+# Rozměry histogramu s hustotou bodů, odpovídají velikosti grafu.
+WIDTH = 640
+HEIGHT = 480
+
 # Celkový počet vypočtených bodů na atraktoru.
-n = 400000
+n = 20_000_000
 
 # Počet bodů ze začátku výpočtu, které se nevykreslí.
 settle_down_points = 1
 
-# Prozatím prázdné pole připravené pro uložení výsledků výpočtu.
-x = np.zeros((n,))
-y = np.zeros((n,))
-
 # Počáteční hodnoty pro výpočet.
-x[0], y[0] = (0.0, 0.0)
+start = (0.0, 0.0)
 
 # Parametry ovlivňující výpočet podivného atraktoru.
 A = 3.1
@@ -67,13 +67,13 @@ B = 1.8
 C = -0.9
 
 # Vlastní výpočet podivného atraktoru.
-for i in range(n - 1):
-    x_dot, y_dot = quadruptwo(x[i], y[i], A, B, C)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
+bounds = estimate_bounds(quadruptwo, (A, B, C), start)
+histogram = density_histogram(
+    quadruptwo, (A, B, C), WIDTH, HEIGHT, bounds, n, start, settle_down=settle_down_points
+)
 
 # Vykreslení grafu.
-plt.plot(x[settle_down_points:], y[settle_down_points:], "o", markersize=0.05)
+plot_density(histogram, bounds)
 
 # Změna velikosti komponent v grafu.
 plt.tight_layout()
@@ -0,0 +1,262 @@
+"""Výpočet hustoty bodů 2D podivných atraktorů pro mnoho orbit současně."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+# Funkce atraktoru musí pracovat s poli NumPy, tedy například používat
+# np.sin namísto math.sin a np.where namísto podmínek:
+#
+# def de_jong(x, y, a, b, c, d):
+#     return np.sin(a * y) - np.cos(b * x), np.sin(c * x) - np.cos(d * y)
+#
+# Paměťová náročnost závisí jen na velikosti obrázku a počtu orbit,
+# nikoli na celkovém počtu vypočtených bodů.
+#
+# Zobrazení bez přitahujícího atraktoru (Hopalong, Gumowski-Mira) se
+# vykreslují jedinou orbitou funkcí orbit_density. Ta volá funkci atraktoru
+# s čísly typu float, takže funkce může používat i math.sqrt a podmínky.
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+# funkce pro výpočet dalšího bodu atraktoru: f(x, y, *params) -> (x, y)
+MapFunction = Callable[..., tuple[Any, Any]]
+
+# obdélník v rovině (xmin, ymin, xmax, ymax)
+Bounds = tuple[float, float, float, float]
+
+# seed generátoru náhodných čísel: cokoli, co akceptuje np.random.default_rng
+Seed = int | np.random.SeedSequence | np.random.Generator | None
+
+# výchozí počet orbit počítaných současně
+ORBITS = 1 << 16
+
+# výchozí rozptyl počátečních bodů orbit okolo zadaného počátečního bodu
+SPREAD = 0.1
+
+# počet bodů, po jehož dosažení se indexy pixelů přičtou do histogramu
+FLUSH_HITS = 1 << 22
+
+# počet bodů jediné orbity, které se převedou na pole NumPy najednou
+ORBIT_CHUNK = 1 << 16
+
+
+def initial_points(
+    start: tuple[Any, Any], orbits: int, spread: float, seed: Seed = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Počáteční body všech orbit náhodně rozmístěné okolo zadaného bodu.
+
+    Počátečním bodem mohou být i pole s počátky jednotlivých orbit.
+    """
+    rng = np.random.default_rng(seed)
+    x = np.broadcast_to(np.asarray(start[0], dtype=np.float64), (orbits,))
+    y = np.broadcast_to(np.asarray(start[1], dtype=np.float64), (orbits,))
+    if spread:
+        x = x + rng.uniform(-spread, spread, orbits)
+        y = y + rng.uniform(-spread, spread, orbits)
+    return x.copy(), y.copy()
+
+
+def iterate(
+    map_function: MapFunction,
+    params: tuple[float, ...],
+    x: np.ndarray,
+    y: np.ndarray,
+    iterations: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Provést zadaný počet iterací pro všechny orbity."""
+    with np.errstate(all="ignore"):
+        for _ in range(iterations):
+            x, y = map_function(x, y, *params)
+    return np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+
+
+def estimate_bounds(
+    map_function: MapFunction,
+    params: tuple[float, ...],
+    start: tuple[Any, Any] = (0.0, 0.0),
+    spread: float = SPREAD,
+    settle_down: int = 1000,
+    iterations: int = 100,
+    orbits: int = 1024,
+    margin: float = 0.05,
+    seed: Seed = None,
+) -> Bounds:
+    """Odhad obdélníku, ve kterém leží atraktor, na základě krátkého výpočtu.
+
+    Stejně jako v grafech knihovny Matplotlib se k obdélníku přidá okraj.
+    """
+    x, y = initial_points(start, orbits, spread, seed)
+    x, y = iterate(map_function, params, x, y, settle_down)
+    xmin = ymin = np.inf
+    xmax = ymax = -np.inf
+    with np.errstate(all="ignore"):
+        for _ in range(iterations):
+            x, y = map_function(x, y, *params)
+            finite = np.isfinite(x) & np.isfinite(y)
+            if finite.any():
+                xmin = min(xmin, x[finite].min())
+                ymin = min(ymin, y[finite].min())
+                xmax = max(xmax, x[finite].max())
+                ymax = max(ymax, y[finite].max())
+    if not np.isfinite(xmin):
+        raise ValueError("All orbits diverge")
+    return add_margin((xmin, ymin, xmax, ymax), margin)
+
+
+def add_margin(bounds: Bounds, margin: float) -> Bounds:
+    """Zvětšení obdélníku o okraj zadaný jako podíl jeho šířky a výšky."""
+    xmin, ymin, xmax, ymax = bounds
+    margin_x = max(xmax - xmin, 1e-9) * margin
+    margin_y = max(ymax - ymin, 1e-9) * margin
+    return (
+        float(xmin - margin_x),
+        float(ymin - margin_y),
+        float(xmax + margin_x),
+        float(ymax + margin_y),
+    )
+
+
+def pixel_indices(
+    x: np.ndarray, y: np.ndarray, width: int, height: int, bounds: Bounds
+) -> np.ndarray:
+    """Indexy pixelů histogramu, do kterých padnou body, body mimo obrázek se vynechají."""
+    xmin, ymin, xmax, ymax = bounds
+    # souřadnice v histogramu, NaN a nekonečna neprojdou testem
+    px = (x - xmin) * (width / (xmax - xmin))
+    py = (y - ymin) * (height / (ymax - ymin))
+    visible = (px >= 0) & (py >= 0) & (px < width) & (py < height)
+    return py[visible].astype(np.int64) * width + px[visible].astype(np.int64)
+
+
+def density_histogram(
+    map_function: MapFunction,
+    params: tuple[float, ...],
+    width: int,
+    height: int,
+    bounds: Bounds,
+    hits: int,
+    start: tuple[Any, Any] = (0.0, 0.0),
+    spread: float = SPREAD,
+    orbits: int = ORBITS,
+    settle_down: int = 1000,
+    seed: Seed = None,
+) -> np.ndarray:
+    """Výpočet histogramu s počty zásahů jednotlivých pixelů.
+
+    Všechny orbity se počítají současně, každá začíná v náhodném bodě
+    v okolí počátečního bodu. Celkový počet bodů se zaokrouhlí nahoru na
+    celé kroky všech orbit. Histogram má tvar (height, width) a jeho první
+    řádek odpovídá hodnotě ymin.
+    """
+    orbits = max(1, min(orbits, hits))
+    x, y = initial_points(start, orbits, spread, seed)
+    x, y = iterate(map_function, params, x, y, settle_down)
+
+    histogram = np.zeros(width * height, dtype=np.int64)
+    # buffer pro indexy pixelů, které se do histogramu přičtou najednou
+    buffer = np.empty(max(FLUSH_HITS, orbits), dtype=np.int64)
+    used = 0
+
+    steps = -(-hits // orbits)
+    with np.errstate(all="ignore"):
+        for _ in range(steps):
+            x, y = map_function(x, y, *params)
+            indices = pixel_indices(x, y, width, height, bounds)
+
+            if used + len(indices) > len(buffer):
+                histogram += np.bincount(buffer[:used], minlength=width * height)
+                used = 0
+            buffer[used : used + len(indices)] = indices
+            used += len(indices)
+
+    histogram += np.bincount(buffer[:used], minlength=width * height)
+    return histogram.reshape(height, width)
+
+
+def orbit_density(
+    map_function: MapFunction,
+    params: tuple[float, ...],
+    width: int,
+    height: int,
+    hits: int,
+    start: tuple[float, float] = (0.0, 0.0),
+    settle_down: int = 1000,
+    margin: float = 0.05,
+) -> tuple[np.ndarray, Bounds]:
+    """Výpočet histogramu a obdélníku s atraktorem pro jedinou orbitu.
+
+    Orbita se počítá s čísly typu float bez režie polí NumPy. Body se
+    ukládají po blocích, obdélník se zjišťuje průběžně z každého bloku
+    a histogram se po blocích vypočte na konci, takže se orbita počítá
+    jen jednou. Paměťová náročnost roste s počtem bodů.
+    """
+    x, y = float(start[0]), float(start[1])
+    for _ in range(settle_down):
+        x, y = map_function(x, y, *params)
+
+    chunks = []
+    xmin = ymin = np.inf
+    xmax = ymax = -np.inf
+    for first in range(0, hits, ORBIT_CHUNK):
+        xs = []
+        ys = []
+        for _ in range(min(ORBIT_CHUNK, hits - first)):
+            x, y = map_function(x, y, *params)
+            xs.append(x)
+            ys.append(y)
+        chunk = np.array((xs, ys), dtype=np.float64)
+        chunks.append(chunk)
+        finite = np.isfinite(chunk).all(axis=0)
+        if finite.any():
+            xmin, ymin = np.minimum((xmin, ymin), chunk[:, finite].min(axis=1))
+            xmax, ymax = np.maximum((xmax, ymax), chunk[:, finite].max(axis=1))
+    if not np.isfinite(xmin):
+        raise ValueError("Orbit diverges")
+
+    bounds = add_margin((xmin, ymin, xmax, ymax), margin)
+    histogram = np.zeros(width * height, dtype=np.int64)
+    for chunk in chunks:
+        indices = pixel_indices(chunk[0], chunk[1], width, height, bounds)
+        histogram += np.bincount(indices, minlength=width * height)
+    return histogram.reshape(height, width), bounds
+
+
+def tone_map(histogram: np.ndarray) -> np.ndarray:
+    """Převod histogramu na intenzity v rozsahu 0.0 až 1.0 podle logaritmu hustoty."""
+    maximum = histogram.max()
+    if maximum == 0:
+        return np.zeros(histogram.shape)
+    return np.log1p(histogram) / np.log1p(maximum)
+
+
+def plot_density(histogram: np.ndarray, bounds: Bounds, color: str = "C0") -> None:
+    """Vykreslení hustoty bodů do grafu knihovny Matplotlib.
+
+    Osy grafu odpovídají souřadnicím v rovině, stejně jako při vykreslení
+    jednotlivých bodů funkcí plt.plot.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import LinearSegmentedColormap
+
+    xmin, ymin, xmax, ymax = bounds
+    colormap = LinearSegmentedColormap.from_list("density", ["white", color])
+    plt.imshow(
+        tone_map(histogram),
+        origin="lower",
+        extent=(xmin, xmax, ymin, ymax),
+        aspect="auto",
+        cmap=colormap,
+        interpolation="nearest",
+    )
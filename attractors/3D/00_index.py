@@ -22,6 +22,9 @@
 # Wang-Sun.py:
 # Výpočet a vykreslení Wang-Sunova podivného atraktoru.
 #
+# integrator.py:
+# Numerická integrace systémů diferenciálních rovnic pro 3D podivné atraktory.
+#
 # lorenz_2d_dynamic.py:
 # Vykreslení Lorenzova atraktoru s různými počátečními souřadnicemi x0 a y0.
 #
@@ -28,13 +28,16 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import dormand_prince
 
-def lorenz_mod2(x, y, z, alfa, beta, gamma, delta):
-    """Výpočet dalšího bodu Lorenzove mod2 atraktoru."""
+
+def lorenz_mod2(state, alfa, beta, gamma, delta):
+    """Výpočet derivací stavu upraveného Lorenzova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
     x_dot = -alfa * x + y * y - z * z + alfa * gamma
     y_dot = x * (y - beta * z) + delta
     z_dot = -z + x * (beta * y + z)
-    return x_dot, y_dot, z_dot
+    return np.stack((x_dot, y_dot, z_dot), axis=-1)
 
 
 # krok (změna času)
@@ -43,20 +46,11 @@ dt = 0.001
 # celkový počet vypočtených bodů na Lorenzově atraktoru
 n = 100000
 
-# prozatím prázdné pole připravené pro výpočet
-x = np.zeros((n,))
-y = np.zeros((n,))
-z = np.zeros((n,))
-
-# počáteční hodnoty
-x[0], y[0], z[0] = (0.1, 0.1, 0)
+# časy, ve kterých se vypočtou body atraktoru
+times = np.arange(n) * dt
 
-# vlastní výpočet atraktoru
-for i in range(n - 1):
-    x_dot, y_dot, z_dot = lorenz_mod2(x[i], y[i], z[i], 0.9, 5.0, 9.9, 1.0)
-    x[i + 1] = x[i] + x_dot * dt
-    y[i + 1] = y[i] + y_dot * dt
-    z[i + 1] = z[i] + z_dot * dt
+# vlastní výpočet atraktoru adaptivní metodou, výsledkem je pole s tvarem (n, 3)
+x, y, z = dormand_prince(lorenz_mod2, (0.1, 0.1, 0), times, (0.9, 5.0, 9.9, 1.0)).T
 
 # konstrukce 3D grafu
 fig = plt.figure(figsize=(8, 6))
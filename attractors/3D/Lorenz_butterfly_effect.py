@@ -28,42 +28,36 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import dormand_prince
+
 
 # funkce pro výpočet dalšího bodu Lorenzova atraktoru
-def lorenz(x, y, z, s=10, r=28, b=2.667):
-    """Výpočet dalšího bodu Lorenzova atraktoru."""
+def lorenz(state, s=10, r=28, b=2.667):
+    """Výpočet derivací stavu Lorenzova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
     x_dot = s * (y - x)
     y_dot = r * x - y - x * z
     z_dot = x * y - b * z
-    return x_dot, y_dot, z_dot
+    return np.stack((x_dot, y_dot, z_dot), axis=-1)
 
 
 # krok (změna času)
 dt = 0.01
 
-# celkový počet vypočtených bodů na Lorenzově atraktoru
-n = 1000
-
+# největší počet vypočtených bodů na Lorenzově atraktoru
+n = 1500
 
-def draw_lorenz_for_input_values(ax, dt, n, x0, y0, z0):
-    """Vykreslení Lorenzova atraktoru."""
-    # prozatím prázdné pole připravené pro výpočet
-    x = np.zeros((n,))
-    y = np.zeros((n,))
-    z = np.zeros((n,))
+# počáteční hodnoty trajektorií, které se od sebe liší jen nepatrně
+starts = [(0.0, 0.9, 1.05), (0.0, 0.8, 1.05), (0.0, 0.7, 1.05)]
 
-    # počáteční hodnoty
-    x[0], y[0], z[0] = (x0, y0, z0)
+# vlastní výpočet atraktoru, pro všechny snímky se použijí začátky stejných trajektorií
+points = dormand_prince(lorenz, starts, np.arange(n) * dt)
 
-    # vlastní výpočet atraktoru
-    for i in range(n - 1):
-        x_dot, y_dot, z_dot = lorenz(x[i], y[i], z[i])
-        x[i + 1] = x[i] + x_dot * dt
-        y[i + 1] = y[i] + y_dot * dt
-        z[i + 1] = z[i] + z_dot * dt
 
-    # vykreslení grafu
-    ax.plot(x.copy(), y.copy(), z.copy())
+def draw_lorenz_trajectories(ax, points):
+    """Vykreslení trajektorií na Lorenzově atraktoru."""
+    for i in range(points.shape[1]):
+        ax.plot(points[:, i, 0], points[:, i, 1], points[:, i, 2])
 
 
 def draw_butterfly_effect(n):
@@ -76,9 +70,7 @@ def draw_butterfly_effect(n):
     # změna velikosti komponent v grafu.
     plt.tight_layout()
 
-    draw_lorenz_for_input_values(ax, dt, n, 0.0, 0.9, 1.05)
-    draw_lorenz_for_input_values(ax, dt, n, 0.0, 0.8, 1.05)
-    draw_lorenz_for_input_values(ax, dt, n, 0.0, 0.7, 1.05)
+    draw_lorenz_trajectories(ax, points[:n])
 
     # uložení grafu
     plt.savefig(f"butterfly_{n:04d}.png")
@@ -28,13 +28,16 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import dormand_prince
 
-def lorenz(x, y, z, s=10, r=28, b=2.667):
-    """Výpočet dalšího bodu Lorenzova atraktoru."""
+
+def lorenz(state, s=10, r=28, b=2.667):
+    """Výpočet derivací stavu Lorenzova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
     x_dot = s * (y - x)
     y_dot = r * x - y - x * z
     z_dot = x * y - b * z
-    return x_dot, y_dot, z_dot
+    return np.stack((x_dot, y_dot, z_dot), axis=-1)
 
 
 # krok (změna času)
@@ -43,20 +46,11 @@ dt = 0.01
 # celkový počet vypočtených bodů na Lorenzově atraktoru
 n = 2000
 
-# prozatím prázdné pole připravené pro výpočet
-x = np.zeros((n,))
-y = np.zeros((n,))
-z = np.zeros((n,))
-
-# počáteční hodnoty
-x[0], y[0], z[0] = (0.0, 1.0, 1.05)
+# časy, ve kterých se vypočtou body atraktoru
+times = np.arange(n) * dt
 
-# vlastní výpočet bodů z nichž se postupně vytvoří Lorenzův systém
-for i in range(n - 1):
-    x_dot, y_dot, z_dot = lorenz(x[i], y[i], z[i])
-    x[i + 1] = x[i] + x_dot * dt
-    y[i + 1] = y[i] + y_dot * dt
-    z[i + 1] = z[i] + z_dot * dt
+# vlastní výpočet atraktoru adaptivní metodou, výsledkem je pole s tvarem (n, 3)
+x, y, z = dormand_prince(lorenz, (0.0, 1.0, 1.05), times).T
 
 # konstrukce 2D grafu s nastaveným rozlišením výsledného obrázku
 fig = plt.figure(figsize=(8, 6))
@@ -25,37 +25,34 @@
 # Pickover 3D attractor
 
 # import všech potřebných knihoven - Numpy a Matplotlibu
-from math import cos, sin
-
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import iterate_map
+
 
-def pickover(x, y, z, a=2.24, b=0.43, c=-0.65, d=-2.43, e=1.0):
+def pickover(state, a=2.24, b=0.43, c=-0.65, d=-2.43, e=1.0):
     """Výpočet dalšího bodu Pickoverova atraktoru."""
-    x_dot = sin(a * y) - z * cos(b * x)
-    y_dot = z * sin(c * x) - cos(d * y)
-    z_dot = e * sin(x)
-    return x_dot, y_dot, z_dot
+    x, y, z = np.moveaxis(state, -1, 0)
+    x_new = np.sin(a * y) - z * np.cos(b * x)
+    y_new = z * np.sin(c * x) - np.cos(d * y)
+    z_new = e * np.sin(x)
+    return np.stack((x_new, y_new, z_new), axis=-1)
 
 
 # celkový počet vypočtených bodů na Lorenzově atraktoru
 n = 100000
 
-# prozatím prázdné pole připravené pro výpočet
-x = np.zeros((n,))
-y = np.zeros((n,))
-z = np.zeros((n,))
+# počet orbit počítaných současně, každá začíná v jiném bodě
+orbits = 1000
 
-# počáteční hodnoty
-x[0], y[0], z[0] = (0.0, 0.0, 0.0)
+# počáteční hodnoty náhodně rozmístěné okolo počátku souřadnic
+rng = np.random.default_rng(0)
+start = rng.uniform(-0.1, 0.1, (orbits, 3))
 
-# vlastní výpočet atraktoru
-for i in range(n - 1):
-    x_dot, y_dot, z_dot = pickover(x[i], y[i], z[i], 2.24, 0.43, -0.65, -2.43, 0.8)
-    x[i + 1] = x_dot
-    y[i + 1] = y_dot
-    z[i + 1] = z_dot
+# vlastní výpočet atraktoru, body všech orbit tvoří jediný mrak bodů
+points = iterate_map(pickover, start, n // orbits, (2.24, 0.43, -0.65, -2.43, 0.8))
+x, y, z = points.reshape(-1, 3).T
 
 # konstrukce 3D grafu
 fig = plt.figure(figsize=(8, 6))
@@ -29,13 +29,16 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import dormand_prince
 
-def rossler(x, y, z, a=0.2, b=0.2, c=5.7):
-    """Výpočet dalšího bodu Rosslerova atraktoru."""
+
+def rossler(state, a=0.2, b=0.2, c=5.7):
+    """Výpočet derivací stavu Rosslerova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
     x_dot = -y - z
     y_dot = x + a * y
     z_dot = b + z * (x - c)
-    return x_dot, y_dot, z_dot
+    return np.stack((x_dot, y_dot, z_dot), axis=-1)
 
 
 # krok (změna času)
@@ -44,20 +47,11 @@ dt = 0.001
 # celkový počet vypočtených bodů na Lorenzově atraktoru
 n = 200000
 
-# prozatím prázdné pole připravené pro výpočet
-x = np.zeros((n,))
-y = np.zeros((n,))
-z = np.zeros((n,))
-
-# počáteční hodnoty
-x[0], y[0], z[0] = (0.1, 0.1, 6)
+# časy, ve kterých se vypočtou body atraktoru
+times = np.arange(n) * dt
 
-# vlastní výpočet atraktoru
-for i in range(n - 1):
-    x_dot, y_dot, z_dot = rossler(x[i], y[i], z[i], 0.3, 0.2, 5.7)
-    x[i + 1] = x[i] + x_dot * dt
-    y[i + 1] = y[i] + y_dot * dt
-    z[i + 1] = z[i] + z_dot * dt
+# vlastní výpočet atraktoru adaptivní metodou, výsledkem je pole s tvarem (n, 3)
+x, y, z = dormand_prince(rossler, (0.1, 0.1, 6), times, (0.3, 0.2, 5.7)).T
 
 # konstrukce 3D grafu
 fig = plt.figure(figsize=(8, 6))
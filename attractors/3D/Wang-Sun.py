@@ -30,13 +30,16 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import dormand_prince
 
-def wang_sun(x, y, z, alfa, beta, gamma, delta, epsilon, zeta):
-    """Výpočet dalšího bodu Wang-Sunova atraktoru."""
+
+def wang_sun(state, alfa, beta, gamma, delta, epsilon, zeta):
+    """Výpočet derivací stavu Wang-Sunova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
     x_dot = x * alfa + gamma * y * z
     y_dot = x * beta + y * delta - x * z
     z_dot = z * epsilon + zeta * x * y
-    return x_dot, y_dot, z_dot
+    return np.stack((x_dot, y_dot, z_dot), axis=-1)
 
 
 # krok (změna času)
@@ -45,20 +48,12 @@ dt = 0.001
 # celkový počet vypočtených bodů na Lorenzově atraktoru
 n = 1000000
 
-# prozatím prázdné pole připravené pro výpočet
-x = np.zeros((n,))
-y = np.zeros((n,))
-z = np.zeros((n,))
-
-# počáteční hodnoty
-x[0], y[0], z[0] = (1.05, 1.1, 1.5)
+# časy, ve kterých se vypočtou body atraktoru
+times = np.arange(n) * dt
 
-# vlastní výpočet atraktoru
-for i in range(n - 1):
-    x_dot, y_dot, z_dot = wang_sun(x[i], y[i], z[i], 0.2, -0.01, 1.0, -0.4, -1.0, -1.0)
-    x[i + 1] = x[i] + x_dot * dt
-    y[i + 1] = y[i] + y_dot * dt
-    z[i + 1] = z[i] + z_dot * dt
+# vlastní výpočet atraktoru adaptivní metodou, výsledkem je pole s tvarem (n, 3)
+points = dormand_prince(wang_sun, (1.05, 1.1, 1.5), times, (0.2, -0.01, 1.0, -0.4, -1.0, -1.0))
+x, y, z = points.T
 
 # konstrukce 3D grafu
 fig = plt.figure(figsize=(8, 6))
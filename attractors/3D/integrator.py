@@ -0,0 +1,286 @@
+"""Numerická integrace systémů diferenciálních rovnic pro 3D podivné atraktory."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+# Funkce s derivacemi pracuje s celým stavem uloženým v poli NumPy,
+# poslední osa pole obsahuje souřadnice x, y a z. Před ní může být
+# libovolný počet os s jednotlivými trajektoriemi, které se počítají
+# současně. Parametry mohou být skaláry nebo pole s hodnotou pro každou
+# trajektorii:
+#
+# def lorenz(state, s, r, b):
+#     x, y, z = np.moveaxis(state, -1, 0)
+#     return np.stack((s * (y - x), r * x - y - x * z, x * y - b * z), axis=-1)
+#
+# Výsledkem výpočtu je pole s tvarem (počet vzorků, *tvar stavu), které
+# může být předalokováno volajícím. Funkce sweep počítá celé mapy
+# parametrů najednou, počáteční stavy i parametry se rozšíří na společný
+# tvar dávky:
+#
+# c = np.linspace(2.0, 5.0, 256)
+# points = sweep(lorenz, (1.0, 0.5, 1.05), (10, 28, c), 0.025, range(0, 2560, 10))
+
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any
+
+import numpy as np
+
+# funkce pro výpočet derivací stavu: f(state, *params) -> derivace
+Derivative = Callable[..., np.ndarray]
+
+# funkce pro výpočet dalšího bodu diskrétního systému: f(state, *params) -> stav
+MapFunction = Callable[..., np.ndarray]
+
+# koeficienty metody Dormand-Prince 5(4)
+DP_C = (0.0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1.0)
+DP_A = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+# rozdíl vah řešení pátého a čtvrtého řádu pro odhad chyby
+DP_E = (71 / 57600, 0.0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+# meze pro změnu délky kroku při adaptivním výpočtu
+MIN_FACTOR = 0.2
+MAX_FACTOR = 5.0
+SAFETY = 0.9
+
+
+def output_buffer(start: np.ndarray, n: int, out: np.ndarray | None) -> np.ndarray:
+    """Kontrola předalokovaného pole pro výsledky, případně jeho alokace."""
+    shape = (n, *start.shape)
+    if out is None:
+        return np.empty(shape, dtype=np.float64)
+    if out.shape != shape:
+        raise ValueError(f"Output buffer has shape {out.shape}, expected {shape}")
+    return out
+
+
+def rk4_step(f: Derivative, state: np.ndarray, dt: float, params: tuple[Any, ...]) -> np.ndarray:
+    """Jeden krok klasické metody Runge-Kutta čtvrtého řádu."""
+    k1 = f(state, *params)
+    k2 = f(state + (0.5 * dt) * k1, *params)
+    k3 = f(state + (0.5 * dt) * k2, *params)
+    k4 = f(state + dt * k3, *params)
+    return state + (dt / 6.0) * (k1 + 2.0 * (k2 + k3) + k4)
+
+
+def integrate_samples(
+    f: Derivative,
+    start: Any,
+    dt: float,
+    indices: Any,
+    params: tuple[Any, ...] = (),
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Výpočet stavů po zadaných počtech kroků metody Runge-Kutta.
+
+    Indexy kroků musí tvořit neklesající posloupnost, ukládají se jen stavy
+    po těchto krocích, nikoli celá trajektorie.
+    """
+    state = np.array(start, dtype=np.float64)
+    out = output_buffer(state, len(indices), out)
+    step = 0
+    for i, index in enumerate(indices):
+        for _ in range(index - step):
+            state = rk4_step(f, state, dt, params)
+        step = index
+        out[i] = state
+    return out
+
+
+def rk4(
+    f: Derivative,
+    start: Any,
+    dt: float,
+    n: int,
+    params: tuple[Any, ...] = (),
+    every: int = 1,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Výpočet n vzorků trajektorie metodou Runge-Kutta s pevnou délkou kroku.
+
+    Prvním vzorkem je počáteční stav, mezi dvěma vzorky se provede every
+    kroků délky dt, takže se ukládají jen potřebné body trajektorie.
+    """
+    return integrate_samples(f, start, dt, range(0, n * every, every), params, out)
+
+
+def number_of_workers(workers: int | None = None) -> int:
+    """Počet procesů pro výpočet, nula nebo None znamená jeden proces na jádro CPU."""
+    if not workers:
+        return os.cpu_count() or 1
+    return workers
+
+
+def sweep(
+    f: Derivative,
+    starts: Any,
+    params: tuple[Any, ...],
+    dt: float,
+    indices: Any,
+    workers: int | None = 1,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Výpočet trajektorií pro dávku dvojic (počáteční stav, parametry).
+
+    Počáteční stavy s tvarem (..., 3) a parametry se rozšíří na společný
+    tvar dávky, takže lze například zadat jeden počáteční stav a pole
+    s hodnotami parametru. Celá dávka se počítá metodou Runge-Kutta jako
+    jediné pole, ukládají se jen stavy po krocích s indexy indices.
+    Výsledkem je pole s tvarem (len(indices), *tvar dávky, 3). Při více
+    procesech se dávka rozdělí na stejně velké části, funkce f musí být
+    v tomto případě definována na úrovni modulu.
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    batch = np.broadcast_shapes(starts.shape[:-1], *(np.shape(p) for p in params))
+    size = int(np.prod(batch))
+    state = np.broadcast_to(starts, (*batch, starts.shape[-1])).reshape(size, -1)
+    flat_params = tuple(
+        np.broadcast_to(p, batch).reshape(size) if np.ndim(p) else p for p in params
+    )
+
+    out = output_buffer(np.empty((*batch, state.shape[-1])), len(indices), out)
+    if not out.flags.c_contiguous:
+        raise ValueError("Output buffer has to be C-contiguous")
+    flat_out = out.reshape(len(indices), size, -1)
+
+    workers = min(number_of_workers(workers), size)
+    if workers <= 1:
+        integrate_samples(f, state, dt, indices, flat_params, flat_out)
+        return out
+
+    # rozdělení dávky mezi procesy, každý počítá souvislou část dávky
+    bounds = np.linspace(0, size, workers + 1).astype(int)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                integrate_samples,
+                f,
+                state[lo:hi],
+                dt,
+                indices,
+                tuple(p[lo:hi] if np.ndim(p) else p for p in flat_params),
+            ): (lo, hi)
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+        }
+        for future in as_completed(futures):
+            lo, hi = futures[future]
+            flat_out[:, lo:hi] = future.result()
+    return out
+
+
+def dormand_prince(
+    f: Derivative,
+    start: Any,
+    times: np.ndarray,
+    params: tuple[Any, ...] = (),
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+    first_step: float = 1e-3,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Výpočet trajektorie adaptivní metodou Dormand-Prince 5(4).
+
+    Délka kroku se řídí odhadem lokální chyby, takže kroky bývají mnohem
+    delší než vzdálenost mezi požadovanými časy. Stav v rostoucích časech
+    times se dopočítá Hermitovou interpolací mezi začátkem a koncem
+    kroku, prvním časem je čas počátečního stavu. Všechny trajektorie
+    sdílí stejnou délku kroku, určuje ji trajektorie s největší chybou.
+    Shodné časy jsou povoleny, vzorky v nich jsou stejné.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if np.any(np.diff(times) < 0.0):
+        raise ValueError("Times must not decrease")
+    state = np.array(start, dtype=np.float64)
+    out = output_buffer(state, len(times), out)
+    if len(times) == 0:
+        return out
+    out[0] = state
+
+    # tvar pole s parametrem interpolace, který se rozšíří na tvar stavu
+    theta_shape = (-1,) + (1,) * state.ndim
+    t = float(times[0])
+    t_end = float(times[-1])
+    h = first_step
+    index = 1
+    # derivace ve všech stupních metody, první stupeň je derivace v počátečním stavu
+    k = [f(state, *params)] * 7
+    while index < len(times):
+        # zbývající časy jsou shodné s časem stavu, krok nulové délky nelze provést
+        if t >= t_end:
+            out[index:] = state
+            break
+        last = h >= t_end - t
+        if last:
+            h = t_end - t
+
+        # jednotlivé stupně metody, sedmý stupeň je derivace v novém stavu
+        for stage in range(1, 7):
+            increment = sum(a * k[j] for j, a in enumerate(DP_A[stage]) if a)
+            k[stage] = f(state + h * increment, *params)
+        new_state = state + h * increment
+
+        # odhad chyby vztažený k toleranci, rozhoduje maximum přes všechny složky
+        error = h * sum(e * k[j] for j, e in enumerate(DP_E) if e)
+        scale = atol + rtol * np.maximum(np.abs(state), np.abs(new_state))
+        error_norm = float(np.max(np.abs(error) / scale))
+        if not np.isfinite(error_norm):
+            raise ValueError("Integration diverges")
+
+        if error_norm <= 1.0:
+            t_new = t_end if last else t + h
+            end = len(times) if last else int(np.searchsorted(times, t_new, side="right"))
+            if end > index:
+                theta = ((times[index:end] - t) / h).reshape(theta_shape)
+                theta2 = theta * theta
+                out[index:end] = (
+                    (1.0 + 2.0 * theta) * (1.0 - theta) ** 2 * state
+                    + theta * (1.0 - theta) ** 2 * h * k[0]
+                    + theta2 * (3.0 - 2.0 * theta) * new_state
+                    + theta2 * (theta - 1.0) * h * k[6]
+                )
+                index = end
+            t = t_new
+            state = new_state
+            k[0] = k[6]
+
+        # nová délka kroku podle odhadu chyby
+        factor = SAFETY * error_norm ** -0.2 if error_norm > 0.0 else MAX_FACTOR
+        h *= min(MAX_FACTOR, max(MIN_FACTOR, factor))
+    return out
+
+
+def iterate_map(
+    f: MapFunction,
+    start: Any,
+    n: int,
+    params: tuple[Any, ...] = (),
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Výpočet n bodů diskrétního systému, prvním bodem je počáteční stav."""
+    state = np.array(start, dtype=np.float64)
+    out = output_buffer(state, n, out)
+    if n == 0:
+        return out
+    out[0] = state
+    for i in range(1, n):
+        out[i] = state = f(state, *params)
+    return out
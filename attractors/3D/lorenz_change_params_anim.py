@@ -25,55 +25,55 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import sweep
 
-def lorenz(x, y, z, s=10, r=2.0, b=2.667):
-    """Výpočet dalšího bodu Lorenzova atraktoru."""
+
+def lorenz(state, s=10, r=2.0, b=2.667):
+    """Výpočet derivací stavu Lorenzova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
     x_dot = s * (y - x)
     y_dot = r * x - y - x * z
     z_dot = x * y - b * z
-    return x_dot, y_dot, z_dot
+    return np.stack((x_dot, y_dot, z_dot), axis=-1)
 
 
 # krok (změna času)
 dt = 0.01
 
-# celkový počet vypočtených bodů na Lorenzově atraktoru
+# celkový počet kroků na Lorenzově atraktoru
 n = 20000
 
+# indexy bodů, které se vykreslí: na začátku se trajektorie mění rychle,
+# později se blíží k pevným bodům a stačí každý desátý bod
+indices = np.concatenate((np.arange(1000), np.arange(1000, n, 10)))
 
-def draw_lorenz_for_input_values(ax, dt, n, x0, y0, z0, r):
-    # prozatím prázdné pole připravené pro výpočet
-    x = np.zeros((n,))
-    y = np.zeros((n,))
-    z = np.zeros((n,))
+# počet procesů pro výpočet, None znamená jeden proces na jádro CPU
+workers = 1
 
-    # počáteční hodnoty
-    x[0], y[0], z[0] = (x0, y0, z0)
 
-    # vlastní výpočet atraktoru
-    for i in range(n - 1):
-        x_dot, y_dot, z_dot = lorenz(x[i], y[i], z[i], r=r)
-        x[i + 1] = x[i] + x_dot * dt
-        y[i + 1] = y[i] + y_dot * dt
-        z[i + 1] = z[i] + z_dot * dt
+def lorenz_sweep(r_values):
+    """Výpočet trajektorií pro všechny hodnoty r a počáteční souřadnice y0 a z0.
 
-    # vykreslení grafu
-    ax.plot(y.copy(), z.copy())
+    Výsledkem je pole s tvarem (počet bodů, počet hodnot r, 49, 3).
+    """
+    x0 = 0.0
+    starts = [
+        (x0, y0, z0) for y0 in np.linspace(-15.0, 15.0, 7) for z0 in np.linspace(-10.0, 20.0, 7)
+    ]
+    # dávka má tvar (počet hodnot r, 49), všechny trajektorie se vypočtou současně
+    r = np.reshape(r_values, (-1, 1))
+    return sweep(lorenz, starts, (10, r), dt, indices, workers)
 
 
-def attractor_for_r(r):
+def attractor_for_r(r, points):
     # konstrukce 2D grafu
     fig = plt.figure(figsize=(8, 6))
     ax = fig.gca()
     ax.set_xlim(-20, 20)
     ax.set_ylim(-10, 30)
 
-
     # vykreslení Lorenzova atraktoru s různými počátečními souřadnicemi x0 a y0
-    x0 = 0.0
-    for y0 in np.linspace(-15.0, 15.0, 7):
-        for z0 in np.linspace(-10.0, 20.0, 7):
-            draw_lorenz_for_input_values(ax, dt, n, x0, y0, z0, r)
+    ax.plot(points[..., 1], points[..., 2])
 
     plt.grid()
     # změna velikosti komponent v grafu.
@@ -87,5 +87,8 @@ def attractor_for_r(r):
     plt.close()
 
 
-for r in np.linspace(1.0, 10.0, 5):
-    attractor_for_r(r)
+if __name__ == "__main__":
+    r_values = np.linspace(1.0, 10.0, 5)
+    points = lorenz_sweep(r_values)
+    for i, r in enumerate(r_values):
+        attractor_for_r(r, points[:, i])
@@ -25,13 +25,16 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import dormand_prince
 
-def lorenz(x, y, z, s=10, r=2.0, b=2.667):
-    """Výpočet dalšího bodu Lorenzova atraktoru."""
+
+def lorenz(state, s=10, r=2.0, b=2.667):
+    """Výpočet derivací stavu Lorenzova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
     x_dot = s * (y - x)
     y_dot = r * x - y - x * z
     z_dot = x * y - b * z
-    return x_dot, y_dot, z_dot
+    return np.stack((x_dot, y_dot, z_dot), axis=-1)
 
 
 # krok (změna času)
@@ -41,27 +44,15 @@ dt = 0.01
 n = 250
 
 
-def draw_lorenz_for_input_values(ax, dt, n, x0, y0, z0, r, skip):
-    # prozatím prázdné pole připravené pro výpočet
-    x = np.zeros((n,))
-    y = np.zeros((n,))
-    z = np.zeros((n,))
-
-    # počáteční hodnoty
-    x[0], y[0], z[0] = (x0, y0, z0)
-
-    # vlastní výpočet atraktoru
-    for i in range(n - 1):
-        x_dot, y_dot, z_dot = lorenz(x[i], y[i], z[i], r=r)
-        x[i + 1] = x[i] + x_dot * dt
-        y[i + 1] = y[i] + y_dot * dt
-        z[i + 1] = z[i] + z_dot * dt
-
-    # vykreslení grafu
-    ax.plot(y.copy()[skip:skip+20], z.copy()[skip:skip+20])
-
-
 def anim_attractor_for_r(r):
+    # vykreslení Lorenzova atraktoru s různými počátečními souřadnicemi x0 a y0,
+    # trajektorie se vypočtou jen jednou pro všechny snímky animace
+    x0 = 0.0
+    starts = [
+        (x0, y0, z0) for y0 in np.linspace(-15.0, 15.0, 7) for z0 in np.linspace(-10.0, 20.0, 7)
+    ]
+    points = dormand_prince(lorenz, starts, np.arange(n) * dt, (10, r))
+
     # konstrukce 2D grafu
     for skip in range(n-50):
         fig = plt.figure(figsize=(4, 3))
@@ -69,12 +60,7 @@ def anim_attractor_for_r(r):
         ax.set_xlim(-20, 20)
         ax.set_ylim(-10, 30)
 
-
-        # vykreslení Lorenzova atraktoru s různými počátečními souřadnicemi x0 a y0
-        x0 = 0.0
-        for y0 in np.linspace(-15.0, 15.0, 7):
-            for z0 in np.linspace(-10.0, 20.0, 7):
-                draw_lorenz_for_input_values(ax, dt, n, x0, y0, z0, r, skip)
+        ax.plot(points[skip:skip+20, :, 1], points[skip:skip+20, :, 2])
 
         plt.grid()
         # změna velikosti komponent v grafu.
@@ -25,13 +25,16 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import dormand_prince
 
-def lorenz(x, y, z, s=10, r=28, b=2.667):
-    """Výpočet dalšího bodu Lorenzova atraktoru."""
+
+def lorenz(state, s=10, r=28, b=2.667):
+    """Výpočet derivací stavu Lorenzova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
     x_dot = s * (y - x)
     y_dot = r * x - y - x * z
     z_dot = x * y - b * z
-    return x_dot, y_dot, z_dot
+    return np.stack((x_dot, y_dot, z_dot), axis=-1)
 
 
 # krok (změna času)
@@ -40,41 +43,26 @@ dt = 0.01
 # celkový počet vypočtených bodů na Lorenzově atraktoru
 n = 1000
 
+b = 2.667
 
-def draw_lorenz_for_input_values(ax, dt, n, x0, y0, z0, s, r, b):
-    # prozatím prázdné pole připravené pro výpočet
-    x = np.zeros((n,))
-    y = np.zeros((n,))
-    z = np.zeros((n,))
-
-    # počáteční hodnoty
-    x[0], y[0], z[0] = (x0, y0, z0)
-
-    # vlastní výpočet atraktoru
-    for i in range(n - 1):
-        x_dot, y_dot, z_dot = lorenz(x[i], y[i], z[i], s, r, b)
-        x[i + 1] = x[i] + x_dot * dt
-        y[i + 1] = y[i] + y_dot * dt
-        z[i + 1] = z[i] + z_dot * dt
-
-    # vykreslení grafu
-    ax.plot(y.copy(), z.copy())
+# parametry s a r pro všechny podgrafy, které se vypočtou současně
+ri, si = np.divmod(np.arange(25), 5)
+s = si * 2.0 + 1.0
+r = 4.0 + ri * 4
+starts = np.tile((0.0, 1.0, 1.05), (len(s), 1))
 
+# vlastní výpočet atraktoru, výsledkem je pole s tvarem (n, počet trajektorií, 3)
+points = dormand_prince(lorenz, starts, np.arange(n) * dt, (s, r, b))
 
 # konstrukce 2D grafu
 fig = plt.figure(figsize=(8, 6))
 
-b = 2.667
-
 # vykreslení Lorenzova atraktoru s různými parametry s a r
-for si in range(5):
-    for ri in range(5):
-        ax = fig.add_subplot(5, 5, si + 1 + ri * 5)
-        ax.axes.get_xaxis().set_visible(False)
-        ax.axes.get_yaxis().set_visible(False)
-        draw_lorenz_for_input_values(
-            ax, dt, n, 0.0, 1.0, 1.05, si * 2.0 + 1.0, 4.0 + ri * 4, b
-        )
+for i in range(len(s)):
+    ax = fig.add_subplot(5, 5, i + 1)
+    ax.axes.get_xaxis().set_visible(False)
+    ax.axes.get_yaxis().set_visible(False)
+    ax.plot(points[:, i, 1], points[:, i, 2])
 
 # změna velikosti komponent v grafu.
 plt.tight_layout()
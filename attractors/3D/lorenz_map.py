@@ -31,13 +31,16 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from integrator import dormand_prince, sweep
 
-def lorenz(x, y, z, s=10, r=28, b=2.667):
-    """Výpočet dalšího bodu Lorenzova atraktoru."""
+
+def lorenz(state, s=10, r=28, b=2.667):
+    """Výpočet derivací stavu Lorenzova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
     x_dot = s * (y - x)
     y_dot = r * x - y - x * z
     z_dot = x * y - b * z
-    return x_dot, y_dot, z_dot
+    return np.stack((x_dot, y_dot, z_dot), axis=-1)
 
 
 # krok (změna času)
@@ -46,20 +49,8 @@ dt = 0.005
 # celkový počet vypočtených bodů na Lorenzově atraktoru
 n = 20000
 
-# prozatím prázdné pole připravené pro výpočet
-x = np.zeros((n,))
-y = np.zeros((n,))
-z = np.zeros((n,))
-
-# počáteční hodnoty
-x[0], y[0], z[0] = (0.0, 0.5, 1.05)
-
-# vlastní výpočet atraktoru
-for i in range(n - 1):
-    x_dot, y_dot, z_dot = lorenz(x[i], y[i], z[i])
-    x[i + 1] = x[i] + x_dot * dt
-    y[i + 1] = y[i] + y_dot * dt
-    z[i + 1] = z[i] + z_dot * dt
+# vlastní výpočet atraktoru adaptivní metodou, výsledkem je pole s tvarem (n, 3)
+x, y, z = dormand_prince(lorenz, (0.0, 0.5, 1.05), np.arange(n) * dt).T
 
 WIDTH = 256
 HEIGHT = 256
@@ -73,23 +64,21 @@ oy = min(y)
 az = 255.0 / (max(z) - min(z))
 oz = min(z)
 
-# vytvoření mapy
-for yi in range(HEIGHT):
-    # počáteční hodnoty
-    x[0], y[0], z[0] = (1.0, 0.5, 1.05)
-
-    # vlastní výpočet atraktoru
-    c = 2.0 + yi / 80.0
-    for i in range(n - 1):
-        x_dot, y_dot, z_dot = lorenz(x[i], y[i], z[i], 10, 28, c)
-        x[i + 1] = x[i] + x_dot * dt
-        y[i + 1] = y[i] + y_dot * dt
-        z[i + 1] = z[i] + z_dot * dt
-
-    for xi in range(WIDTH):
-        raster[yi][xi][0] = (x[xi * 50] - ox) * ax
-        raster[yi][xi][1] = (y[xi * 50] - oy) * ay
-        raster[yi][xi][2] = (z[xi * 50] - oz) * az
+# krok metody Runge-Kutta a počet kroků mezi dvěma sloupci mapy, sloupce
+# odpovídají každému padesátému bodu trajektorie s krokem dt
+step = 5 * dt
+every = 10
+
+offset = np.array((ox, oy, oz))
+scale = np.array((ax, ay, az))
+
+# vytvoření mapy, každý řádek mapy odpovídá jedné hodnotě parametru c
+c = 2.0 + np.arange(HEIGHT) / 80.0
+
+# vlastní výpočet atraktoru pro všechny řádky současně, vypočtou se jen body
+# potřebné pro mapu, tedy stav po každých every krocích
+points = sweep(lorenz, (1.0, 0.5, 1.05), (10, 28, c), step, np.arange(WIDTH) * every)
+raster[:] = (points.transpose(1, 0, 2) - offset) * scale
 
 
 plt.figure(1, figsize=(8, 6), dpi=100)
@@ -0,0 +1,608 @@
+#!/usr/bin/env python
+
+"""Průzkum prostoru parametrů podivných atraktorů pomocí Ljapunovova exponentu."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+# Pro každou dvojici parametrů z pravidelné mřížky se vypočte největší
+# Ljapunovův exponent. Kladné hodnoty značí chaotické chování, tedy
+# zajímavý podivný atraktor, záporné hodnoty pevný bod nebo cyklus.
+# Tečný vektor se u diskrétních systémů násobí Jacobiho maticí zobrazení,
+# u spojitých systémů se variační rovnice integrují metodou Runge-Kutta
+# společně se stavem (stejně jako v 3D/integrator.py). Výpočet probíhá
+# současně pro všechny body mřížky, mřížka se může rozdělit mezi procesy.
+#
+# Místo mapy exponentů lze vykreslit i bifurkační diagram pro jeden
+# parametr. U spojitých systémů se do diagramu vynášejí lokální maxima
+# zvolené souřadnice.
+#
+# Příklady použití:
+#
+# python parameter_explorer.py de_jong --x a -3 3 --y b -3 3
+# python parameter_explorer.py lorenz --x r 0 200 --y b 0 5 --width 128 --height 128
+# python parameter_explorer.py rossler --x c 2 20 --bifurcation --coordinate 0
+
+import argparse
+import csv
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from time import time
+from typing import Any
+
+import numpy as np
+
+# pomocné funkce se sdílejí se skripty pro 3D atraktory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "3D"))
+
+from integrator import number_of_workers  # noqa: E402
+
+# rozsah parametru (min, max)
+Range = tuple[float, float]
+
+# parametrické sady s exponentem větším než tato hodnota se považují za chaotické
+CHAOS_THRESHOLD = 1e-3
+
+# názvy souřadnic stavu
+COORDINATES = "xyz"
+
+
+def matrix(rows: Any) -> np.ndarray:
+    """Sestavení pole Jacobiho matic z prvků, kterými mohou být skaláry i pole."""
+    elements = np.broadcast_arrays(*(element for row in rows for element in row))
+    size = len(rows)
+    return np.stack(elements, axis=-1).reshape(*elements[0].shape, size, size)
+
+
+def de_jong(state: np.ndarray, a: Any, b: Any, c: Any, d: Any) -> np.ndarray:
+    """Výpočet dalšího bodu De Jongova atraktoru."""
+    x, y = np.moveaxis(state, -1, 0)
+    return np.stack((np.sin(a * y) - np.cos(b * x), np.sin(c * x) - np.cos(d * y)), axis=-1)
+
+
+def de_jong_jacobian(state: np.ndarray, a: Any, b: Any, c: Any, d: Any) -> np.ndarray:
+    """Jacobiho matice zobrazení De Jongova atraktoru."""
+    x, y = np.moveaxis(state, -1, 0)
+    return matrix(
+        (
+            (b * np.sin(b * x), a * np.cos(a * y)),
+            (c * np.cos(c * x), d * np.sin(d * y)),
+        )
+    )
+
+
+def fractal_dream(state: np.ndarray, a: Any, b: Any, c: Any, d: Any) -> np.ndarray:
+    """Výpočet dalšího bodu atraktoru Fractal Dream."""
+    x, y = np.moveaxis(state, -1, 0)
+    return np.stack((np.sin(b * y) - c * np.sin(b * x), np.sin(a * x) - d * np.sin(a * y)), axis=-1)
+
+
+def fractal_dream_jacobian(state: np.ndarray, a: Any, b: Any, c: Any, d: Any) -> np.ndarray:
+    """Jacobiho matice zobrazení atraktoru Fractal Dream."""
+    x, y = np.moveaxis(state, -1, 0)
+    return matrix(
+        (
+            (-c * b * np.cos(b * x), b * np.cos(b * y)),
+            (a * np.cos(a * x), -d * a * np.cos(a * y)),
+        )
+    )
+
+
+def clifford(state: np.ndarray, a: Any, b: Any, c: Any, d: Any) -> np.ndarray:
+    """Výpočet dalšího bodu Cliffordova atraktoru."""
+    x, y = np.moveaxis(state, -1, 0)
+    return np.stack((np.sin(a * y) + c * np.cos(a * x), np.sin(b * x) + d * np.cos(b * y)), axis=-1)
+
+
+def clifford_jacobian(state: np.ndarray, a: Any, b: Any, c: Any, d: Any) -> np.ndarray:
+    """Jacobiho matice zobrazení Cliffordova atraktoru."""
+    x, y = np.moveaxis(state, -1, 0)
+    return matrix(
+        (
+            (-c * a * np.sin(a * x), a * np.cos(a * y)),
+            (b * np.cos(b * x), -d * b * np.sin(b * y)),
+        )
+    )
+
+
+def lorenz(state: np.ndarray, s: Any, r: Any, b: Any) -> np.ndarray:
+    """Výpočet derivací stavu Lorenzova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
+    return np.stack((s * (y - x), r * x - y - x * z, x * y - b * z), axis=-1)
+
+
+def lorenz_jacobian(state: np.ndarray, s: Any, r: Any, b: Any) -> np.ndarray:
+    """Jacobiho matice Lorenzova systému."""
+    x, y, z = np.moveaxis(state, -1, 0)
+    return matrix(((-s, s, 0.0), (r - z, -1.0, -x), (y, x, -b)))
+
+
+def rossler(state: np.ndarray, a: Any, b: Any, c: Any) -> np.ndarray:
+    """Výpočet derivací stavu Rosslerova atraktoru."""
+    x, y, z = np.moveaxis(state, -1, 0)
+    return np.stack((-y - z, x + a * y, b + z * (x - c)), axis=-1)
+
+
+def rossler_jacobian(state: np.ndarray, a: Any, b: Any, c: Any) -> np.ndarray:
+    """Jacobiho matice Rosslerova systému."""
+    x, y, z = np.moveaxis(state, -1, 0)
+    return matrix(((0.0, -1.0, -1.0), (1.0, a, 0.0), (z, 0.0, x - c)))
+
+
+# registrované systémy, výchozí parametry odpovídají skriptům v adresářích 2D a 3D
+SYSTEMS: dict[str, dict[str, Any]] = {
+    "de_jong": {
+        "kind": "map",
+        "function": de_jong,
+        "jacobian": de_jong_jacobian,
+        "params": {"a": -2.7, "b": -0.09, "c": -0.86, "d": -2.20},
+        "start": (0.0, 0.0),
+        "iterations": 1000,
+        "settle_down": 200,
+    },
+    "fractal_dream": {
+        "kind": "map",
+        "function": fractal_dream,
+        "jacobian": fractal_dream_jacobian,
+        "params": {"a": -0.97, "b": 2.88, "c": 0.77, "d": 0.74},
+        "start": (0.1, 0.0),
+        "iterations": 1000,
+        "settle_down": 200,
+    },
+    "clifford": {
+        "kind": "map",
+        "function": clifford,
+        "jacobian": clifford_jacobian,
+        "params": {"a": -1.4, "b": 1.6, "c": 1.0, "d": 0.7},
+        "start": (0.1, 0.0),
+        "iterations": 1000,
+        "settle_down": 200,
+    },
+    "lorenz": {
+        "kind": "flow",
+        "function": lorenz,
+        "jacobian": lorenz_jacobian,
+        "params": {"s": 10.0, "r": 28.0, "b": 2.667},
+        "start": (0.0, 1.0, 1.05),
+        "dt": 0.01,
+        "iterations": 5000,
+        "settle_down": 1000,
+    },
+    "rossler": {
+        "kind": "flow",
+        "function": rossler,
+        "jacobian": rossler_jacobian,
+        "params": {"a": 0.2, "b": 0.2, "c": 5.7},
+        "start": (0.1, 0.1, 6.0),
+        "dt": 0.02,
+        "iterations": 10000,
+        "settle_down": 5000,
+    },
+}
+
+
+def initial_state(system: dict[str, Any], params: tuple[Any, ...]) -> np.ndarray:
+    """Počáteční stav pro všechny parametrické sady v dávce."""
+    batch = np.broadcast_shapes(*(np.shape(p) for p in params))
+    start = np.asarray(system["start"], dtype=np.float64)
+    return np.broadcast_to(start, (*batch, len(start))).copy()
+
+
+def step(system: dict[str, Any], state: np.ndarray, params: tuple[Any, ...]) -> np.ndarray:
+    """Jeden krok systému, u spojitých systémů metodou Runge-Kutta."""
+    f = system["function"]
+    if system["kind"] == "map":
+        return f(state, *params)
+    dt = system["dt"]
+    k1 = f(state, *params)
+    k2 = f(state + (0.5 * dt) * k1, *params)
+    k3 = f(state + (0.5 * dt) * k2, *params)
+    k4 = f(state + dt * k3, *params)
+    return state + (dt / 6.0) * (k1 + 2.0 * (k2 + k3) + k4)
+
+
+def tangent_step(
+    system: dict[str, Any], state: np.ndarray, tangent: np.ndarray, params: tuple[Any, ...]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Jeden krok systému společně s tečným vektorem."""
+    f = system["function"]
+    jacobian = system["jacobian"]
+
+    def derivatives(x: np.ndarray, v: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return f(x, *params), np.einsum("...ij,...j->...i", jacobian(x, *params), v)
+
+    if system["kind"] == "map":
+        return derivatives(state, tangent)
+
+    # variační rovnice dv/dt = J(x) v se integrují spolu se stavem
+    dt = system["dt"]
+    k1x, k1v = derivatives(state, tangent)
+    k2x, k2v = derivatives(state + (0.5 * dt) * k1x, tangent + (0.5 * dt) * k1v)
+    k3x, k3v = derivatives(state + (0.5 * dt) * k2x, tangent + (0.5 * dt) * k2v)
+    k4x, k4v = derivatives(state + dt * k3x, tangent + dt * k3v)
+    return (
+        state + (dt / 6.0) * (k1x + 2.0 * (k2x + k3x) + k4x),
+        tangent + (dt / 6.0) * (k1v + 2.0 * (k2v + k3v) + k4v),
+    )
+
+
+def lyapunov_exponents(
+    name: str, params: tuple[Any, ...], iterations: int, settle_down: int
+) -> np.ndarray:
+    """Největší Ljapunovův exponent pro dávku parametrických sad.
+
+    Parametry mohou být skaláry nebo pole, výsledek má jejich společný tvar.
+    Exponent se u diskrétních systémů vztahuje k jedné iteraci, u spojitých
+    k jednotce času. Divergující orbity mají exponent NaN.
+    """
+    system = SYSTEMS[name]
+    state = initial_state(system, params)
+    with np.errstate(all="ignore"):
+        for _ in range(settle_down):
+            state = step(system, state, params)
+
+        tangent = np.full(state.shape, 1.0 / np.sqrt(state.shape[-1]))
+        total = np.zeros(state.shape[:-1])
+        for _ in range(iterations):
+            state, tangent = tangent_step(system, state, tangent, params)
+            # tečný vektor se po každém kroku normalizuje, sčítá se logaritmus jeho délky
+            norm = np.linalg.norm(tangent, axis=-1)
+            total += np.log(norm)
+            tangent /= norm[..., np.newaxis]
+
+    exponents = total / (iterations * system.get("dt", 1.0))
+    return np.where(np.isfinite(exponents), exponents, np.nan)
+
+
+def bifurcation_points(
+    name: str, params: tuple[Any, ...], coordinate: int, iterations: int, settle_down: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Body bifurkačního diagramu pro dávku parametrických sad s tvarem (n,).
+
+    Vrací indexy parametrických sad a k nim příslušné hodnoty zvolené
+    souřadnice. U diskrétních systémů se použijí všechny iterace, u spojitých
+    jen lokální maxima souřadnice.
+    """
+    system = SYSTEMS[name]
+    state = initial_state(system, params)
+    indices = []
+    values = []
+    with np.errstate(all="ignore"):
+        for _ in range(settle_down):
+            state = step(system, state, params)
+
+        before = previous = state[..., coordinate]
+        for _ in range(iterations):
+            state = step(system, state, params)
+            value = state[..., coordinate]
+            if system["kind"] == "map":
+                found = np.isfinite(value)
+                indices.append(np.flatnonzero(found))
+                values.append(value[found])
+            else:
+                found = (previous > before) & (previous >= value)
+                indices.append(np.flatnonzero(found))
+                values.append(previous[found])
+            before, previous = previous, value
+    return np.concatenate(indices), np.concatenate(values)
+
+
+def run_batches(
+    function: Callable[..., Any],
+    name: str,
+    params: tuple[Any, ...],
+    size: int,
+    workers: int | None,
+    *args: Any,
+) -> list[tuple[int, Any]]:
+    """Výpočet pro dávku parametrických sad rozdělenou mezi procesy.
+
+    Pole s parametry mají tvar (size,), každý proces dostane souvislou
+    část dávky. Vrací dvojice (index první sady v části, výsledek funkce).
+    """
+    workers = max(1, min(number_of_workers(workers), size))
+    bounds = np.linspace(0, size, workers + 1).astype(int)
+    parts = [
+        (int(lo), tuple(p[lo:hi] if np.ndim(p) else p for p in params))
+        for lo, hi in zip(bounds[:-1], bounds[1:])
+    ]
+    if workers == 1:
+        return [(0, function(name, params, *args))]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [(lo, executor.submit(function, name, part, *args)) for lo, part in parts]
+        return [(lo, future.result()) for lo, future in futures]
+
+
+def parameter_values(
+    name: str, overrides: dict[str, float], grid: dict[str, np.ndarray]
+) -> tuple[Any, ...]:
+    """Parametry systému v pořadí, v jakém je očekává jeho funkce."""
+    defaults = SYSTEMS[name]["params"]
+    return tuple(grid.get(key, overrides.get(key, value)) for key, value in defaults.items())
+
+
+def lyapunov_map(
+    name: str,
+    x_param: str,
+    x_range: Range,
+    y_param: str,
+    y_range: Range,
+    width: int,
+    height: int,
+    overrides: dict[str, float],
+    iterations: int,
+    settle_down: int,
+    workers: int | None = 1,
+) -> tuple[np.ndarray, tuple[Any, ...]]:
+    """Mapa největšího Ljapunovova exponentu na mřížce dvou parametrů.
+
+    Mapa má tvar (height, width) a její první řádek odpovídá minimu druhého
+    parametru. Vrací se i parametry všech bodů mřížky ve tvaru (height, width).
+    """
+    xs, ys = np.meshgrid(np.linspace(*x_range, width), np.linspace(*y_range, height))
+    grid = {x_param: xs.ravel(), y_param: ys.ravel()}
+    params = parameter_values(name, overrides, grid)
+
+    exponents = np.empty(width * height)
+    for lo, part in run_batches(
+        lyapunov_exponents, name, params, width * height, workers, iterations, settle_down
+    ):
+        exponents[lo : lo + len(part)] = part
+
+    shape = (height, width)
+    grid_params = tuple(np.broadcast_to(p, (width * height,)).reshape(shape) for p in params)
+    return exponents.reshape(shape), grid_params
+
+
+def chaotic_parameter_sets(
+    name: str, exponents: np.ndarray, grid_params: tuple[Any, ...], top: int
+) -> list[dict[str, float]]:
+    """Seznam chaotických parametrických sad seřazený podle exponentu sestupně."""
+    flat = exponents.ravel()
+    chaotic = np.flatnonzero(flat > CHAOS_THRESHOLD)
+    ranked = chaotic[np.argsort(-flat[chaotic], kind="stable")][:top]
+    names = list(SYSTEMS[name]["params"])
+    return [
+        {
+            **{key: float(p.ravel()[i]) for key, p in zip(names, grid_params)},
+            "exponent": float(flat[i]),
+        }
+        for i in ranked
+    ]
+
+
+def bifurcation_diagram(
+    name: str,
+    x_param: str,
+    x_range: Range,
+    coordinate: int,
+    width: int,
+    height: int,
+    overrides: dict[str, float],
+    iterations: int,
+    settle_down: int,
+    workers: int | None = 1,
+) -> tuple[np.ndarray, Range]:
+    """Histogram bifurkačního diagramu s tvarem (height, width) a rozsah souřadnice."""
+    grid = {x_param: np.linspace(*x_range, width)}
+    params = parameter_values(name, overrides, grid)
+
+    columns = []
+    values = []
+    for lo, (indices, part) in run_batches(
+        bifurcation_points, name, params, width, workers, coordinate, iterations, settle_down
+    ):
+        columns.append(indices + lo)
+        values.append(part)
+    column = np.concatenate(columns)
+    value = np.concatenate(values)
+    if len(value) == 0:
+        raise ValueError("No points of bifurcation diagram found")
+
+    value_range = (float(value.min()), float(value.max()))
+    if value_range[0] == value_range[1]:
+        value_range = (value_range[0] - 0.5, value_range[1] + 0.5)
+    histogram, _, _ = np.histogram2d(
+        value, column, bins=(height, width), range=(value_range, (-0.5, width - 0.5))
+    )
+    return histogram, value_range
+
+
+def save_lyapunov_map(
+    exponents: np.ndarray,
+    x_param: str,
+    x_range: Range,
+    y_param: str,
+    y_range: Range,
+    filename: str,
+) -> None:
+    """Uložení mapy exponentů, chaotické oblasti jsou červené, divergující černé."""
+    import matplotlib.pyplot as plt
+    from matplotlib import colormaps
+
+    finite = exponents[np.isfinite(exponents)]
+    limit = max(float(finite.max()), CHAOS_THRESHOLD) if len(finite) else 1.0
+    colormap = colormaps["coolwarm"].with_extremes(bad="black")
+
+    plt.figure(figsize=(8, 6))
+    plt.imshow(
+        exponents,
+        origin="lower",
+        extent=(*x_range, *y_range),
+        aspect="auto",
+        cmap=colormap,
+        vmin=-limit,
+        vmax=limit,
+        interpolation="nearest",
+    )
+    plt.colorbar(label="largest Lyapunov exponent")
+    plt.xlabel(x_param)
+    plt.ylabel(y_param)
+    plt.tight_layout()
+    plt.savefig(filename)
+    plt.close()
+
+
+def save_bifurcation_diagram(
+    histogram: np.ndarray,
+    x_param: str,
+    x_range: Range,
+    coordinate: int,
+    value_range: Range,
+    filename: str,
+) -> None:
+    """Uložení bifurkačního diagramu, intenzita odpovídá logaritmu hustoty bodů."""
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(8, 6))
+    plt.imshow(
+        np.log1p(histogram),
+        origin="lower",
+        extent=(*x_range, *value_range),
+        aspect="auto",
+        cmap="gray_r",
+        interpolation="nearest",
+    )
+    plt.xlabel(x_param)
+    plt.ylabel(COORDINATES[coordinate])
+    plt.tight_layout()
+    plt.savefig(filename)
+    plt.close()
+
+
+def save_ranking(ranking: list[dict[str, float]], filename: str) -> None:
+    """Uložení seřazeného seznamu parametrických sad do souboru CSV."""
+    with open(filename, "w", newline="") as fout:
+        writer = csv.writer(fout)
+        if not ranking:
+            return
+        writer.writerow(["rank", *ranking[0]])
+        for rank, parameter_set in enumerate(ranking, start=1):
+            writer.writerow([rank, *parameter_set.values()])
+
+
+def parse_range(parser: argparse.ArgumentParser, name: str, option: list[str]) -> tuple[str, Range]:
+    """Kontrola parametru zadaného na příkazovém řádku ve tvaru NAME MIN MAX."""
+    param, low, high = option
+    if param not in SYSTEMS[name]["params"]:
+        parser.error(f"System {name} has no parameter {param}")
+    try:
+        return param, (float(low), float(high))
+    except ValueError:
+        parser.error(f"Invalid range of parameter {param}: {low} {high}")
+
+
+def main() -> None:
+    """Function called after the script initialization."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("system", choices=sorted(SYSTEMS), help="registered system")
+    parser.add_argument(
+        "--x", nargs=3, required=True, metavar=("NAME", "MIN", "MAX"), help="horizontal parameter"
+    )
+    parser.add_argument("--y", nargs=3, metavar=("NAME", "MIN", "MAX"), help="vertical parameter")
+    parser.add_argument(
+        "--bifurcation", action="store_true", help="draw bifurcation diagram for --x parameter"
+    )
+    parser.add_argument(
+        "--coordinate", type=int, default=0, help="coordinate shown in bifurcation diagram"
+    )
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="value of parameter that is not explored",
+    )
+    parser.add_argument("--width", type=int, default=256, help="number of grid columns")
+    parser.add_argument("--height", type=int, default=256, help="number of grid rows")
+    parser.add_argument("--iterations", type=int, help="number of measured iterations")
+    parser.add_argument("--settle-down", type=int, help="number of iterations skipped")
+    parser.add_argument("--top", type=int, default=20, help="length of ranked list")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=0, help="number of worker processes, 0 for all cores"
+    )
+    parser.add_argument("-o", "--output", help="prefix of output files, system name by default")
+    args = parser.parse_args()
+
+    name = args.system
+    system = SYSTEMS[name]
+    overrides = {}
+    for option in args.param:
+        key, _, value = option.partition("=")
+        if key not in system["params"]:
+            parser.error(f"System {name} has no parameter {key}")
+        try:
+            overrides[key] = float(value)
+        except ValueError:
+            parser.error(f"Invalid value of parameter {key}: {value}")
+    iterations = args.iterations or system["iterations"]
+    settle_down = system["settle_down"] if args.settle_down is None else args.settle_down
+    prefix = args.output or name
+    x_param, x_range = parse_range(parser, name, args.x)
+
+    print(f"Exploring {name} using {number_of_workers(args.workers)} workers")
+    t1 = time()
+    if args.bifurcation:
+        if not 0 <= args.coordinate < len(system["start"]):
+            parser.error(f"System {name} has no coordinate {args.coordinate}")
+        histogram, value_range = bifurcation_diagram(
+            name,
+            x_param,
+            x_range,
+            args.coordinate,
+            args.width,
+            args.height,
+            overrides,
+            iterations,
+            settle_down,
+            args.workers,
+        )
+        save_bifurcation_diagram(
+            histogram, x_param, x_range, args.coordinate, value_range, prefix + "_bifurcation.png"
+        )
+        print(f"Calculation finished in {time() - t1:4.1f} seconds")
+        return
+
+    if args.y is None:
+        parser.error("Lyapunov map needs parameters --x and --y")
+    y_param, y_range = parse_range(parser, name, args.y)
+    if x_param == y_param:
+        parser.error("Parameters --x and --y have to differ")
+    exponents, grid_params = lyapunov_map(
+        name,
+        x_param,
+        x_range,
+        y_param,
+        y_range,
+        args.width,
+        args.height,
+        overrides,
+        iterations,
+        settle_down,
+        args.workers,
+    )
+    print(f"Calculation finished in {time() - t1:4.1f} seconds")
+
+    save_lyapunov_map(exponents, x_param, x_range, y_param, y_range, prefix + "_lyapunov.png")
+    ranking = chaotic_parameter_sets(name, exponents, grid_params, args.top)
+    save_ranking(ranking, prefix + "_lyapunov.csv")
+    for rank, parameter_set in enumerate(ranking, start=1):
+        values = ", ".join(f"{key}={value:.6g}" for key, value in parameter_set.items())
+        print(f"{rank:3d}: {values}")
+
+
+if __name__ == "__main__":
+    # call the main function
+    main()
@@ -37,9 +37,15 @@
 # blending.py:
 # Blending of two fractal images.
 #
+# colorizer.py:
+# Conversion of iteration or intensity buffers into images via palette lookup table.
+#
 # colors.py:
 # Named colors used everywhere on demo screens.
 #
+# escape_time.py:
+# Vectorized escape-time engine working on the whole grid at once.
+#
 # julia.py:
 # Renderer of the classic Julia fractal.
 #
@@ -64,6 +70,9 @@
 # julia_z^2-z_interactive.py:
 # Interactive renderer of the Julia fractal z^z-z based on Pygame.
 #
+# kernels.py:
+# Shared escape-time kernels with fast detection of points inside the set.
+#
 # lambda.py:
 # Renderer of the classic Lambda fractal.
 #
@@ -124,6 +133,9 @@
 # manowarj.py:
 # Renderer of the Manowar fractal.
 #
+# mariani_silver.py:
+# Mariani-Silver rectangle subdivision renderer for escape-time fractals.
+#
 # newton.py:
 # Renderer of the classic Newton fractal.
 #
@@ -166,3 +178,12 @@
 # phoenix_m.py:
 # Renderer of the Phoenix fractal, Mandelbrot version.
 #
+# render.py:
+# Batch renderer of fractal images described by TOML or JSON manifest.
+#
+# render_cache.py:
+# Content-addressed on-disk cache for computed buffers and rendered images.
+#
+# tile_scheduler.py:
+# Multi-process tile scheduler for fractal renderers.
+#
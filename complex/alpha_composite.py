@@ -16,45 +16,42 @@
 
 """Alpha channel-based composition of two fractals into one image."""
 
+import numpy as np
 import palette_blues
 import palette_greens
 import palette_mandmap
 from PIL import Image
 
+from colorizer import colorize_iterations
+from kernels import mandelbrot
+
 # image size specified in pixels
 IMAGE_WIDTH = 512
 IMAGE_HEIGHT = 384
 
 
-def mandelbrot(cx, cy, maxiter):
-    """Calculate number of iterations for given complex number to escape from set."""
-    c = complex(cx, cy)
-    z = 0
-    for i in range(maxiter):
-        if abs(z) > 2:
-            return i
-        z = z * z + c
-    return 0
-
-
 def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, maxiter=1000):
     """Recalculate the whole fractal and render the set into given image."""
     width, height = image.size  # image size in pixel
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    counts = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
-            i = mandelbrot(x1, y1, maxiter)
-            alpha = i  # alpha channel value is based directly on number of iterations
-            i = 3 * i % 256
-            color = (palette[i][0], palette[i][1], palette[i][2], alpha)
-            image.putpixel((x, y), color)
+            counts[y][x] = mandelbrot(x1, y1, maxiter)
             x1 += stepx
         y1 += stepy
 
+    colorize_iterations(image, counts, palette)
+
+    # alpha channel value is based directly on number of iterations
+    alpha = np.minimum(counts, 255).astype(np.uint8)
+    image.putalpha(Image.frombuffer("L", image.size, alpha.tobytes(), "raw", "L", 0, 1))
+
 
 def main():
     """Function called after the script initialization."""
@@ -18,6 +18,9 @@ from time import time
 
 from PIL import Image
 
+from colorizer import colorize_iterations
+from mariani_silver import calc_fractal_mariani_silver
+
 # image size specified in pixels
 # the size of the image should be square, and its height and width
 # should be an integer power of 2
@@ -45,23 +48,39 @@ def barnsley_j3(zx0, zy0, cx, cy, maxiter):
     return 0
 
 
-def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, cx, cy, maxiter=1000):
-    """Recalculate the whole fractal and render the set into given image."""
+def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, cx, cy, maxiter=1000, method="full"):
+    """Recalculate the whole fractal and render the set into given image.
+
+    Method "full" computes all pixels, "mariani_silver" iterates just the
+    borders of rectangles with uniform iteration counts. Return fraction of
+    pixels that were actually iterated.
+    """
     width, height = image.size  # rozmery obrazku
+    if method == "mariani_silver":
+        counts, fraction = calc_fractal_mariani_silver(
+            barnsley_j3, width, height, xmin, ymin, xmax, ymax, cx, cy, maxiter
+        )
+        colorize_iterations(image, counts, palette)
+        return fraction
+    if method != "full":
+        raise ValueError(f"Unknown method {method}")
+
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    counts = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
-            i = barnsley_j3(x1, y1, cx, cy, maxiter)
-            i = 3 * i % 256
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)
+            counts[y][x] = barnsley_j3(x1, y1, cx, cy, maxiter)
             x1 += stepx
         y1 += stepy
 
+    colorize_iterations(image, counts, palette)
+    return 1.0
+
 
 def main():
     """Function called after the script initialization."""
@@ -7,38 +7,31 @@ import palette_greens
 import palette_mandmap
 from PIL import Image
 
+from colorizer import colorize_iterations
+from kernels import mandelbrot
+
 IMAGE_WIDTH = 512
 IMAGE_HEIGHT = 384
 
 
-def mandelbrot(cx, cy, maxiter):
-    """Výpočet, kolik iterací je nutné pro opuštění jednotkového kruhu."""
-    c = complex(cx, cy)
-    z = 0
-    for i in range(maxiter):
-        if abs(z) > 2:
-            return i
-        z = z * z + c
-    return 0
-
-
 def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, maxiter=1000):
     """Přepočet celého fraktálu."""
     width, height = image.size  # rozměry obrázku
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    counts = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
-            i = mandelbrot(x1, y1, maxiter)
-            i = 3 * i % 256
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)
+            counts[y][x] = mandelbrot(x1, y1, maxiter)
             x1 += stepx
         y1 += stepy
 
+    colorize_iterations(image, counts, palette)
+
 
 def addImages(image1, image2):
     width, height = image1.size
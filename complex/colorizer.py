@@ -0,0 +1,62 @@
+"""Conversion of iteration or intensity buffers into images via palette lookup table."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+
+def palette_lut(palette: Sequence[Sequence[int]]) -> np.ndarray:
+    """Return lookup table with 256x3 uint8 values for given palette."""
+    return _palette_lut(tuple(tuple(color[:3]) for color in palette))
+
+
+@lru_cache(maxsize=32)
+def _palette_lut(palette: tuple[tuple[int, ...], ...]) -> np.ndarray:
+    lut = np.array(palette, dtype=np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def apply_palette(
+    image: Image.Image, indices: Any, palette: Sequence[Sequence[int]]
+) -> None:
+    """Render 2D buffer with palette indices into given image in one bulk operation."""
+    rgb = palette_lut(palette)[np.asarray(indices) & 255]
+    height, width = rgb.shape[:2]
+    colored = Image.frombuffer("RGB", (width, height), rgb.tobytes(), "raw", "RGB", 0, 1)
+    if image.mode != "RGB":
+        colored = colored.convert(image.mode)
+    image.paste(colored)
+
+
+def colorize_iterations(
+    image: Image.Image, counts: Any, palette: Sequence[Sequence[int]]
+) -> None:
+    """Render 2D buffer with iteration counts into given image."""
+    apply_palette(image, 3 * np.asarray(counts) % 256, palette)
+
+
+def colorize_intensity(
+    image: Image.Image, bitmap: Any, palette: Sequence[Sequence[int]]
+) -> None:
+    """Render 2D buffer with intensities into given image with high contrast."""
+    bitmap = np.asarray(bitmap, dtype=np.float64)
+    min = bitmap.min()
+    max = bitmap.max()
+    k = 255.0 / (max - min) if max > min else 0.0
+    apply_palette(image, ((bitmap - min) * k).astype(np.int64), palette)
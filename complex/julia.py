@@ -18,42 +18,52 @@ from time import time
 
 from PIL import Image
 
+try:
+    from complex.colorizer import colorize_iterations
+    from complex.escape_time import julia_grid
+    from complex.kernels import julia
+    from complex.mariani_silver import calc_fractal_mariani_silver
+    from complex.tile_scheduler import render_tiles
+except ImportError:
+    from colorizer import colorize_iterations
+    from escape_time import julia_grid
+    from kernels import julia
+    from mariani_silver import calc_fractal_mariani_silver
+    from tile_scheduler import render_tiles
+
 # image size specified in pixels
 # the size of the image should be square, and its height and width
 # should be an integer power of 2
 IMAGE_WIDTH = 512
 IMAGE_HEIGHT = 512
 
-# bailout value
-BAILOUT = 2
 
-def julia(zx0, zy0, cx, cy, maxiter):
-    """Calculate number of iterations for given complex numbers Z and C to escape from set."""
-    c = complex(cx, cy)
-    z = complex(zx0, zy0)
-    for i in range(maxiter):
-        if abs(z) > BAILOUT:
-            return i
-        z = z * z + c
-    return 0
+def calc_fractal(width, height, xmin, ymin, xmax, ymax, cx, cy, maxiter=1000, workers=1):
+    """Recalculate the whole fractal and return number of iterations for all pixels."""
+    return render_tiles(
+        julia_grid, width, height, xmin, ymin, xmax, ymax, cx, cy, maxiter, workers=workers
+    )
+
 
+def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, cx, cy, maxiter=1000, method="full"):
+    """Recalculate the whole fractal and render the set into given image.
 
-def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, cx, cy, maxiter=1000):
-    """Recalculate the whole fractal and render the set into given image."""
+    Method "full" computes all pixels, "mariani_silver" iterates just the
+    borders of rectangles with uniform iteration counts. Return fraction of
+    pixels that were actually iterated.
+    """
     width, height = image.size  # rozmery obrazku
-    stepx = (xmax - xmin) / width
-    stepy = (ymax - ymin) / height
-
-    y1 = ymin
-    for y in range(height):
-        x1 = xmin
-        for x in range(width):
-            i = julia(x1, y1, cx, cy, maxiter)
-            i = 3 * i % 256
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)
-            x1 += stepx
-        y1 += stepy
+    if method == "mariani_silver":
+        counts, fraction = calc_fractal_mariani_silver(
+            julia, width, height, xmin, ymin, xmax, ymax, cx, cy, maxiter
+        )
+    elif method == "full":
+        counts = calc_fractal(width, height, xmin, ymin, xmax, ymax, cx, cy, maxiter)
+        fraction = 1.0
+    else:
+        raise ValueError(f"Unknown method {method}")
+    colorize_iterations(image, counts, palette)
+    return fraction
 
 
 def main():
@@ -21,6 +21,8 @@ from time import time
 
 from PIL import Image
 
+from colorizer import colorize_iterations
+
 # image size specified in pixels
 # the size of the image should be square, and its height and width
 # should be an integer power of 2
@@ -50,18 +52,19 @@ def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, cx, cy, maxiter=1000)
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    counts = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
-            i = julia_fn_fn(x1, y1, cx, cy, maxiter)
-            i = 3 * i % 256
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)
+            counts[y][x] = julia_fn_fn(x1, y1, cx, cy, maxiter)
             x1 += stepx
         y1 += stepy
         print(".", end="")
 
+    colorize_iterations(image, counts, palette)
+
 
 def main():
     """Function called after the script initialization."""
@@ -19,6 +19,7 @@ import palette_blues
 import pygame
 import pygame.locals
 from colors import Colors
+from kernels import julia, mandelbrot
 
 TITLE = "Interactive Julia renderer"
 SCREEN_WIDTH = 600
@@ -146,17 +147,6 @@ def event_loop(display, image1, image2, clock, renderer):
         clock.tick(25)
 
 
-def mandelbrot(cx, cy, maxiter):
-    """Calculate number of iterations for given complex number to escape from set."""
-    c = complex(cx, cy)
-    z = 0
-    for i in range(maxiter):
-        if abs(z) > 2:
-            return i
-        z = z * z + c
-    return 0
-
-
 def recalc_mandelbrot(image, palette, xmin, ymin, xmax, ymax, maxiter=100):
     """Recalculate the whole fractal and render the set into given image."""
     width, height = image.get_size()  # rozmery obrazku
@@ -175,17 +165,6 @@ def recalc_mandelbrot(image, palette, xmin, ymin, xmax, ymax, maxiter=100):
         y1 += stepy
 
 
-def julia(zx0, zy0, cx, cy, maxiter):
-    """Calculate number of iterations for given complex numbers Z and C to escape from set."""
-    c = complex(cx, cy)
-    z = complex(zx0, zy0)
-    for i in range(maxiter):
-        if abs(z) > 2:
-            return i
-        z = z * z + c
-    return 0
-
-
 def recalc_julia(image, palette, xmin, ymin, xmax, ymax, cx, cy, maxiter=1000):
     """Recalculate the whole fractal and render the set into given image."""
     width, height = image.get_size()  # rozmery obrazku
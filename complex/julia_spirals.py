@@ -18,6 +18,8 @@ from time import time
 
 from PIL import Image
 
+from colorizer import colorize_iterations
+
 IMAGE_WIDTH = 512
 IMAGE_HEIGHT = 384
 
@@ -43,17 +45,18 @@ def recalc_fractal(image, palette, cx, cy, maxiter=1000):
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    counts = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
-            i = julia(cx, cy, x1, y1, maxiter)
-            i = 3 * i % 256
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)
+            counts[y][x] = julia(cx, cy, x1, y1, maxiter)
             x1 += stepx
         y1 += stepy
 
+    colorize_iterations(image, counts, palette)
+
 
 def main():
     import palette_greens
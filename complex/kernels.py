@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+"""Shared escape-time kernels with fast detection of points inside the set."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+
+from time import time
+from typing import Any
+
+# bailout value
+BAILOUT = 2
+
+
+def in_cardioid_or_bulb(cx: Any, cy: Any) -> Any:
+    """Check if the point lies in the main cardioid or in the period-2 bulb.
+
+    Such points never escape from the Mandelbrot set. Works for scalars
+    as well as for NumPy arrays, where array of flags is returned.
+    """
+    x = cx - 0.25
+    y2 = cy * cy
+    q = x * x + y2
+    cardioid = q * (q + x) <= 0.25 * y2
+    bulb = (cx + 1.0) * (cx + 1.0) + y2 <= 0.0625
+    return cardioid | bulb
+
+
+def mandelbrot(cx: float, cy: float, maxiter: int) -> int:
+    """Calculate number of iterations for given complex number to escape from set.
+
+    Points in the main cardioid and period-2 bulb are recognized without
+    iterating, other interior points are detected when their orbit becomes
+    periodic (Brent's method: the orbit is compared with the value saved
+    after 1, 2, 4, 8... iterations). Comparison is exact, so the result is
+    the same as the one computed by the plain iteration loop.
+    """
+    if in_cardioid_or_bulb(cx, cy):
+        return 0
+    c = complex(cx, cy)
+    z: complex = 0
+    saved = z
+    for i in range(maxiter):
+        if abs(z) > BAILOUT:
+            return i
+        z = z * z + c
+        if z == saved:
+            return 0
+        if i & (i + 1) == 0:
+            saved = z
+    return 0
+
+
+def julia(zx0: float, zy0: float, cx: float, cy: float, maxiter: int) -> int:
+    """Calculate number of iterations for given complex numbers Z and C to escape from set.
+
+    Interior points are detected by orbit periodicity only.
+    """
+    c = complex(cx, cy)
+    z = complex(zx0, zy0)
+    saved = z
+    for i in range(maxiter):
+        if abs(z) > BAILOUT:
+            return i
+        z = z * z + c
+        if z == saved:
+            return 0
+        if i & (i + 1) == 0:
+            saved = z
+    return 0
+
+
+def mandelbrot_power(cx: float, cy: float, maxiter: int, power: int) -> int:
+    """Calculate number of iterations to escape for Mandelbrot variant z^power+c.
+
+    Interior points are detected by orbit periodicity only.
+    """
+    c = complex(cx, cy)
+    z: complex = 0
+    saved = z
+    for i in range(maxiter):
+        if abs(z) > BAILOUT:
+            return i
+        z = z**power + c
+        if z == saved:
+            return 0
+        if i & (i + 1) == 0:
+            saved = z
+    return 0
+
+
+def main() -> None:
+    """Function called after the script initialization."""
+    print("Calculation started")
+    t1 = time()
+    inside = 0
+    for y in range(256):
+        for x in range(256):
+            if mandelbrot(-2.0 + 3.0 * x / 256, -1.5 + 3.0 * y / 256, 1000) == 0:
+                inside += 1
+    t2 = time()
+    difftime = t2 - t1
+    print(f"Calculation finished in {difftime:4.1f} seconds")
+    print(f"Points inside the set: {inside}")
+
+
+if __name__ == "__main__":
+    # call the main function
+    main()
@@ -19,44 +19,74 @@ from time import time
 
 from PIL import Image
 
+try:
+    from complex.colorizer import colorize_iterations
+    from complex.escape_time import mandelbrot_grid
+    from complex.kernels import mandelbrot
+    from complex.mariani_silver import calc_fractal_mariani_silver
+    from complex.render_cache import RenderCache
+    from complex.tile_scheduler import render_tiles
+except ImportError:
+    from colorizer import colorize_iterations
+    from escape_time import mandelbrot_grid
+    from kernels import mandelbrot
+    from mariani_silver import calc_fractal_mariani_silver
+    from render_cache import RenderCache
+    from tile_scheduler import render_tiles
+
 # image size specified in pixels
 # the size of the image should be square, and its height and width
 # should be an integer power of 2
 IMAGE_WIDTH = 512
 IMAGE_HEIGHT = 512
 
-# bailout value
-BAILOUT = 2
 
+def calc_fractal(width, height, xmin, ymin, xmax, ymax, maxiter=1000, workers=1):
+    """Recalculate the whole fractal and return number of iterations for all pixels."""
+    return render_tiles(
+        mandelbrot_grid, width, height, xmin, ymin, xmax, ymax, maxiter, workers=workers
+    )
 
-def mandelbrot(cx, cy, maxiter):
-    """Calculate number of iterations for given complex number to escape from set."""
-    c = complex(cx, cy)
-    z = 0
-    for i in range(maxiter):
-        if abs(z) > BAILOUT:
-            return i
-        z = z * z + c
-    return 0
 
+def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, maxiter=1000, method="full"):
+    """Recalculate the whole fractal and render the set into given image.
 
-def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, maxiter=1000):
-    """Recalculate the whole fractal and render the set into given image."""
+    Method "full" computes all pixels, "mariani_silver" iterates just the
+    borders of rectangles with uniform iteration counts. Return fraction of
+    pixels that were actually iterated.
+    """
+    width, height = image.size  # image size in pixels
+    if method == "mariani_silver":
+        counts, fraction = calc_fractal_mariani_silver(
+            mandelbrot, width, height, xmin, ymin, xmax, ymax, maxiter
+        )
+    elif method == "full":
+        counts = calc_fractal(width, height, xmin, ymin, xmax, ymax, maxiter)
+        fraction = 1.0
+    else:
+        raise ValueError(f"Unknown method {method}")
+    colorize_iterations(image, counts, palette)
+    return fraction
+
+
+def recalc_fractal_scalar(image, palette, xmin, ymin, xmax, ymax, maxiter=1000):
+    """Recalculate the whole fractal point by point using the scalar kernel."""
     width, height = image.size  # image size in pixels
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    counts = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
-            i = mandelbrot(x1, y1, maxiter)
-            i = 3 * i % 256
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)
+            counts[y][x] = mandelbrot(x1, y1, maxiter)
             x1 += stepx
         y1 += stepy
 
+    colorize_iterations(image, counts, palette)
+
 
 def main():
     """Function called after the script initialization."""
@@ -65,9 +95,13 @@ def main():
     # construct new image
     image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
 
+    # iteration counts are computed only when they are not cached already
+    cache = RenderCache()
+
     print("Calculation started")
     t1 = time()
-    recalc_fractal(image, palette_blues.palette, -2.0, -1.5, 1.0, 1.5, 1000)
+    counts = cache.call(calc_fractal, IMAGE_WIDTH, IMAGE_HEIGHT, -2.0, -1.5, 1.0, 1.5, 1000)
+    colorize_iterations(image, counts, palette_blues.palette)
     t2 = time()
     difftime = t2 - t1
     print(f"Calculation finished in {difftime:4.1f} seconds")
@@ -20,26 +20,15 @@ from time import time
 import palette_mandmap
 from PIL import Image
 
+from colorizer import colorize_iterations
+from kernels import mandelbrot
+
 # image size specified in pixels
 # the size of the image should be square, and its height and width
 # should be an integer power of 2
 IMAGE_WIDTH = 512
 IMAGE_HEIGHT = 384
 
-# bailout value
-BAILOUT = 2
-
-
-def mandelbrot(cx, cy, maxiter):
-    """Calculate number of iterations for given complex number to escape from set."""
-    c = complex(cx, cy)
-    z = 0
-    for i in range(maxiter):
-        if abs(z) > BAILOUT:
-            return i
-        z = z * z + c
-    return 0
-
 
 def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, maxiter=1000):
     """Recalculate the whole fractal and render the set into given image."""
@@ -47,17 +36,18 @@ def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, maxiter=1000):
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    counts = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
-            i = mandelbrot(x1, y1, maxiter)
-            i = 3 * i % 256
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)
+            counts[y][x] = mandelbrot(x1, y1, maxiter)
             x1 += stepx
         y1 += stepy
 
+    colorize_iterations(image, counts, palette)
+
 
 def main():
     """Function called after the script initialization."""
@@ -19,25 +19,19 @@ from time import time
 
 from PIL import Image
 
+from colorizer import colorize_iterations
+from kernels import mandelbrot_power
+
 # image size specified in pixels
 # the size of the image should be square, and its height and width
 # should be an integer power of 2
 IMAGE_WIDTH = 512
 IMAGE_HEIGHT = 512
 
-# bailout value
-BAILOUT = 2
-
 
 def mandelbrot(cx, cy, maxiter):
     """Calculate number of iterations for given complex number to escape from set."""
-    c = complex(cx, cy)
-    z = 0
-    for i in range(maxiter):
-        if abs(z) > BAILOUT:
-            return i
-        z = z**4 + c
-    return 0
+    return mandelbrot_power(cx, cy, maxiter, 4)
 
 
 def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, maxiter=1000):
@@ -46,17 +40,18 @@ def recalc_fractal(image, palette, xmin, ymin, xmax, ymax, maxiter=1000):
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    counts = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
-            i = mandelbrot(x1, y1, maxiter)
-            i = 3 * i % 256
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)
+            counts[y][x] = mandelbrot(x1, y1, maxiter)
             x1 += stepx
         y1 += stepy
 
+    colorize_iterations(image, counts, palette)
+
 
 def main():
     import palette_mandmap
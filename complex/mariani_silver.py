@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+"""Mariani-Silver rectangle subdivision renderer for escape-time fractals."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+
+from collections.abc import Callable
+from time import time
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+try:
+    from complex.escape_time import axis_coordinates
+except ImportError:
+    from escape_time import axis_coordinates  # type: ignore[no-redef]
+
+# image size specified in pixels
+IMAGE_WIDTH = 512
+IMAGE_HEIGHT = 512
+
+# rectangles smaller than this size (in pixels) are not subdivided further
+MIN_SIZE = 6
+
+
+def mariani_silver(
+    kernel: Callable[..., int], xs: Any, ys: Any, *args: Any, min_size: int = MIN_SIZE
+) -> tuple[np.ndarray, int]:
+    """Compute iteration counts by Mariani-Silver rectangle subdivision.
+
+    Only borders of rectangles are evaluated. When the whole border has
+    the same number of iterations, the rectangle is filled by this value,
+    otherwise it is split into four rectangles sharing their borders.
+    Kernel is any per-point function like mandelbrot(cx, cy, maxiter), the
+    remaining arguments are passed to it after the point coordinates.
+
+    Return iteration counts and number of pixels actually iterated.
+    """
+    xs = np.asarray(xs).tolist()
+    ys = np.asarray(ys).tolist()
+    width = len(xs)
+    height = len(ys)
+
+    # -1 means that the pixel has not been computed yet
+    counts = [[-1] * width for y in range(height)]
+    iterated = 0
+
+    def compute(x: int, y: int) -> int:
+        nonlocal iterated
+        i = counts[y][x]
+        if i < 0:
+            i = kernel(xs[x], ys[y], *args)
+            counts[y][x] = i
+            iterated += 1
+        return i
+
+    # rectangles are stored with inclusive borders
+    rectangles = [(0, 0, width - 1, height - 1)]
+    while rectangles:
+        x0, y0, x1, y1 = rectangles.pop()
+
+        border = set()
+        for x in range(x0, x1 + 1):
+            border.add(compute(x, y0))
+            border.add(compute(x, y1))
+        for y in range(y0 + 1, y1):
+            border.add(compute(x0, y))
+            border.add(compute(x1, y))
+
+        if len(border) == 1:
+            # the whole border has the same value -> flood fill
+            value = border.pop()
+            for y in range(y0 + 1, y1):
+                counts[y][x0 + 1 : x1] = [value] * (x1 - x0 - 1)
+        elif x1 - x0 < min_size or y1 - y0 < min_size:
+            # too small to be subdivided -> compute all pixels
+            for y in range(y0 + 1, y1):
+                for x in range(x0 + 1, x1):
+                    compute(x, y)
+        else:
+            mx = (x0 + x1) // 2
+            my = (y0 + y1) // 2
+            rectangles.append((x0, y0, mx, my))
+            rectangles.append((mx, y0, x1, my))
+            rectangles.append((x0, my, mx, y1))
+            rectangles.append((mx, my, x1, y1))
+
+    return np.array(counts, dtype=np.int32), iterated
+
+
+def mariani_silver_tile(
+    kernel: Callable[..., int], xs: np.ndarray, ys: np.ndarray, *args: Any
+) -> np.ndarray:
+    """Compute iteration counts for one tile, usable by tile_scheduler.render_tiles."""
+    counts, _ = mariani_silver(kernel, xs, ys, *args)
+    return counts
+
+
+def calc_fractal_mariani_silver(
+    kernel: Callable[..., int],
+    width: int,
+    height: int,
+    xmin: float,
+    ymin: float,
+    xmax: float,
+    ymax: float,
+    *args: Any,
+) -> tuple[np.ndarray, float]:
+    """Recalculate the whole fractal by Mariani-Silver method.
+
+    This is the mariani_silver method of recalc_fractal functions. Return
+    number of iterations for all pixels and fraction of pixels that were
+    actually iterated.
+    """
+    xs = axis_coordinates(xmin, (xmax - xmin) / width, width)
+    ys = axis_coordinates(ymin, (ymax - ymin) / height, height)
+    counts, iterated = mariani_silver(kernel, xs.tolist(), ys.tolist(), *args)
+    return counts, iterated / (width * height)
+
+
+def main() -> None:
+    """Function called after the script initialization."""
+    import barnsley_m1
+    import julia
+    import magnet_m1
+    import mandelbrot
+    import palette_blues
+    import palette_mandmap
+
+    # construct new image
+    image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
+
+    # fractals are rendered by recalc_fractal functions of their modules
+    renders = (
+        ("mandelbrot_ms.png", mandelbrot, palette_blues.palette, (-2.0, -1.5, 1.0, 1.5, 1000)),
+        ("julia_ms.png", julia, palette_mandmap.palette, (-2.0, -2.0, 2.0, 2.0, 0.0, 1.0, 1000)),
+        ("barnsley_m1_ms.png", barnsley_m1, palette_blues.palette, (-2.0, -2.0, 2.0, 2.0, 1000)),
+        ("magnet_m1_ms.png", magnet_m1, palette_blues.palette, (-2.0, -2.0, 2.0, 2.0, 500)),
+    )
+
+    for filename, module, palette, args in renders:
+        print("Calculation started")
+        t1 = time()
+        fraction = module.recalc_fractal(image, palette, *args, method="mariani_silver")
+        t2 = time()
+        difftime = t2 - t1
+        print(f"Calculation finished in {difftime:4.1f} seconds")
+        print(f"Pixels iterated: {100.0 * fraction:4.1f}%")
+
+        # save image with fractal
+        image.save(filename)
+
+
+if __name__ == "__main__":
+    # call the main function
+    main()
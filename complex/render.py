@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+
+"""Batch renderer of fractal images described by TOML or JSON manifest."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+# Manifest contains list of jobs, each job describes one output image:
+#
+# [defaults]
+# size = [512, 384]
+# maxiter = 1000
+#
+# [[job]]
+# fractal = "julia"          # mandelbrot, julia, or "module:function" with per-point kernel
+# viewport = [-2.0, -1.5, 2.0, 1.5]
+# c = [-0.4, 0.6]            # only for Julia-like fractals
+# palette = "greens"         # palette_greens.py
+# output = "julia.png"       # relative to manifest location
+#
+# Values from [defaults] table are used for keys not specified in jobs.
+
+import argparse
+import importlib
+import json
+import sys
+import tomllib
+from concurrent.futures import as_completed
+from functools import partial
+from pathlib import Path
+from time import time
+
+from PIL import Image
+
+try:
+    from complex.colorizer import colorize_iterations
+    from complex.escape_time import julia_grid, mandelbrot_grid
+    from complex.render_cache import RenderCache
+    from complex.tile_scheduler import get_executor, number_of_workers, point_tile, render_tiles
+except ImportError:
+    from colorizer import colorize_iterations
+    from escape_time import julia_grid, mandelbrot_grid
+    from render_cache import RenderCache
+    from tile_scheduler import get_executor, number_of_workers, point_tile, render_tiles
+
+# vectorized grid functions used instead of per-point kernels
+GRID_FUNCTIONS = {
+    "mandelbrot": mandelbrot_grid,
+    "julia": julia_grid,
+}
+
+# values used for keys not specified in manifest
+DEFAULTS = {
+    "size": [512, 512],
+    "viewport": [-2.0, -2.0, 2.0, 2.0],
+    "c": [],
+    "maxiter": 1000,
+    "palette": "blues",
+}
+
+# keys that need to be specified for each job
+REQUIRED = ("fractal", "output")
+
+
+def load_manifest(path):
+    """Load jobs from TOML or JSON manifest, apply defaults, and validate them."""
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path, encoding="utf-8") as fin:
+            manifest = json.load(fin)
+    else:
+        with open(path, "rb") as fin:
+            manifest = tomllib.load(fin)
+
+    # JSON manifest can be just a list of jobs
+    if isinstance(manifest, list):
+        manifest = {"job": manifest}
+    defaults = {**DEFAULTS, **manifest.get("defaults", {})}
+
+    jobs = []
+    for index, job in enumerate(manifest.get("job", [])):
+        job = {**defaults, **job}
+        for key in REQUIRED:
+            if key not in job:
+                raise ValueError(f"Job #{index + 1} in {path}: missing '{key}'")
+        if len(job["viewport"]) != 4:
+            raise ValueError(f"Job #{index + 1} in {path}: viewport needs four values")
+        if len(job["size"]) != 2:
+            raise ValueError(f"Job #{index + 1} in {path}: size needs two values")
+        # output paths are relative to manifest location
+        job["output"] = path.parent / job["output"]
+        jobs.append(job)
+    return jobs
+
+
+def computation_key(job):
+    """Return all parameters affecting iteration counts, palette and output are not used."""
+    return (
+        job["fractal"],
+        tuple(job["size"]),
+        tuple(job["viewport"]),
+        tuple(job["c"]),
+        job["maxiter"],
+    )
+
+
+def group_jobs(jobs):
+    """Group jobs that differ only in palette or output so they are computed once."""
+    groups = {}
+    for job in jobs:
+        groups.setdefault(computation_key(job), []).append(job)
+    return groups
+
+
+def tile_function(fractal):
+    """Return tile function for fractal name: mandelbrot, julia, or module:function."""
+    grid_function = GRID_FUNCTIONS.get(fractal)
+    if grid_function is not None:
+        return grid_function
+    module, _, function = fractal.partition(":")
+    kernel = getattr(importlib.import_module(module), function or module)
+    return partial(point_tile, kernel)
+
+
+def calc_counts(key):
+    """Calculate iteration counts for one computation key, called in worker processes."""
+    fractal, (width, height), viewport, c, maxiter = key
+    return render_tiles(tile_function(fractal), width, height, *viewport, *c, maxiter)
+
+
+def cached_counts(key):
+    """Return iteration counts from render cache, calculate them on cache miss."""
+    return RenderCache().call(calc_counts, key)
+
+
+def load_palette(name):
+    """Return palette stored in module palette_<name>."""
+    return importlib.import_module(f"palette_{name}").palette
+
+
+def save_images(counts, jobs):
+    """Colorize iteration counts by palettes of all given jobs and save the images."""
+    for job in jobs:
+        width, height = job["size"]
+        image = Image.new("RGB", (width, height))
+        colorize_iterations(image, counts, load_palette(job["palette"]))
+        job["output"].parent.mkdir(parents=True, exist_ok=True)
+        image.save(job["output"])
+        print(f"Written {job['output']}")
+
+
+def render(jobs, workers=None, force=False):
+    """Render all jobs, computations are scheduled over pool of worker processes.
+
+    Jobs whose output already exists are skipped unless force is set.
+    Iteration counts are taken from render cache when possible.
+    Images are written as soon as their computation is finished.
+    Return number of distinct computations.
+    """
+    if not force:
+        jobs = [job for job in jobs if not job["output"].exists()]
+    groups = group_jobs(jobs)
+
+    workers = number_of_workers(workers)
+    if workers == 1:
+        for key, group in groups.items():
+            save_images(cached_counts(key), group)
+        return len(groups)
+
+    executor = get_executor(workers)
+    futures = {executor.submit(cached_counts, key): key for key in groups}
+    for future in as_completed(futures):
+        save_images(future.result(), groups[futures[future]])
+    return len(groups)
+
+
+def main():
+    """Function called after the script initialization."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("manifest", nargs="+", help="TOML or JSON manifest with jobs")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=0, help="number of worker processes, 0 for all cores"
+    )
+    parser.add_argument(
+        "-f", "--force", action="store_true", help="render also images that already exist"
+    )
+    args = parser.parse_args()
+
+    jobs = []
+    for manifest in args.manifest:
+        try:
+            jobs.extend(load_manifest(manifest))
+        except (OSError, ValueError) as e:
+            print(f"Can not load manifest: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    print(f"Rendering {len(jobs)} jobs using {number_of_workers(args.workers)} workers")
+    t1 = time()
+    computations = render(jobs, args.workers, args.force)
+    t2 = time()
+    difftime = t2 - t1
+    print(f"{computations} computations finished in {difftime:4.1f} seconds")
+
+
+if __name__ == "__main__":
+    # call the main function
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+"""Multi-process tile scheduler for fractal renderers."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+
+import atexit
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from time import time
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+try:
+    from complex.colorizer import colorize_iterations
+    from complex.escape_time import axis_coordinates
+except ImportError:
+    from colorizer import colorize_iterations  # type: ignore[no-redef]
+    from escape_time import axis_coordinates  # type: ignore[no-redef]
+
+# image size specified in pixels
+IMAGE_WIDTH = 512
+IMAGE_HEIGHT = 512
+
+# default tile height (in rows), tiles span the whole image width by default
+TILE_HEIGHT = 16
+
+# region of one tile in pixels: x0, y0, x1, y1 (x1 and y1 are exclusive)
+Tile = tuple[int, int, int, int]
+
+# process pools shared by all renders, indexed by number of workers
+_executors: dict[int, ProcessPoolExecutor] = {}
+
+
+def number_of_workers(workers: int | None = None) -> int:
+    """Return number of worker processes, zero or None means one per CPU core."""
+    if not workers:
+        return os.cpu_count() or 1
+    return workers
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """Return process pool with given number of workers, create it on first use."""
+    executor = _executors.get(workers)
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        _executors[workers] = executor
+    return executor
+
+
+@atexit.register
+def shutdown_executors() -> None:
+    """Shut down all shared process pools, pending tasks are cancelled."""
+    for executor in _executors.values():
+        executor.shutdown(wait=True, cancel_futures=True)
+    _executors.clear()
+
+
+def split_tiles(
+    width: int, height: int, tile_width: int | None = None, tile_height: int = TILE_HEIGHT
+) -> list[Tile]:
+    """Split the image into tiles, row bands are used when tile width is not set."""
+    tile_width = tile_width or width
+    return [
+        (x0, y0, min(x0 + tile_width, width), min(y0 + tile_height, height))
+        for y0 in range(0, height, tile_height)
+        for x0 in range(0, width, tile_width)
+    ]
+
+
+def point_tile(
+    kernel: Callable[..., int], xs: np.ndarray, ys: np.ndarray, *args: Any
+) -> np.ndarray:
+    """Compute iteration counts for one tile by calling per-point kernel."""
+    counts = np.empty((len(ys), len(xs)), dtype=np.int32)
+    for y, y1 in enumerate(ys.tolist()):
+        for x, x1 in enumerate(xs.tolist()):
+            counts[y, x] = kernel(x1, y1, *args)
+    return counts
+
+
+def render_tiles(
+    tile_function: Callable[..., Any],
+    width: int,
+    height: int,
+    xmin: float,
+    ymin: float,
+    xmax: float,
+    ymax: float,
+    *args: Any,
+    workers: int | None = 1,
+    tile_width: int | None = None,
+    tile_height: int = TILE_HEIGHT,
+) -> np.ndarray:
+    """Compute iteration counts for the whole viewport tile by tile.
+
+    The tile function is called as tile_function(xs, ys, *args) with
+    coordinates of tile columns and rows, and it has to return array with
+    iteration counts. Per-point kernels can be plugged in via
+    partial(point_tile, kernel).
+    """
+    xs = axis_coordinates(xmin, (xmax - xmin) / width, width)
+    ys = axis_coordinates(ymin, (ymax - ymin) / height, height)
+
+    workers = number_of_workers(workers)
+    if workers == 1:
+        return np.asarray(tile_function(xs, ys, *args), dtype=np.int32)
+
+    counts = np.zeros((height, width), dtype=np.int32)
+    executor = get_executor(workers)
+    futures = {
+        executor.submit(tile_function, xs[x0:x1], ys[y0:y1], *args): (x0, y0, x1, y1)
+        for x0, y0, x1, y1 in split_tiles(width, height, tile_width, tile_height)
+    }
+    for future in as_completed(futures):
+        x0, y0, x1, y1 = futures[future]
+        counts[y0:y1, x0:x1] = future.result()
+    return counts
+
+
+def recalc_fractal_tiles(
+    image: Image.Image,
+    palette: Any,
+    kernel: Callable[..., int],
+    xmin: float,
+    ymin: float,
+    xmax: float,
+    ymax: float,
+    *args: Any,
+    workers: int | None = None,
+) -> None:
+    """Recalculate the whole fractal in parallel and render the set into given image.
+
+    Kernel is any per-point function like mandelbrot(cx, cy, maxiter) or
+    julia(zx0, zy0, cx, cy, maxiter), the remaining arguments are passed
+    to it after the point coordinates.
+    """
+    width, height = image.size  # image size in pixels
+    counts = render_tiles(
+        partial(point_tile, kernel),
+        width,
+        height,
+        xmin,
+        ymin,
+        xmax,
+        ymax,
+        *args,
+        workers=workers,
+    )
+    colorize_iterations(image, counts, palette)
+
+
+def main() -> None:
+    """Function called after the script initialization."""
+    import palette_blues
+    from magnet_m1 import magnet_m1
+
+    # construct new image
+    image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
+
+    print(f"Calculation started using {number_of_workers()} workers")
+    t1 = time()
+    recalc_fractal_tiles(
+        image, palette_blues.palette, magnet_m1, -2.0, -2.0, 2.0, 2.0, 500
+    )
+    t2 = time()
+    difftime = t2 - t1
+    print(f"Calculation finished in {difftime:4.1f} seconds")
+
+    # save image with fractal
+    image.save("magnet_m1.png")
+
+
+if __name__ == "__main__":
+    # call the main function
+    main()
@@ -21,7 +21,8 @@ from pygame.surface import Surface
 from demo.colors import Colors
 from demo.resources import Resources
 from demo.screen import Screen
-from textures.circle_moire_with_palette import recalc_circle_pattern
+from textures.circle_moire_with_palette import calc_circle_pattern
+from textures.colorizer import apply_palette
 
 
 class CircleMoireScreen(Screen):
@@ -35,7 +36,7 @@ class CircleMoireScreen(Screen):
         self._clock = pygame.time.Clock()
         self._palette_index = 0
         self._zoom_index = 0
-        self._renderer = recalc_circle_pattern
+        self._renderer = calc_circle_pattern
         self._zoom = 3.0
         self._image = self.calcImage()
 
@@ -45,7 +46,13 @@ class CircleMoireScreen(Screen):
             "RGB", (CircleMoireScreen.IMAGE_WIDTH, CircleMoireScreen.IMAGE_HEIGHT)
         )
         palette = self._resources.palettes[self._palette_index]
-        self._renderer(image, palette, -threshold, -threshold, threshold, threshold)
+        width, height = image.size
+        viewport = (-threshold, -threshold, threshold, threshold)
+        key = (self._renderer, width, height, viewport)
+        indices = self._resources.iterationCache.getOrCalc(
+            key, lambda: self._renderer(width, height, *viewport)
+        )
+        apply_palette(image, indices, palette)
         return pygame.image.fromstring(image.tobytes(), image.size, "RGB").convert()
 
     def draw(self) -> None:
@@ -13,22 +13,38 @@
 """Complex fractal screen."""
 
 import sys
+from collections.abc import Callable, Hashable
+from typing import Any
 
+import numpy as np
 import pygame
 from PIL import Image
 from pygame.surface import Surface
 
+from complex.colorizer import colorize_iterations
 from demo.colors import Colors
+from demo.progressive_renderer import ProgressiveRenderer, Region
 from demo.resources import Resources
 from demo.screen import Screen
 
 
 class CplxFractalScreen(Screen):
-    # rendered image size
     # rendered image size
     IMAGE_WIDTH = 512
     IMAGE_HEIGHT = 512
 
+    # maximum number of iterations
+    MAXITER = 500
+
+    # time (in seconds) spent by rendering in one frame
+    FRAME_BUDGET = 0.04
+
+    # clock tick used while the image is being rendered
+    RENDER_TICK = 30
+
+    # view shift (in pixels) for one pan step
+    PAN_STEP = 64
+
     def __init__(
         self,
         display: Surface,
@@ -41,11 +57,15 @@ class CplxFractalScreen(Screen):
         cx: float | None = None,
         cy: float | None = None,
     ) -> None:
-        status = "← zoom out   → zoom in   [P]alette   Esc back"
+        status = "←/→ zoom   WASD move   [P]alette   Esc back"
         super(CplxFractalScreen, self).__init__(display, resources, title_text, status)
         self._clock = pygame.time.Clock()
         self._palette_index = 0
-        self._renderer = None
+        self._renderer: Callable[..., Any] | None = None
+        self._progressive: ProgressiveRenderer | None = None
+        self._counts: np.ndarray | None = None
+        self._render_key: Hashable = None
+        self._maxiter = CplxFractalScreen.MAXITER
         self._cx = cx
         self._cy = cy
         self._xmin = xmin
@@ -62,51 +82,197 @@ class CplxFractalScreen(Screen):
         y = 100
         self._display.blit(self._image, (x, y))
 
+    def renderArgs(self) -> tuple[float | int, ...]:
+        """Arguments passed to the renderer after the coordinates."""
+        if self._cx is None or self._cy is None:
+            return (self._maxiter,)
+        return (self._cx, self._cy, self._maxiter)
+
+    def startRender(
+        self,
+        counts: np.ndarray | None = None,
+        regions: list[Region] | None = None,
+        known_step: int | None = None,
+    ) -> None:
+        """Start rendering the current view, stale rendering is cancelled.
+
+        Iteration counts reused from the previous view can be passed in
+        together with the regions that still need to be computed.
+        """
+        if self._progressive is not None:
+            self._progressive.cancel()
+            self._progressive = None
+        if self._renderer is None:
+            self._image = self.calcImage()
+            return
+        width = CplxFractalScreen.IMAGE_WIDTH
+        height = CplxFractalScreen.IMAGE_HEIGHT
+        viewport = (self._xmin, self._ymin, self._xmax, self._ymax)
+        args = self.renderArgs()
+        # cache key consists of renderer, image size, viewport, C and maxiter
+        self._render_key = (self._renderer, width, height, viewport, args)
+        cached = self._resources.iterationCache.get(self._render_key)
+        if cached is None:
+            self._progressive = ProgressiveRenderer(
+                self._renderer,
+                width,
+                height,
+                viewport,
+                args,
+                self._resources.workers,
+                counts,
+                regions,
+                known_step,
+            )
+            cached = self._progressive.counts
+        self._counts = cached
+        self._image = self.calcImage()
+
+    def continueRender(self) -> None:
+        """Continue rendering for one frame, partial results are displayed immediately."""
+        if self._progressive is None:
+            return
+        if self._progressive.step(CplxFractalScreen.FRAME_BUDGET):
+            self._image = self.calcImage()
+        if self._progressive.done:
+            self._resources.iterationCache.put(self._render_key, self._progressive.counts)
+            self._progressive = None
+
+    def stopRender(self) -> None:
+        """Cancel the rendering that is in progress."""
+        if self._progressive is not None:
+            self._progressive.cancel()
+            self._progressive = None
+
+    def reusableCounts(self) -> np.ndarray | None:
+        """Return iteration counts of the current view if they are computed completely."""
+        if self._progressive is not None:
+            return None
+        return self._counts
+
+    def zoomIn(self) -> None:
+        """Zoom in 2x, already computed samples that land on the new grid are reused."""
+        width = CplxFractalScreen.IMAGE_WIDTH
+        height = CplxFractalScreen.IMAGE_HEIGHT
+        old = self.reusableCounts()
+        stepx = (self._xmax - self._xmin) / width
+        stepy = (self._ymax - self._ymin) / height
+        self._xmin += width // 4 * stepx
+        self._ymin += height // 4 * stepy
+        self._xmax = self._xmin + width // 2 * stepx
+        self._ymax = self._ymin + height // 2 * stepy
+        if old is None:
+            self.startRender()
+            return
+        # every pixel from the central quarter becomes an even pixel of the new view
+        center = old[height // 4 : 3 * height // 4, width // 4 : 3 * width // 4]
+        counts = np.repeat(np.repeat(center, 2, axis=0), 2, axis=1)
+        self.startRender(counts, known_step=2)
+
+    def zoomOut(self) -> None:
+        """Zoom out 2x, the current view is reused for the central quarter."""
+        width = CplxFractalScreen.IMAGE_WIDTH
+        height = CplxFractalScreen.IMAGE_HEIGHT
+        old = self.reusableCounts()
+        stepx = (self._xmax - self._xmin) / width
+        stepy = (self._ymax - self._ymin) / height
+        self._xmin -= width // 2 * stepx
+        self._ymin -= height // 2 * stepy
+        self._xmax = self._xmin + 2 * width * stepx
+        self._ymax = self._ymin + 2 * height * stepy
+        if old is None:
+            self.startRender()
+            return
+        counts = np.zeros((height, width), dtype=np.int32)
+        counts[height // 4 : 3 * height // 4, width // 4 : 3 * width // 4] = old[::2, ::2]
+        # just the frame around the central quarter needs to be computed
+        regions = [
+            (0, 0, width, height // 4),
+            (0, 3 * height // 4, width, height),
+            (0, height // 4, width // 4, 3 * height // 4),
+            (3 * width // 4, height // 4, width, 3 * height // 4),
+        ]
+        self.startRender(counts, regions)
+
+    def pan(self, dx: int, dy: int) -> None:
+        """Move the view by given number of pixels, only newly exposed strips are computed."""
+        width = CplxFractalScreen.IMAGE_WIDTH
+        height = CplxFractalScreen.IMAGE_HEIGHT
+        old = self.reusableCounts()
+        stepx = (self._xmax - self._xmin) / width
+        stepy = (self._ymax - self._ymin) / height
+        self._xmin += dx * stepx
+        self._xmax += dx * stepx
+        self._ymin += dy * stepy
+        self._ymax += dy * stepy
+        if old is None:
+            self.startRender()
+            return
+        # shift pixels that stay in view
+        counts = np.zeros((height, width), dtype=np.int32)
+        counts[max(0, -dy) : height - max(0, dy), max(0, -dx) : width - max(0, dx)] = old[
+            max(0, dy) : height - max(0, -dy), max(0, dx) : width - max(0, -dx)
+        ]
+        # horizontal strip spans the whole width, vertical strip the remaining rows
+        regions = []
+        top, bottom = 0, height
+        if dy > 0:
+            regions.append((0, height - dy, width, height))
+            bottom = height - dy
+        elif dy < 0:
+            regions.append((0, 0, width, -dy))
+            top = -dy
+        if dx > 0:
+            regions.append((width - dx, top, width, bottom))
+        elif dx < 0:
+            regions.append((0, top, -dx, bottom))
+        self.startRender(counts, regions)
+
     def calcImage(self) -> Surface:
         image = Image.new(
             "RGB", (CplxFractalScreen.IMAGE_WIDTH, CplxFractalScreen.IMAGE_HEIGHT)
         )
         palette = self._resources.palettes[self._palette_index]
-        if self._renderer is not None:
-            if self._cx is None or self._cy is None:
-                self._renderer(
-                    image, palette, self._xmin, self._ymin, self._xmax, self._ymax, 500
-                )
-            else:
-                self._renderer(
-                    image,
-                    palette,
-                    self._xmin,
-                    self._ymin,
-                    self._xmax,
-                    self._ymax,
-                    self._cx,
-                    self._cy,
-                    500,
-                )
+        if self._counts is not None:
+            # just a recolor of iteration counts computed so far
+            colorize_iterations(image, self._counts, palette)
         return pygame.image.fromstring(image.tobytes(), image.size, "RGB").convert()
 
     def eventLoop(self) -> int:
-        """Event loop for splash screen that just waits for keypress or window close action."""
+        """Event loop for complex fractal screen that renders the fractal progressively."""
         while True:
             for event in pygame.event.get():
                 if event.type == pygame.locals.QUIT:
+                    self.stopRender()
                     pygame.quit()
                     sys.exit()
                 if event.type == pygame.locals.KEYDOWN:
                     if event.key == pygame.locals.K_ESCAPE:
+                        self.stopRender()
                         return 0
                     if event.key == pygame.locals.K_LEFT:
-                        pass
+                        self.zoomOut()
                     if event.key == pygame.locals.K_RIGHT:
-                        pass
+                        self.zoomIn()
+                    if event.key == pygame.locals.K_a:
+                        self.pan(-CplxFractalScreen.PAN_STEP, 0)
+                    if event.key == pygame.locals.K_d:
+                        self.pan(CplxFractalScreen.PAN_STEP, 0)
+                    if event.key == pygame.locals.K_w:
+                        self.pan(0, -CplxFractalScreen.PAN_STEP)
+                    if event.key == pygame.locals.K_s:
+                        self.pan(0, CplxFractalScreen.PAN_STEP)
                     if event.key == pygame.locals.K_p:
                         self._palette_index += 1
                         if self._palette_index >= len(self._resources.palettes):
                             self._palette_index = 0
                         self._image = self.calcImage()
 
-            # all events has been processed - redraw the screen
+            # all events has been processed - render next part of image and redraw the screen
+            self.continueRender()
             self.draw()
             pygame.display.update()
-            self._clock.tick(8)
+            if self._progressive is not None:
+                self._clock.tick(CplxFractalScreen.RENDER_TICK)
+            else:
+                self._clock.tick(8)
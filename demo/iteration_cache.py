@@ -0,0 +1,63 @@
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+"""Bounded LRU cache for raw per-pixel buffers computed by renderers."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import numpy as np
+
+
+class IterationCache:
+    """Bounded LRU cache for raw per-pixel buffers computed by renderers.
+
+    Buffers (iteration counts, palette indices, or intensities) are stored
+    before the palette is applied, so changing palette or returning to
+    already visited screen is just a recolor.
+    """
+
+    # default number of buffers kept in cache
+    DEFAULT_SIZE = 16
+
+    def __init__(self, maxsize: int = DEFAULT_SIZE) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        self._buffers: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+
+    def get(self, key: Hashable) -> np.ndarray | None:
+        """Retrieve buffer stored under given key, or None on cache miss."""
+        buffer = self._buffers.get(key)
+        if buffer is not None:
+            self._buffers.move_to_end(key)
+        return buffer
+
+    def put(self, key: Hashable, buffer: Any) -> np.ndarray:
+        """Store buffer under given key, evicting the least recently used ones."""
+        stored = np.asarray(buffer)
+        self._buffers[key] = stored
+        self._buffers.move_to_end(key)
+        while len(self._buffers) > self._maxsize:
+            self._buffers.popitem(last=False)
+        return stored
+
+    def getOrCalc(self, key: Hashable, calc: Callable[[], Any]) -> np.ndarray:
+        """Retrieve buffer stored under given key, calculate and store it on cache miss."""
+        buffer = self.get(key)
+        if buffer is None:
+            buffer = self.put(key, calc())
+        return buffer
+
+    def __len__(self) -> int:
+        """Return number of buffers stored in cache."""
+        return len(self._buffers)
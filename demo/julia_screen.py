@@ -17,7 +17,7 @@ import sys
 import pygame
 from pygame.surface import Surface
 
-from complex.julia import recalc_fractal
+from complex.escape_time import julia_grid
 from demo.resources import Resources
 from demo.cplx_fractal_screen import CplxFractalScreen
 
@@ -28,5 +28,5 @@ class JuliaScreen(CplxFractalScreen):
         super(JuliaScreen, self).__init__(
             display, resources, title_text, -1.5, -1.5, 1.5, 1.5, 0.0, 1.0
         )
-        self._renderer = recalc_fractal
-        self._image = self.calcImage()
+        self._renderer = julia_grid
+        self.startRender()
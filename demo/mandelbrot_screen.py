@@ -17,7 +17,7 @@ import sys
 import pygame
 from pygame.surface import Surface
 
-from complex.mandelbrot import recalc_fractal
+from complex.escape_time import mandelbrot_grid
 from demo.resources import Resources
 from demo.cplx_fractal_screen import CplxFractalScreen
 
@@ -28,5 +28,5 @@ class MandelbrotScreen(CplxFractalScreen):
         super(MandelbrotScreen, self).__init__(
             display, resources, title_text, -2.0, -1.5, 1.0, 1.5
         )
-        self._renderer = recalc_fractal
-        self._image = self.calcImage()
+        self._renderer = mandelbrot_grid
+        self.startRender()
@@ -21,7 +21,8 @@ from pygame.surface import Surface
 from demo.colors import Colors
 from demo.resources import Resources
 from demo.screen import Screen
-from textures.circle_like_patterns import recalc_any_pattern
+from textures.circle_like_patterns import calc_any_pattern
+from textures.colorizer import apply_palette
 
 
 class OtherMoireScreen(Screen):
@@ -46,7 +47,7 @@ class OtherMoireScreen(Screen):
         self._clock = pygame.time.Clock()
         self._palette_index = 0
         self._zoom_index = 0
-        self._renderer = recalc_any_pattern
+        self._renderer = calc_any_pattern
         self._function = 0
         self._zoom = 2.25
         self._image = self.calcImage()
@@ -59,15 +60,14 @@ class OtherMoireScreen(Screen):
             "RGB", (OtherMoireScreen.IMAGE_WIDTH, OtherMoireScreen.IMAGE_HEIGHT)
         )
         palette = self._resources.palettes[self._palette_index]
-        self._renderer(
-            image,
-            palette,
-            -threshold,
-            -threshold,
-            threshold,
-            threshold,
-            OtherMoireScreen.FUNCTIONS[self._function],
+        width, height = image.size
+        viewport = (-threshold, -threshold, threshold, threshold)
+        function = OtherMoireScreen.FUNCTIONS[self._function]
+        key = (self._renderer, width, height, viewport, function)
+        indices = self._resources.iterationCache.getOrCalc(
+            key, lambda: self._renderer(width, height, *viewport, function)
         )
+        apply_palette(image, indices, palette)
         return pygame.image.fromstring(image.tobytes(), image.size, "RGB").convert()
 
     def draw(self) -> None:
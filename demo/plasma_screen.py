@@ -14,6 +14,7 @@
 
 import sys
 
+import numpy as np
 import pygame
 from PIL import Image
 from pygame.surface import Surface
@@ -21,7 +22,8 @@ from pygame.surface import Surface
 from demo.colors import Colors
 from demo.resources import Resources
 from demo.screen import Screen
-from textures.plasma import spectral_synthesis
+from textures.colorizer import colorize_intensity
+from textures.plasma import calc_spectral_synthesis
 
 
 class PlasmaScreen(Screen):
@@ -34,12 +36,19 @@ class PlasmaScreen(Screen):
         super(PlasmaScreen, self).__init__(display, resources, title_text, status)
         self._clock = pygame.time.Clock()
         self._palette_index = 0
+        # each screen shows its own plasma, palette changes only recolor it
+        self._seed = int(np.random.default_rng().integers(1 << 63))
         self._image = self.calcImage()
 
     def calcImage(self) -> Surface:
         image = Image.new("RGB", (PlasmaScreen.IMAGE_WIDTH, PlasmaScreen.IMAGE_HEIGHT))
         palette = self._resources.palettes[self._palette_index]
-        spectral_synthesis(image, palette, 4, 0.5)
+        width, height = image.size
+        key = (calc_spectral_synthesis, width, height, 4, 0.5, self._seed)
+        bitmap = self._resources.iterationCache.getOrCalc(
+            key, lambda: calc_spectral_synthesis(width, height, 4, 0.5, self._seed)
+        )
+        colorize_intensity(image, bitmap, palette)
         return pygame.image.fromstring(image.tobytes(), image.size, "RGB").convert()
 
     def draw(self) -> None:
@@ -0,0 +1,203 @@
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+"""Progressive and interruptible renderer of fractals in complex plane."""
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+from complex.escape_time import axis_coordinates
+from complex.tile_scheduler import get_executor, number_of_workers
+
+# rectangular region in pixels: x0, y0, x1, y1 (x1 and y1 are exclusive)
+Region = tuple[int, int, int, int]
+
+# one task: pass step, indexes of rows and columns to be computed, and region
+Task = tuple[int, np.ndarray, np.ndarray, Region]
+
+
+class ProgressiveRenderer:
+    """Progressive and interruptible renderer of fractals in complex plane.
+
+    The first pass computes every 8th pixel in both directions, the next
+    passes compute only the pixels not computed yet on twice finer grid.
+    Each computed sample fills the whole block it represents, so partial
+    results can be displayed after every step.
+
+    Already known iteration counts (for example when the view is panned or
+    zoomed) can be passed in together with the regions that need to be
+    computed. When known_step is set, samples on the grid with this step
+    are known in all regions and the coarse pass is skipped.
+    """
+
+    # step between pixels computed in the first (coarse) pass
+    COARSE_STEP = 8
+
+    # approximate number of points computed in one task
+    TASK_SIZE = 4096
+
+    def __init__(
+        self,
+        grid_function: Callable[..., Any],
+        width: int,
+        height: int,
+        viewport: tuple[float, float, float, float],
+        args: tuple[Any, ...],
+        workers: int = 1,
+        counts: np.ndarray | None = None,
+        regions: list[Region] | None = None,
+        known_step: int | None = None,
+    ) -> None:
+        """Initialize the renderer, no computation is performed there."""
+        xmin, ymin, xmax, ymax = viewport
+        self._grid_function = grid_function
+        self._args = args
+        self._width = width
+        self._height = height
+        self._xs = axis_coordinates(xmin, (xmax - xmin) / width, width)
+        self._ys = axis_coordinates(ymin, (ymax - ymin) / height, height)
+        if counts is None:
+            self._counts = np.zeros((height, width), dtype=np.int32)
+        else:
+            self._counts = counts.astype(np.int32, copy=True)
+        if regions is None:
+            regions = [(0, 0, width, height)]
+        self._tasks = deque(self.createTasks(regions, known_step))
+        self._total = len(self._tasks)
+        self._finished = 0
+        self._pending: deque[tuple[Task, Future[Any]]] = deque()
+        self._workers = number_of_workers(workers)
+        if self._workers > 1:
+            executor = get_executor(self._workers)
+            while self._tasks:
+                task = self._tasks.popleft()
+                _, rows, cols, _ = task
+                future = executor.submit(
+                    grid_function, self._xs[cols], self._ys[rows], *args
+                )
+                self._pending.append((task, future))
+
+    def createTasks(self, regions: list[Region], known_step: int | None) -> Iterator[Task]:
+        """Generate all tasks, coarse pass first, then the refinement passes."""
+        if known_step is None:
+            step = ProgressiveRenderer.COARSE_STEP
+            for x0, y0, x1, y1 in regions:
+                yield from self.splitRows(
+                    step,
+                    np.arange(y0, y1, step),
+                    np.arange(x0, x1, step),
+                    (x0, y0, x1, y1),
+                )
+        else:
+            step = known_step
+        while step > 1:
+            half = step // 2
+            for x0, y0, x1, y1 in regions:
+                # rows already computed in previous pass miss just the odd columns
+                yield from self.splitRows(
+                    half,
+                    np.arange(y0, y1, step),
+                    np.arange(x0 + half, x1, step),
+                    (x0, y0, x1, y1),
+                )
+                # other rows are computed completely
+                yield from self.splitRows(
+                    half,
+                    np.arange(y0 + half, y1, step),
+                    np.arange(x0, x1, half),
+                    (x0, y0, x1, y1),
+                )
+            step = half
+
+    def splitRows(
+        self, step: int, rows: np.ndarray, cols: np.ndarray, region: Region
+    ) -> Iterator[Task]:
+        """Split given rows into tasks of similar size."""
+        if cols.size == 0:
+            return
+        rows_per_task = max(1, ProgressiveRenderer.TASK_SIZE // cols.size)
+        for i in range(0, rows.size, rows_per_task):
+            yield (step, rows[i : i + rows_per_task], cols, region)
+
+    def applyTask(self, task: Task, values: np.ndarray) -> None:
+        """Store computed values, each one fills the whole block it represents."""
+        step, rows, cols, region = task
+        _, _, x1, y1 = region
+        # blocks are clipped by the region, pixels outside it can be already known
+        for dy in range(step):
+            r = rows + dy
+            valid_rows = r < y1
+            for dx in range(step):
+                c = cols + dx
+                valid_cols = c < x1
+                self._counts[np.ix_(r[valid_rows], c[valid_cols])] = values[
+                    np.ix_(valid_rows, valid_cols)
+                ]
+        self._finished += 1
+
+    def step(self, budget: float) -> bool:
+        """Continue rendering for given time (in seconds), return True if image changed."""
+        changed = False
+        if self._workers > 1:
+            # just collect results that are already available, never wait for workers;
+            # results are applied pass by pass, otherwise a coarse block that finished
+            # late would overwrite pixels already computed by a finer pass
+            while self._pending:
+                pass_step = self._pending[0][0][0]
+                waiting: deque[tuple[Task, Future[Any]]] = deque()
+                while self._pending and self._pending[0][0][0] == pass_step:
+                    task, future = self._pending.popleft()
+                    if future.done():
+                        self.applyTask(task, future.result())
+                        changed = True
+                    else:
+                        waiting.append((task, future))
+                if waiting:
+                    self._pending.extendleft(reversed(waiting))
+                    break
+            return changed
+
+        start = perf_counter()
+        while self._tasks and perf_counter() - start < budget:
+            task = self._tasks.popleft()
+            _, rows, cols, _ = task
+            values = self._grid_function(self._xs[cols], self._ys[rows], *self._args)
+            self.applyTask(task, values)
+            changed = True
+        return changed
+
+    def cancel(self) -> None:
+        """Cancel the rendering, tasks already running in workers are ignored."""
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._tasks.clear()
+
+    @property
+    def done(self) -> bool:
+        """Flag whether all tasks are finished."""
+        return self._finished == self._total
+
+    @property
+    def progress(self) -> float:
+        """Fraction of finished tasks."""
+        return self._finished / self._total if self._total else 1.0
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Iteration counts computed so far."""
+        return self._counts
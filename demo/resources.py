@@ -20,6 +20,7 @@ from typing import Dict, List, Tuple
 import pygame
 from pygame.font import Font
 
+from demo.iteration_cache import IterationCache
 from textures import (
     palette_blues,
     palette_gold,
@@ -44,6 +45,8 @@ class Resources:
         self.loadFonts(configuration)
         self.loadImages(configuration)
         self.loadPalettes()
+        self.loadRendererSettings(configuration)
+        self._iteration_cache = IterationCache()
 
     def loadFonts(self, configuration: configparser.ConfigParser) -> None:
         """Load all required fonts."""
@@ -81,11 +84,26 @@ class Resources:
         self._palettes.append(palette_phong.palette)
         self._palettes.append(palette_rose.palette)
 
+    def loadRendererSettings(self, configuration: configparser.ConfigParser) -> None:
+        """Load settings used by fractal renderers."""
+        # zero means one worker process per CPU core
+        self._workers = configuration.getint("renderer", "workers", fallback=0)
+
     @property
     def palettes(self) -> list[list[tuple[int, int, int]]]:
         """Color palettes."""
         return self._palettes
 
+    @property
+    def workers(self) -> int:
+        """Number of worker processes used by renderers."""
+        return self._workers
+
+    @property
+    def iterationCache(self) -> IterationCache:
+        """Cache with raw buffers computed by renderers, shared by all screens."""
+        return self._iteration_cache
+
     @property
     def bigFont(self) -> Font:
         """Big font to be used on all screens."""
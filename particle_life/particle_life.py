@@ -1,8 +1,13 @@
+"""Particle life simulator."""
+
+import argparse
 import sys
+from collections.abc import Iterator
 from enum import Enum
 from math import sqrt
-from random import random
+from time import perf_counter
 
+import numpy as np
 import pygame
 import pygame.locals
 
@@ -34,6 +39,25 @@ DAMPING_FACTOR = 0.5
 SLOW_DOWN_FACTOR = 0.1
 SCALE_FACTOR = 1
 
+# MAX_DISTANCE is compared with squared distance, so the scene is divided
+# into cells as large as the interaction radius
+CELL_SIZE = sqrt(MAX_DISTANCE)
+
+# maximum number of particle pairs processed at once
+MAX_PAIRS = 1 << 20
+
+# offsets of adjacent grid cells that are visited for each cell, the other
+# half of adjacent cells visits this cell
+HALF_NEIGHBOURHOOD = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+# offsets of pixels drawn for each particle: the particle itself and its four neighbours
+SPLAT_X = np.array((0, -1, 1, 0, 0))
+SPLAT_Y = np.array((0, 0, 0, -1, 1))
+
+# Seed of random number generator: anything accepted by np.random.default_rng,
+# independent streams for parallel runs can be made by SeedSequence.spawn
+Seed = int | np.random.SeedSequence | np.random.Generator | None
+
 
 class Colors(Enum):
     """Named colors used everywhere on demo screens."""
@@ -48,155 +72,308 @@ class Colors(Enum):
     WHITE = (255, 255, 255)
 
 
-class Particle:
-    def __init__(self, x: float, y: float, vx: float, vy: float, type: int):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.type = type
-
-
 class Atoms:
-    def __init__(self, max_particles: int):
+    """All particles stored as structure of arrays, one array per attribute."""
+
+    def __init__(self, max_particles: int, rng: np.random.Generator):
         self.colors = (0xFFFF0000, 0xFF00FF00, 0xFF2020FF, 0xFFFFFF00)
-        self.particles = []
-        self.particles += create_particles(MAX_RED, RED_GROUP)
-        self.particles += create_particles(MAX_GREEN, GREEN_GROUP)
-        self.particles += create_particles(MAX_BLUE, BLUE_GROUP)
-        self.particles += create_particles(MAX_YELLOW, YELLOW_GROUP)
-        print("Particles in atoms:", len(self.particles))
+        groups = (RED_GROUP, GREEN_GROUP, BLUE_GROUP, YELLOW_GROUP)
+        self.type = np.repeat(groups, group_sizes(max_particles))
+        self.x, self.y = random_positions(len(self.type), rng)
+        self.vx = np.zeros(len(self.type))
+        self.vy = np.zeros(len(self.type))
+        print("Particles in atoms:", len(self.type))
 
 
 class Model:
-    def __init__(self, max_particles: int) -> None:
-        self.rules: list[list[float]] = [
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-            [0, 0, 0, 0],
-        ]
+    def __init__(self, max_particles: int, seed: Seed = None) -> None:
+        """Initialize model, the same seed always gives the same initial state."""
+        self.rng = np.random.default_rng(seed)
+        self.rules = np.zeros((4, 4))
         self.init_rules()
-        self.atoms = Atoms(max_particles)
+        self.atoms = Atoms(max_particles, self.rng)
 
     def init_rules(self) -> None:
-        for j in range(4):
-            for i in range(4):
-                self.rules[i][j] = 2.0 * random() - 1.0
-
-
-def random_x() -> float:
-    return (WINDOW_WIDTH - BORDER * 2) * random() + BORDER
+        """Set random attraction (negative) or repulsion (positive) between groups."""
+        # rules[i, j] is filled column by column
+        self.rules = (2.0 * self.rng.random((4, 4)) - 1.0).T
 
 
-def random_y() -> float:
-    return (WINDOW_HEIGHT - BORDER * 2) * random() + BORDER
+def group_sizes(max_particles: int) -> np.ndarray:
+    """Return number of particles in each group, ratio of groups is kept for any total."""
+    sizes = np.array((MAX_RED, MAX_GREEN, MAX_BLUE, MAX_YELLOW))
+    sizes = sizes * max_particles // MAX_PARTICLES
+    sizes[0] += max_particles - sizes.sum()
+    return sizes
 
 
-def create_particles(max: int, type: int) -> list[Particle]:
-    return [Particle(random_x(), random_y(), 0.0, 0.0, type) for i in range(max)]
+def random_positions(count: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """Return random coordinates of particles placed inside the border."""
+    # x and y coordinates are taken alternately from the random stream
+    x, y = rng.random((count, 2)).T
+    x = (WINDOW_WIDTH - BORDER * 2) * x + BORDER
+    y = (WINDOW_HEIGHT - BORDER * 2) * y + BORDER
+    return x, y
 
 
 def redraw(surface: pygame.Surface, model: Model) -> None:
+    """Draw all particles at once by writing directly into pixels of the surface."""
     surface.fill(Colors.BLACK.value)
     atoms = model.atoms
-    for particle in atoms.particles:
-        color = atoms.colors[particle.type]
-        surface.set_at((int(particle.x), int(particle.y)), color)
-        surface.set_at((int(particle.x - 1), int(particle.y)), color)
-        surface.set_at((int(particle.x + 1), int(particle.y)), color)
-        surface.set_at((int(particle.x), int(particle.y - 1)), color)
-        surface.set_at((int(particle.x), int(particle.y + 1)), color)
+    width, height = surface.get_size()
+
+    # colors converted to pixel values the same way as in Surface.set_at
+    colors = np.array([surface.map_rgb(surface.unmap_rgb(color)) for color in atoms.colors])
+    pixel_colors = np.repeat(colors[atoms.type], len(SPLAT_X))
+
+    # pixels ordered particle by particle, so the last drawn particle wins
+    px = (atoms.x[:, np.newaxis] + SPLAT_X).astype(np.int64).ravel()
+    py = (atoms.y[:, np.newaxis] + SPLAT_Y).astype(np.int64).ravel()
+    visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+
+    # surface is locked while the pixel array exists
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels[px[visible], py[visible]] = pixel_colors[visible]
+    del pixels
+
+
+def grid_cells(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray, int, int]:
+    """Return grid cell coordinates of particles and the number of grid columns and rows.
+
+    Scene is divided into square cells as large as the interaction radius,
+    so all particles closer than the radius are found in the 3x3 block of
+    cells around each particle.
+    """
+    columns = int(np.ceil(WINDOW_WIDTH / CELL_SIZE))
+    rows = int(np.ceil(WINDOW_HEIGHT / CELL_SIZE))
+    cx = np.clip((x / CELL_SIZE).astype(np.int64), 0, columns - 1)
+    cy = np.clip((y / CELL_SIZE).astype(np.int64), 0, rows - 1)
+    return cx, cy, columns, rows
+
+
+def ragged_pairs(
+    particles: np.ndarray, first: np.ndarray, counts: np.ndarray, max_pairs: int
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield pairs (particle, first + k) for all k < count of each particle.
+
+    Pairs are yielded in chunks of about max_pairs pairs.
+    """
+    ends = np.cumsum(counts)
+    if len(ends) == 0 or ends[-1] == 0:
+        return
+    splits = np.searchsorted(ends, np.arange(max_pairs, ends[-1], max_pairs))
+    bounds = np.concatenate(([0], splits, [len(particles)]))
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        chunk_counts = counts[lo:hi]
+        total = int(chunk_counts.sum())
+        if total == 0:
+            continue
+        i = np.repeat(particles[lo:hi], chunk_counts)
+        # first pair of each particle starts at index first, shifted by pair offset
+        offsets = first[lo:hi] - (np.cumsum(chunk_counts) - chunk_counts)
+        yield i, np.repeat(offsets, chunk_counts) + np.arange(total)
+
+
+def neighbour_pairs(
+    cx: np.ndarray, cy: np.ndarray, columns: int, rows: int, max_pairs: int = MAX_PAIRS
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield pairs of particles that lie in the same or in adjacent grid cells.
+
+    Particles have to be sorted by cells, i.e. by cy * columns + cx, so
+    particles from one cell form a contiguous range. Each pair is yielded
+    just once as indices into the sorted particles.
+    """
+    cells = cy * columns + cx
+    counts = np.bincount(cells, minlength=columns * rows)
+    starts = np.cumsum(counts) - counts
+    particles = np.arange(len(cells))
+
+    # pairs in the same cell: particle with all particles that follow it in the cell
+    last = starts[cells] + counts[cells]
+    yield from ragged_pairs(particles, particles + 1, last - particles - 1, max_pairs)
+
+    # pairs in adjacent cells, just half of the neighbour cells is visited
+    for ox, oy in HALF_NEIGHBOURHOOD:
+        nx = cx + ox
+        ny = cy + oy
+        valid = (nx >= 0) & (nx < columns) & (ny >= 0) & (ny < rows)
+        neighbours = ny[valid] * columns + nx[valid]
+        yield from ragged_pairs(
+            particles[valid], starts[neighbours], counts[neighbours], max_pairs
+        )
 
 
 def apply_rules(model: Model) -> None:
-    for i in range(len(model.atoms.particles)):
-        fx: float = 0.0
-        fy: float = 0.0
-
-        a = model.atoms.particles[i]
-
-        # compute force for selected particle
-        for j in range(len(model.atoms.particles)):
-            if i != j:
-                b = model.atoms.particles[j]
-                g = model.rules[a.type][b.type] * SCALE_FACTOR
-                dx = a.x - b.x
-                dy = a.y - b.y
-                if dx != 0.0 or dy != 0.0:
-                    d = dx * dx + dy * dy
-                    if d < MAX_DISTANCE:
-                        f = g / sqrt(d)
-                        fx += f * dx
-                        fy += f * dy
-
-        # apply force to selected particle
-        a.vx = (a.vx + fx) * DAMPING_FACTOR
-        a.vy = (a.vy + fy) * DAMPING_FACTOR
-
-        # move particle
-        a.x += a.vx
-        a.y += a.vy
-
-        # check if particle touches scene boundary
-        if a.x <= 0:
-            a.vx = -a.vx
-            a.x = 0
-
-        if a.x >= WINDOW_WIDTH:
-            a.vx = -a.vx
-            a.x = WINDOW_WIDTH - 1
-
-        if a.y <= 0:
-            a.vy = -a.vy
-            a.y = 0
-
-        if a.y >= WINDOW_HEIGHT:
-            a.vy = -a.vy
-            a.y = WINDOW_HEIGHT - 1
+    """Advance the simulation by one step.
+
+    Forces are computed from positions at the beginning of the step for
+    all particles, then velocities and positions of all particles are
+    updated at once.
+    """
+    atoms = model.atoms
+    count = len(atoms.type)
+    rules = model.rules * SCALE_FACTOR
+
+    # particles sorted by grid cells, so neighbours are close in memory
+    cx, cy, columns, rows = grid_cells(atoms.x, atoms.y)
+    order = np.argsort(cy * columns + cx, kind="stable")
+    x = atoms.x[order]
+    y = atoms.y[order]
+    types = atoms.type[order]
+    fx = np.zeros(count)
+    fy = np.zeros(count)
+
+    # compute forces, each pair of particles affects both particles
+    for i, j in neighbour_pairs(cx[order], cy[order], columns, rows):
+        dx = x[i] - x[j]
+        dy = y[i] - y[j]
+        d = dx * dx + dy * dy
+        near = (d > 0.0) & (d < MAX_DISTANCE)
+        i = i[near]
+        j = j[near]
+        dx = dx[near]
+        dy = dy[near]
+        inverse_distance = 1.0 / np.sqrt(d[near])
+        pair_types = types[i] * len(rules) + types[j]
+        fi = rules.ravel()[pair_types] * inverse_distance
+        fj = rules.T.ravel()[pair_types] * inverse_distance
+        fx += np.bincount(i, fi * dx, count) - np.bincount(j, fj * dx, count)
+        fy += np.bincount(i, fi * dy, count) - np.bincount(j, fj * dy, count)
+
+    # forces in the original order of particles
+    force_x = np.empty(count)
+    force_y = np.empty(count)
+    force_x[order] = fx
+    force_y[order] = fy
+
+    # apply force to all particles
+    atoms.vx = (atoms.vx + force_x) * DAMPING_FACTOR
+    atoms.vy = (atoms.vy + force_y) * DAMPING_FACTOR
+
+    # move particles
+    atoms.x += atoms.vx
+    atoms.y += atoms.vy
+
+    # check if particles touch scene boundary
+    bounce = atoms.x <= 0
+    atoms.vx[bounce] = -atoms.vx[bounce]
+    atoms.x[bounce] = 0
+
+    bounce = atoms.x >= WINDOW_WIDTH
+    atoms.vx[bounce] = -atoms.vx[bounce]
+    atoms.x[bounce] = WINDOW_WIDTH - 1
+
+    bounce = atoms.y <= 0
+    atoms.vy[bounce] = -atoms.vy[bounce]
+    atoms.y[bounce] = 0
+
+    bounce = atoms.y >= WINDOW_HEIGHT
+    atoms.vy[bounce] = -atoms.vy[bounce]
+    atoms.y[bounce] = WINDOW_HEIGHT - 1
 
 
 def write_particles(model: Model, filename: str) -> None:
     atoms = model.atoms
     with open(filename, "w") as fout:
         fout.write('"x","y"\n')
-        for particle in atoms.particles:
-            fout.write(f"{particle.x},{particle.y}\n")
+        for x, y in zip(atoms.x.tolist(), atoms.y.tolist()):
+            fout.write(f"{x},{y}\n")
+
 
+def save_snapshot(model: Model, filename: str) -> None:
+    """Store state of all particles into binary .npy file.
 
-# set window title
-pygame.display.set_caption(WINDOW_TITLE)
+    Each row contains x, y, vx, vy and group of one particle.
+    """
+    atoms = model.atoms
+    np.save(filename, np.column_stack((atoms.x, atoms.y, atoms.vx, atoms.vy, atoms.type)))
 
-display = pygame.display.set_mode([WINDOW_WIDTH, WINDOW_HEIGHT])
-display.fill(Colors.BLACK.value)
 
-surface = pygame.Surface([WINDOW_WIDTH, WINDOW_HEIGHT])
-surface.set_at((101, 100), 0xFFFF0000)
-surface.set_at((100, 101), 0xFFFF0000)
-surface.set_at((101, 101), 0xFFFF0000)
+def run_headless(model: Model, steps: int, every: int, output: str | None) -> None:
+    """Advance the simulation without display and report its speed.
 
-clock = pygame.time.Clock()
-model = Model(MAX_PARTICLES)
+    When output is set, snapshot is stored after each every steps and
+    after the last step.
+    """
+    elapsed = 0.0
+    for step in range(1, steps + 1):
+        t1 = perf_counter()
+        apply_rules(model)
+        elapsed += perf_counter() - t1
+        if output is not None and (step == steps or every and step % every == 0):
+            save_snapshot(model, f"{output}_{step:06d}.npy")
 
-"""Event loop for About screen that just waits for keypress or window close operation."""
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.locals.QUIT:
-            pygame.quit()
-            sys.exit()
-        if event.type == pygame.locals.KEYDOWN:
-            if event.key == pygame.locals.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
-            if event.key == pygame.locals.K_RETURN:
+    speed = steps / elapsed if elapsed > 0.0 else float("inf")
+    print(f"{steps} steps finished in {elapsed:4.1f} seconds, {speed:.1f} steps per second")
+
+
+def run_interactive(model: Model, fps: int) -> None:
+    """Event loop that updates the scene until keypress or window close operation."""
+    # set window title
+    pygame.display.set_caption(WINDOW_TITLE)
+
+    display = pygame.display.set_mode([WINDOW_WIDTH, WINDOW_HEIGHT])
+    display.fill(Colors.BLACK.value)
+
+    surface = pygame.Surface([WINDOW_WIDTH, WINDOW_HEIGHT])
+    clock = pygame.time.Clock()
+
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.locals.QUIT:
                 pygame.quit()
                 sys.exit()
-            if event.key == pygame.locals.K_w:
-                write_particles(model, "particles.csv")
-
-    # all events has been processed - update scene and redraw the screen
-    apply_rules(model)
-    redraw(surface, model)
-    display.blit(surface, (0, 0))
-    pygame.display.update()
-    # clock.tick(25)
+            if event.type == pygame.locals.KEYDOWN:
+                if event.key == pygame.locals.K_ESCAPE:
+                    pygame.quit()
+                    sys.exit()
+                if event.key == pygame.locals.K_RETURN:
+                    pygame.quit()
+                    sys.exit()
+                if event.key == pygame.locals.K_w:
+                    write_particles(model, "particles.csv")
+
+        # all events has been processed - update scene and redraw the screen
+        apply_rules(model)
+        redraw(surface, model)
+        display.blit(surface, (0, 0))
+        pygame.display.update()
+        # zero fps means that the frame rate is not limited
+        clock.tick(fps)
+        pygame.display.set_caption(f"{WINDOW_TITLE} ({clock.get_fps():.1f} FPS)")
+
+
+def main() -> None:
+    """Function called after the script initialization."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-n", "--particles", type=int, default=MAX_PARTICLES, help="number of particles"
+    )
+    parser.add_argument("-s", "--seed", type=int, default=None, help="random number seed")
+    parser.add_argument(
+        "--fps", type=int, default=0, help="frame rate limit, 0 for unlimited frame rate"
+    )
+    parser.add_argument(
+        "--headless", action="store_true", help="run the simulation without display"
+    )
+    parser.add_argument(
+        "--steps", type=int, default=100, help="number of steps computed in headless mode"
+    )
+    parser.add_argument(
+        "--every", type=int, default=0, help="store snapshot after each N steps, 0 for last only"
+    )
+    parser.add_argument(
+        "-o", "--output", default=None, help="prefix of .npy snapshot files in headless mode"
+    )
+    args = parser.parse_args()
+
+    model = Model(args.particles, args.seed)
+    if args.headless:
+        run_headless(model, args.steps, args.every, args.output)
+    else:
+        run_interactive(model, args.fps)
+
+
+if __name__ == "__main__":
+    # call the main function
+    main()
@@ -0,0 +1,56 @@
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+"""Unit tests for the deterministic IFS renderer, chaos game is used as reference."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# scripts in the IFS directory import their siblings directly
+sys.path.insert(0, str(Path(__file__).parent.parent / "IFS"))
+
+from chaos_game import chaos_game  # noqa: E402
+from ifs import IFS_SYSTEMS, fit_bounds, system_bounds  # noqa: E402
+from measure_transform import measure_transform  # noqa: E402
+
+WIDTH = 128
+HEIGHT = 128
+POINTS = 4_000_000
+
+
+def reference_density(name: str) -> np.ndarray:
+    """Compute normalized histogram of chaos game for given IFS."""
+    bounds = fit_bounds(system_bounds(name), WIDTH, HEIGHT)
+    histogram = chaos_game(IFS_SYSTEMS[name], POINTS, WIDTH, HEIGHT, bounds, seed=1)
+    return histogram / histogram.sum()
+
+
+@pytest.mark.parametrize("name", ["fern", "dragon", "triangle"])
+def test_density_matches_chaos_game(name: str) -> None:
+    """Check that the computed measure is not spread out compared to chaos game."""
+    reference = reference_density(name)
+    bounds = fit_bounds(system_bounds(name), WIDTH, HEIGHT)
+    density, passes = measure_transform(IFS_SYSTEMS[name], WIDTH, HEIGHT, bounds)
+
+    assert passes > 0
+    assert density.shape == (HEIGHT, WIDTH)
+    assert density.sum() == pytest.approx(1.0)
+    # two chaos games with this number of points differ by about 0.03
+    assert np.abs(density - reference).sum() < 0.1
+    # only mass along edges leaks to pixels never visited by chaos game, e.g. holes of
+    # Sierpinski triangle, the raster does not spread the measure
+    assert density[reference == 0].sum() < 5e-3
+    assert np.count_nonzero(density) <= 1.1 * np.count_nonzero(reference)
+
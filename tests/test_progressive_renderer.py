@@ -0,0 +1,78 @@
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+"""Unit tests for the progressive renderer of complex fractals."""
+
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any
+
+import numpy as np
+import pytest
+
+from complex.escape_time import axis_coordinates, mandelbrot_grid
+from demo import progressive_renderer
+from demo.progressive_renderer import ProgressiveRenderer
+
+WIDTH = 67
+HEIGHT = 45
+VIEWPORT = (-2.0, -1.5, 1.0, 1.5)
+MAXITER = 100
+
+
+class DeferredExecutor:
+    """Executor that computes tasks only when the test completes their futures."""
+
+    def __init__(self) -> None:
+        """Initialize the executor with no submitted tasks."""
+        self.submitted: list[tuple[Future[Any], Callable[..., Any], tuple[Any, ...]]] = []
+
+    def submit(self, function: Callable[..., Any], *args: Any) -> Future[Any]:
+        """Remember the task, its result is set later by the test."""
+        future: Future[Any] = Future()
+        self.submitted.append((future, function, args))
+        return future
+
+
+def full_resolution() -> np.ndarray:
+    """Compute iteration counts for all pixels at once."""
+    xmin, ymin, xmax, ymax = VIEWPORT
+    xs = axis_coordinates(xmin, (xmax - xmin) / WIDTH, WIDTH)
+    ys = axis_coordinates(ymin, (ymax - ymin) / HEIGHT, HEIGHT)
+    return mandelbrot_grid(xs, ys, MAXITER)
+
+
+def test_serial_rendering() -> None:
+    """Check that the serial rendering gives the full resolution result."""
+    renderer = ProgressiveRenderer(mandelbrot_grid, WIDTH, HEIGHT, VIEWPORT, (MAXITER,))
+    while not renderer.done:
+        renderer.step(1.0)
+    np.testing.assert_array_equal(renderer.counts, full_resolution())
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_shuffled_completion_order(seed: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that results finished in any order give the full resolution result."""
+    executor = DeferredExecutor()
+    monkeypatch.setattr(progressive_renderer, "get_executor", lambda workers: executor)
+    renderer = ProgressiveRenderer(
+        mandelbrot_grid, WIDTH, HEIGHT, VIEWPORT, (MAXITER,), workers=4
+    )
+
+    rng = np.random.default_rng(seed)
+    for i in rng.permutation(len(executor.submitted)):
+        future, function, args = executor.submitted[i]
+        future.set_result(function(*args))
+        renderer.step(0.0)
+
+    assert renderer.done
+    np.testing.assert_array_equal(renderer.counts, full_resolution())
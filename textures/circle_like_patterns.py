@@ -6,36 +6,56 @@ from typing import Callable
 
 from PIL import Image
 
+try:
+    from textures.colorizer import apply_palette
+except ImportError:
+    from colorizer import apply_palette  # type: ignore[no-redef]
+
 # textura by mela byt ctvercova a jeji sirka i vyska by mela byt
 # mocninou cisla 2
 IMAGE_WIDTH = 256
 IMAGE_HEIGHT = 256
 
 
-def recalc_any_pattern(
-    image: Image.Image,
-    palette: tuple[tuple[int, int, int], ...],
+def calc_any_pattern(
+    width: int,
+    height: int,
     xmin: float,
     ymin: float,
     xmax: float,
     ymax: float,
     function: Callable[[float, float], float],
-) -> None:
-    """Funkce provadejici vypocet moare s kruznicovym ci jinym vzorkem."""
-    width, height = image.size  # rozmery obrazku
+) -> list[list[int]]:
+    """Funkce provadejici vypocet indexu do palety pro moare s libovolnym vzorkem."""
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    indices = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
             x1 += stepx
             val = function(x1, y1)
-            i = int(val) & 255
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)  # type: ignore
+            indices[y][x] = int(val) & 255
         y1 += stepy
+    return indices
+
+
+def recalc_any_pattern(
+    image: Image.Image,
+    palette: tuple[tuple[int, int, int], ...],
+    xmin: float,
+    ymin: float,
+    xmax: float,
+    ymax: float,
+    function: Callable[[float, float], float],
+) -> None:
+    """Funkce provadejici vypocet moare s kruznicovym ci jinym vzorkem."""
+    width, height = image.size  # rozmery obrazku
+    indices = calc_any_pattern(width, height, xmin, ymin, xmax, ymax, function)
+    apply_palette(image, indices, palette)
 
 
 def main() -> None:
@@ -4,25 +4,31 @@
 
 from PIL import Image
 
+try:
+    from textures.colorizer import apply_palette
+except ImportError:
+    from colorizer import apply_palette  # type: ignore[no-redef]
+
 # textura by mela byt ctvercova a jeji sirka i vyska by mela byt
 # mocninou cisla 2
 IMAGE_WIDTH = 256
 IMAGE_HEIGHT = 256
 
 
-def recalc_circle_pattern(
-    image: Image.Image,
-    palette: tuple[tuple[int, int, int], ...],
+def calc_circle_pattern(
+    width: int,
+    height: int,
     xmin: float,
     ymin: float,
     xmax: float,
     ymax: float,
-) -> None:
-    """Funkce provadejici vypocet moare s kruznicovym vzorkem."""
-    width, height = image.size  # rozmery obrazku
+) -> list[list[int]]:
+    """Funkce provadejici vypocet indexu do palety pro moare s kruznicovym vzorkem."""
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    indices = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
@@ -30,10 +36,23 @@ def recalc_circle_pattern(
             x1 += stepx
             x2 = x1 * x1
             y2 = y1 * y1
-            i = (int)(x2 + y2) & 255
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)  # type: ignore
+            indices[y][x] = (int)(x2 + y2) & 255
         y1 += stepy
+    return indices
+
+
+def recalc_circle_pattern(
+    image: Image.Image,
+    palette: tuple[tuple[int, int, int], ...],
+    xmin: float,
+    ymin: float,
+    xmax: float,
+    ymax: float,
+) -> None:
+    """Funkce provadejici vypocet moare s kruznicovym vzorkem."""
+    width, height = image.size  # rozmery obrazku
+    indices = calc_circle_pattern(width, height, xmin, ymin, xmax, ymax)
+    apply_palette(image, indices, palette)
 
 
 def main() -> None:
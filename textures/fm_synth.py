@@ -6,6 +6,8 @@ from math import sin
 
 from PIL import Image
 
+from colorizer import apply_palette
+
 IMAGE_WIDTH = 256
 IMAGE_HEIGHT = 256
 
@@ -23,17 +25,19 @@ def fm(
     stepx = (xmax - xmin) / width
     stepy = (ymax - ymin) / height
 
+    indices = [[0] * width for y in range(height)]
+
     y1 = ymin
     for y in range(height):
         x1 = xmin
         for x in range(width):
             x1 += stepx
             val = 100 + 100.0 * sin(x1 / 4 + 2 * sin(x1 / 15 + y1 / 40))
-            i = int(val) & 255
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)  # type: ignore
+            indices[y][x] = int(val) & 255
         y1 += stepy
 
+    apply_palette(image, indices, palette)
+
 
 def main() -> None:
     import palette_blues
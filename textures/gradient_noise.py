@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+
+"""Gradient (Perlin) and simplex noise generators in 2D, 3D, and 4D."""
+
+#
+#  (C) Copyright 2025  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from collections.abc import Callable
+from functools import cache
+from itertools import product
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+try:
+    from textures.perlin import Seed, convert_to_image
+except ImportError:
+    from perlin import Seed, convert_to_image
+
+# textura by mela byt ctvercova a jeji sirka i vyska by mela byt
+# mocninou cisla 2
+IMAGE_WIDTH = 256
+IMAGE_HEIGHT = 256
+
+# size of permutation table, noise is periodic with this period
+PERIOD = 256
+
+# number of rows computed at once, so large textures need just a little memory
+BAND_HEIGHT = 64
+
+# radius (squared) of simplex vertex contribution and final scale for 2D, 3D, 4D
+SIMPLEX_RADIUS = {2: 0.5, 3: 0.6, 4: 0.6}
+SIMPLEX_SCALE = {2: 70.0, 3: 32.0, 4: 27.0}
+
+NoiseFunction = Callable[..., np.ndarray]
+
+
+def permutation_table(seed: Seed = None) -> np.ndarray:
+    """Create permutation table used for hashing of lattice points.
+
+    The table is doubled so nested lookups perm[x + perm[y]] never overflow.
+    """
+    rng = np.random.default_rng(seed)
+    perm = rng.permutation(PERIOD)
+    return np.concatenate((perm, perm))
+
+
+@cache
+def gradients(dim: int) -> np.ndarray:
+    """Gradient vectors for given dimension.
+
+    Vectors with exactly one zero component are used (edges of hypercube),
+    in 2D the diagonals are added, because there are just four such vectors.
+    """
+    vectors = [v for v in product((-1, 0, 1), repeat=dim) if any(v)]
+    if dim > 2:
+        vectors = [v for v in vectors if v.count(0) == 1]
+    return np.array(vectors, dtype=np.float64)
+
+
+def hash_lattice(perm: np.ndarray, cells: list[np.ndarray]) -> np.ndarray:
+    """Compute hash of lattice points by nested lookups into permutation table."""
+    h = perm[cells[-1] & (PERIOD - 1)]
+    for cell in reversed(cells[:-1]):
+        h = perm[(cell & (PERIOD - 1)) + h]
+    return h
+
+
+def fade(t: np.ndarray) -> np.ndarray:
+    """Smooth interpolation curve 6t^5 - 15t^4 + 10t^3."""
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+def gradient_noise(perm: np.ndarray, *coords: np.ndarray) -> np.ndarray:
+    """Gradient (Perlin) noise sampled at given coordinates.
+
+    Number of coordinate arrays (2, 3, or 4) selects dimension of the noise,
+    arrays are broadcast together so whole grids can be sampled at once.
+    Result lies approximately in range -1..1.
+    """
+    points = np.broadcast_arrays(*(np.asarray(c, dtype=np.float64) for c in coords))
+    dim = len(points)
+    grads = gradients(dim)
+
+    cells = [np.floor(p) for p in points]
+    fracs = [p - c for p, c in zip(points, cells)]
+    cells_int = [c.astype(np.int64) for c in cells]
+    weights = [fade(f) for f in fracs]
+
+    result = np.zeros(points[0].shape, dtype=np.float64)
+    # multilinear interpolation of contributions of all corners of the cell
+    for corner in product((0, 1), repeat=dim):
+        h = hash_lattice(perm, [c + o for c, o in zip(cells_int, corner)])
+        g = grads[h % len(grads)]
+        dot = sum(g[..., d] * (fracs[d] - corner[d]) for d in range(dim))
+        weight = np.prod([w if o else 1.0 - w for w, o in zip(weights, corner)], axis=0)
+        result += weight * dot
+    return result
+
+
+def simplex_noise(perm: np.ndarray, *coords: np.ndarray) -> np.ndarray:
+    """Simplex noise sampled at given coordinates.
+
+    Number of coordinate arrays (2, 3, or 4) selects dimension of the noise,
+    arrays are broadcast together so whole grids can be sampled at once.
+    Result lies approximately in range -1..1.
+    """
+    points = np.broadcast_arrays(*(np.asarray(c, dtype=np.float64) for c in coords))
+    dim = len(points)
+    grads = gradients(dim)
+    skew = (np.sqrt(dim + 1.0) - 1.0) / dim
+    unskew = (1.0 - 1.0 / np.sqrt(dim + 1.0)) / dim
+
+    # skew the space to find simplex cell containing the point
+    s = sum(points) * skew
+    cells = [np.floor(p + s).astype(np.int64) for p in points]
+    t = sum(cells) * unskew
+    offsets = [p - c + t for p, c in zip(points, cells)]
+
+    # rank of each coordinate determines the order of simplex vertices
+    ranks = np.argsort(np.argsort(-np.stack(offsets), axis=0, kind="stable"), axis=0)
+
+    result = np.zeros(points[0].shape, dtype=np.float64)
+    for k in range(dim + 1):
+        corner = [(ranks[d] < k).astype(np.int64) for d in range(dim)]
+        x = [offsets[d] - corner[d] + k * unskew for d in range(dim)]
+        r = SIMPLEX_RADIUS[dim] - sum(xd * xd for xd in x)
+        h = hash_lattice(perm, [c + o for c, o in zip(cells, corner)])
+        g = grads[h % len(grads)]
+        dot = sum(g[..., d] * x[d] for d in range(dim))
+        r = np.maximum(r, 0.0)
+        result += r * r * r * r * dot
+    return SIMPLEX_SCALE[dim] * result
+
+
+def fractal_noise(
+    noise_function: NoiseFunction,
+    perm: np.ndarray,
+    coords: tuple[Any, ...],
+    octaves: int,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+) -> np.ndarray:
+    """Sum of octaves of noise with increasing frequency and decreasing amplitude."""
+    result = np.zeros(np.broadcast_shapes(*(np.shape(c) for c in coords)), dtype=np.float32)
+    frequency = 1.0
+    amplitude = 1.0
+    for _ in range(octaves):
+        result += amplitude * noise_function(perm, *(frequency * c for c in coords))
+        frequency *= lacunarity
+        amplitude *= persistence
+    return result
+
+
+def calc_noise_texture(
+    width: int,
+    height: int,
+    scale: float,
+    octaves: int,
+    persistence: float = 0.5,
+    seed: Seed = None,
+    noise_function: NoiseFunction = gradient_noise,
+    extra: tuple[float, ...] = (),
+) -> np.ndarray:
+    """Compute texture with fractal noise, scale is size of the texture in lattice cells.
+
+    Extra coordinates (third and fourth dimension) can be used for animated
+    textures, for example time as third coordinate. The texture is computed
+    in horizontal bands, so temporary arrays stay small even for large textures.
+    """
+    perm = permutation_table(seed)
+    xs = np.arange(width) * (scale / width)
+    bitmap = np.empty((height, width), dtype=np.float32)
+    for y0 in range(0, height, BAND_HEIGHT):
+        y1 = min(y0 + BAND_HEIGHT, height)
+        ys = (np.arange(y0, y1) * (scale / width))[:, np.newaxis]
+        coords = (xs[np.newaxis, :], ys, *(np.float64(e) for e in extra))
+        bitmap[y0:y1] = fractal_noise(noise_function, perm, coords, octaves, persistence)
+    return bitmap
+
+
+def noise_texture(
+    image: Image.Image,
+    palette: tuple[tuple[int, int, int], ...],
+    scale: float,
+    octaves: int,
+    persistence: float = 0.5,
+    seed: Seed = None,
+    noise_function: NoiseFunction = gradient_noise,
+    extra: tuple[float, ...] = (),
+) -> None:
+    """Compute texture with fractal noise and render it into given image."""
+    width, height = image.size
+    bitmap = calc_noise_texture(
+        width, height, scale, octaves, persistence, seed, noise_function, extra
+    )
+    convert_to_image(bitmap, image, width, height, palette)
+
+
+def main() -> None:
+    """Vypocet textur s jejich ulozenim do souboru."""
+    import palette_blues
+    import palette_gold
+    import palette_greens
+    import palette_mandmap
+
+    image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
+
+    noise_texture(image, palette_mandmap.palette, 4.0, 6, 0.5, seed=1)
+    image.save("patternF_gradient_noise1.png")
+
+    noise_texture(image, palette_blues.palette, 8.0, 8, 0.6, seed=2)
+    image.save("patternF_gradient_noise2.png")
+
+    noise_texture(image, palette_gold.palette, 4.0, 6, 0.5, 1, simplex_noise)
+    image.save("patternG_simplex_noise1.png")
+
+    noise_texture(image, palette_greens.palette, 8.0, 8, 0.6, 2, simplex_noise)
+    image.save("patternG_simplex_noise2.png")
+
+    # animated texture: the third coordinate is time
+    for frame in range(8):
+        noise_texture(
+            image, palette_blues.palette, 4.0, 5, 0.5, 3, simplex_noise, (frame * 0.1,)
+        )
+        image.save(f"patternG_simplex_noise_frame{frame}.png")
+
+
+if __name__ == "__main__":
+    main()
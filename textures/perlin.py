@@ -26,63 +26,136 @@
 
 # Perlinuv sum
 
-from random import random
+from typing import Any
 
+import numpy as np
 from PIL import Image
 
+try:
+    from textures.colorizer import apply_palette, colorize_intensity
+    from textures.render_cache import RenderCache
+except ImportError:
+    from colorizer import apply_palette, colorize_intensity
+    from render_cache import RenderCache
+
 # textura by mela byt ctvercova a jeji sirka i vyska by mela byt
 # mocninou cisla 2
 IMAGE_WIDTH = 256
 IMAGE_HEIGHT = 256
 
+# seed of random number generator: anything accepted by np.random.default_rng,
+# independent streams for parallel workers can be made by SeedSequence.spawn
+Seed = int | np.random.SeedSequence | np.random.Generator | None
 
-def compute_min_max(
-    bitmap: list[list[float]], width: int, height: int
-) -> tuple[float, float]:
-    # pro prepocet intenzit pixelu
-    min = float("inf")
-    max = float("-inf")
-
-    # ziskani statistiky o obrazku - minimalni a maximalni hodnoty
-    for j in range(height):
-        for i in range(width):
-            z = bitmap[j][i]
-            if max < z:
-                max = z
-            if min > z:
-                min = z
-    return min, max
 
-
-def create_bitmap(width: int, height: int) -> list[list[float]]:
-    return [[0 for x in range(width)] for y in range(height)]
+# velikost dlazdice (v pixelech) pri vykreslovani velkych textur
+TILE_SIZE = 512
 
 
 def convert_to_image(
-    bitmap: list[list[float]],
+    bitmap: Any,
     image: Image.Image,
     width: int,
     height: int,
     palette: tuple[tuple[int, int, int], ...],
 ) -> None:
     print("contrast adjustment")
+    colorize_intensity(image, bitmap, palette)
+
+
+def random_array(
+    width: int, height: int, amplitude: float, rng: np.random.Generator
+) -> np.ndarray:
+    return rng.random((height, width)) * amplitude
+
+
+def create_lattices(noise: float, octaves: int, seed: Seed = None) -> list[np.ndarray]:
+    """Vytvoreni poli nahodnych cisel pro vsechny oktavy, k-ta ma velikost 2**k+1."""
+    rng = np.random.default_rng(seed)
+    return [random_array(2**k + 1, 2**k + 1, noise**k, rng) for k in range(octaves)]
+
 
-    min, max = compute_min_max(bitmap, width, height)
-    k = 255.0 / (max - min)
+def interpolate_octave(
+    array: np.ndarray, n: float, xs: np.ndarray, ys: np.ndarray
+) -> np.ndarray:
+    """Bilinearni interpolace hodnot v poli nahodnych cisel pro dane souradnice pixelu."""
+    i = (xs / n).astype(np.intp)  # prepocet mezi pozici pixelu a indexem v poli
+    j = (ys / n).astype(np.intp)
+    x0 = xs - i * n
+    x1 = n - x0
+    y0 = (ys - j * n)[:, np.newaxis]
+    y1 = n - y0
+    # interpolace, nejdrive po radcich a potom mezi radky
+    top = array[np.ix_(j, i)] * x1 + array[np.ix_(j, i + 1)] * x0
+    bottom = array[np.ix_(j + 1, i)] * x1 + array[np.ix_(j + 1, i + 1)] * x0
+    return (top * y1 + bottom * y0) / (n * n)
 
-    # zmena kontrastu a kopie bitmapy
-    for y in range(height):
-        for x in range(width):
-            f = float(bitmap[y][x])
-            f -= min
-            f *= k
-            i = int(f) & 255
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)  # type: ignore
 
+def sum_octaves(
+    lattices: list[np.ndarray], size: int, xs: np.ndarray, ys: np.ndarray
+) -> np.ndarray:
+    """Soucet vsech oktav pro pixely se souradnicemi xs a ys.
 
-def random_array(width: int, height: int, amplitude: float) -> list[list[float]]:
-    return [[random() * amplitude for i in range(width)] for j in range(height)]
+    Pole nahodnych cisel pokryvaji ctverec o strane size pixelu, u
+    obdelnikove textury je to jeji delsi strana.
+    """
+    bitmap = np.zeros((len(ys), len(xs)), dtype=np.float32)
+
+    # postupne pricteni vsech vrstev (oktav)
+    for array in lattices:
+        n = size / float(array.shape[0] - 1.0)
+        bitmap += interpolate_octave(array, n, xs, ys)
+
+    return bitmap
+
+
+def calc_octaves(
+    lattices: list[np.ndarray], size: int, region: tuple[int, int, int, int]
+) -> np.ndarray:
+    """Soucet vsech oktav pro pixely v regionu (x0, y0, x1, y1) textury dane velikosti."""
+    x0, y0, x1, y1 = region
+    xs = np.arange(x0, x1, dtype=np.float64)
+    ys = np.arange(y0, y1, dtype=np.float64)
+    return sum_octaves(lattices, size, xs, ys)
+
+
+def extreme_coordinates(lattice: np.ndarray, size: int, count: int) -> np.ndarray:
+    """Souradnice pixelu, ve kterych muze mit soucet oktav minimum nebo maximum.
+
+    Mezi sousednimi body nejjemnejsiho pole je soucet vsech oktav linearni
+    funkci souradnice, extremy proto lezi v krajnich pixelech techto useku.
+    """
+    nodes = np.arange(lattice.shape[0]) * (size / float(lattice.shape[0] - 1.0))
+    candidates = np.concatenate((np.floor(nodes), np.ceil(nodes) - 1.0, np.ceil(nodes), [0.0]))
+    return np.unique(np.clip(candidates, 0.0, count - 1.0))
+
+
+def noise_range(
+    lattices: list[np.ndarray], width: int, height: int, tile_size: int = TILE_SIZE
+) -> tuple[float, float]:
+    """Nejmensi a nejvetsi intenzita textury, pocita se jen v pixelech s moznymi extremy."""
+    size = max(width, height)
+    xs = extreme_coordinates(lattices[-1], size, width)
+    ys = extreme_coordinates(lattices[-1], size, height)
+    minimum = np.inf
+    maximum = -np.inf
+    for y0 in range(0, len(ys), tile_size):
+        bitmap = sum_octaves(lattices, size, xs, ys[y0 : y0 + tile_size])
+        minimum = min(minimum, float(bitmap.min()))
+        maximum = max(maximum, float(bitmap.max()))
+    return minimum, maximum
+
+
+def calc_perlin_noise(
+    width: int, height: int, noise: float, octaves: int, seed: Seed = None
+) -> np.ndarray:
+    """Vlastni vypocet Perlinova sumu, vysledkem je bitmapa s intenzitami.
+
+    Kazda oktava se pocita najednou pro vsechny pixely a oktavy se scitaji
+    do bitmapy typu float32. Stejny seed vzdy vede ke stejnemu sumu.
+    """
+    lattices = create_lattices(noise, octaves, seed)
+    return calc_octaves(lattices, max(width, height), (0, 0, width, height))
 
 
 def perlin_noise(
@@ -90,42 +163,47 @@ def perlin_noise(
     palette: tuple[tuple[int, int, int], ...],
     noise: float,
     octaves: int,
+    seed: Seed = None,
 ) -> None:
-    """Vlastni vypocet Perlinova sumu."""
+    """Vypocet Perlinova sumu a jeho vykresleni do obrazku."""
     width, height = image.size  # rozmery obrazku
 
-    bitmap = create_bitmap(width, height)
-
-    # postupne vytvoreni 'octaves' vrstev v obrazku
-    for k in range(octaves):
-        size = 2**k + 1
-        amplitude = noise**k
-
-        # vytvoreni pole nahodnych cisel o dane amplidude
-        array = random_array(size, size, amplitude)
-
-        n = width / float(size - 1.0)
-
-        # interpolace hodnot v poli nahodnych cisel
-        for y in range(height):
-            for x in range(width):
-                i = int(x / n)  # prepocet mezi pozici pixelu a indexem v poli
-                j = int(y / n)
-                x0 = x - i * n
-                x1 = n - x0
-                y0 = y - j * n
-                y1 = n - y0
-                # interpolace
-                z = array[j][i] * x1 * y1
-                z += array[j][i + 1] * x0 * y1
-                z += array[j + 1][i] * x1 * y0
-                z += array[j + 1][i + 1] * x0 * y0
-                z /= n * n
-                bitmap[y][x] += z
-
+    bitmap = calc_perlin_noise(width, height, noise, octaves, seed)
     convert_to_image(bitmap, image, width, height, palette)
 
 
+def perlin_noise_tiled(
+    image: Image.Image,
+    palette: tuple[tuple[int, int, int], ...],
+    noise: float,
+    octaves: int,
+    seed: Seed = None,
+    tile_size: int = TILE_SIZE,
+) -> None:
+    """Vykresleni libovolne velke textury s Perlinovym sumem po dlazdicich.
+
+    Vsechny dlazdice sdili stejna pole nahodnych cisel a stejne meritko
+    intenzit, takze na sebe navazuji. Intenzity se roztahuji na cely
+    rozsah palety stejne jako v perlin_noise, nejmensi a nejvetsi hodnota
+    se zjisti predem bez vypoctu celeho obrazku.
+    """
+    width, height = image.size  # rozmery obrazku
+    lattices = create_lattices(noise, octaves, seed)
+    minimum, maximum = noise_range(lattices, width, height, tile_size)
+    scale = 255.0 / (maximum - minimum) if maximum > minimum else 0.0
+
+    for y0 in range(0, height, tile_size):
+        for x0 in range(0, width, tile_size):
+            x1 = min(x0 + tile_size, width)
+            y1 = min(y0 + tile_size, height)
+            bitmap = calc_octaves(lattices, max(width, height), (x0, y0, x1, y1))
+            indices = (bitmap.astype(np.float64) - minimum) * scale
+            tile = Image.new("RGB", (x1 - x0, y1 - y0))
+            # zaokrouhlovaci chyby nesmi pretect mimo paletu
+            apply_palette(tile, np.clip(indices, 0, 255).astype(np.int64), palette)
+            image.paste(tile, (x0, y0))
+
+
 def main() -> None:
     """Vypocet textur s jejich ulozenim do souboru."""
     import palette_blues
@@ -136,20 +214,28 @@ def main() -> None:
 
     image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
 
-    perlin_noise(image, palette_mandmap.palette, 0.7, 6)
-    image.save("patternE_perlin_noise1.png")
-
-    perlin_noise(image, palette_mandmap.palette, 0.7, 7)
-    image.save("patternE_perlin_noise2.png")
-
-    perlin_noise(image, palette_blues.palette, 0.7, 9)
-    image.save("patternE_perlin_noise3.png")
-
-    perlin_noise(image, palette_gold.palette, 0.7, 11)
-    image.save("patternE_perlin_noise4.png")
-
-    perlin_noise(image, palette_greens.palette, 0.3, 12)
-    image.save("patternE_perlin_noise5.png")
+    # bitmapy se pocitaji jen tehdy, pokud nejsou ulozeny v cache
+    cache = RenderCache()
+
+    textures = (
+        (palette_mandmap.palette, 0.7, 6, 1, "patternE_perlin_noise1.png"),
+        (palette_mandmap.palette, 0.7, 7, 2, "patternE_perlin_noise2.png"),
+        (palette_blues.palette, 0.7, 9, 3, "patternE_perlin_noise3.png"),
+        (palette_gold.palette, 0.7, 11, 4, "patternE_perlin_noise4.png"),
+        (palette_greens.palette, 0.3, 12, 5, "patternE_perlin_noise5.png"),
+    )
+
+    for palette, noise, octaves, seed, filename in textures:
+        bitmap = cache.call(
+            calc_perlin_noise, IMAGE_WIDTH, IMAGE_HEIGHT, noise, octaves, seed
+        )
+        convert_to_image(bitmap, image, IMAGE_WIDTH, IMAGE_HEIGHT, palette)
+        image.save(filename)
+
+    # velka textura se pocita po dlazdicich
+    large_image = Image.new("RGB", (2048, 2048))
+    perlin_noise_tiled(large_image, palette_ice.palette, 0.7, 12, seed=6)
+    large_image.save("patternE_perlin_noise_large.png")
 
 
 if __name__ == "__main__":
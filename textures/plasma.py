@@ -26,59 +26,36 @@
 
 # Vytvoreni textury typu "plasma"
 
-import math
-from random import random
-
+import numpy as np
 from PIL import Image
 
+try:
+    from textures.colorizer import colorize_intensity
+except ImportError:
+    from colorizer import colorize_intensity  # type: ignore[no-redef]
+
 # textura by mela byt ctvercova a jeji sirka i vyska by mela byt
 # mocninou cisla 2
 IMAGE_WIDTH = 256
 IMAGE_HEIGHT = 256
 
-
-def create_bitmap(width: int, height: int) -> list[list[float]]:
-    return [[0 for x in range(width)] for y in range(height)]
+# seed of random number generator: anything accepted by np.random.default_rng,
+# independent streams for parallel workers can be made by SeedSequence.spawn
+Seed = int | np.random.SeedSequence | np.random.Generator | None
 
 
-def create_matrix(width: int, height: int) -> list[list[float]]:
-    return create_bitmap(width, height)
-
-
-def random_gauss() -> float:
+def random_gauss(rng: np.random.Generator, shape: tuple[int, ...]) -> np.ndarray:
     """Random number generator.
 
-    Vygenerovani nahodneho cisla v rozsahu 0..1 s pribliznym
+    Vygenerovani pole nahodnych cisel v rozsahu 0..1 s pribliznym
     Gaussovym rozlozenim.
     """
     N = 50
-    sum = 0.0
-    for i in range(N):
-        sum += random()
-    return sum / N
-
-
-def compute_min_max(
-    bitmap: list[list[float]], width: int, height: int
-) -> tuple[float, float]:
-    """Minimum and maximum pixel value computation."""
-    # pro prepocet intenzit pixelu
-    min = float("inf")
-    max = float("-inf")
-
-    # ziskani statistiky o obrazku - minimalni a maximalni hodnoty
-    for j in range(height):
-        for i in range(width):
-            z = bitmap[j][i]
-            if max < z:
-                max = z
-            if min > z:
-                min = z
-    return min, max
+    return rng.random((*shape, N)).mean(axis=-1)
 
 
 def convert_to_image(
-    bitmap: list[list[float]],
+    bitmap: np.ndarray,
     image: Image.Image,
     width: int,
     height: int,
@@ -86,63 +63,68 @@ def convert_to_image(
 ) -> None:
     """Convert the 2D array into a proper bitmap with high contrast."""
     print("contrast adjustment")
-
-    min, max = compute_min_max(bitmap, width, height)
-    k = 255.0 / (max - min)
-
-    # zmena kontrastu a kopie bitmapy
-    for y in range(height):
-        for x in range(width):
-            f = float(bitmap[y][x])
-            f -= min
-            f *= k
-            i = int(f) & 255
-            color = (palette[i][0], palette[i][1], palette[i][2])
-            image.putpixel((x, y), color)  # type: ignore
+    colorize_intensity(image, bitmap, palette)
 
 
 # h ... Hurstuv exponent
 # n ... pocet koeficientu spektralni syntezy
-def spectral_synthesis(
-    image: Image.Image, palette: tuple[tuple[int, int, int], ...], n: int, h: float
-) -> None:
-    """Plasma texture computation using spectral synthesis."""
-    width, height = image.size  # rozmery obrazku
-
-    bitmap = create_bitmap(width, height)
-
-    A = create_matrix(n // 2, n // 2)  # koeficienty Ak
-    B = create_matrix(n // 2, n // 2)  # koeficienty Bk
+def calc_spectral_synthesis(
+    width: int, height: int, n: int, h: float, seed: Seed = None
+) -> np.ndarray:
+    """Plasma intensities computation using spectral synthesis.
+
+    The inverse Fourier sum is separable, because cos(ku + lv) and
+    sin(ku + lv) can be expressed by products of cosines and sines of
+    ku and lv. So just tables with n/2 rows are computed for columns and
+    rows of the bitmap, and the sum is evaluated by matrix products.
+    The same seed always gives the same plasma.
+    """
+    rng = np.random.default_rng(seed)
+    m = n // 2
     beta = 2.0 * h + 1  # promenna svazana s Hurstovym koeficientem
 
     print("calculate coefficients")
 
-    # vypocet koeficientu Ak a Bk
-    for j in range(n // 2):
-        for i in range(n // 2):
-            rad_i = pow((i + 1), -beta / 2.0) * random_gauss()
-            rad_j = pow((j + 1), -beta / 2.0) * random_gauss()
-            phase_i = 2.0 * math.pi * random()
-            phase_j = 2.0 * math.pi * random()
-            A[j][i] = rad_i * math.cos(phase_i) * rad_j * math.cos(phase_j)
-            B[j][i] = rad_i * math.sin(phase_i) * rad_j * math.sin(phase_j)
+    # vypocet koeficientu Ak a Bk, prvni index odpovida j, druhy i
+    scale = np.arange(1, m + 1) ** (-beta / 2.0)
+    rad_i = scale[np.newaxis, :] * random_gauss(rng, (m, m))
+    rad_j = scale[:, np.newaxis] * random_gauss(rng, (m, m))
+    phase_i = 2.0 * np.pi * rng.random((m, m))
+    phase_j = 2.0 * np.pi * rng.random((m, m))
+    A = rad_i * np.cos(phase_i) * rad_j * np.cos(phase_j)
+    B = rad_i * np.sin(phase_i) * rad_j * np.sin(phase_j)
 
     print("plasma synthesis")
 
-    # vygenerovani plasmy
-    for j in range(height):
-        for i in range(width):
-            z = 0.0
-            # inverzni Fourierova transformace
-            for k in range(n // 2):
-                for l in range(n // 2):
-                    u = (i - n / 2) * 2.0 * math.pi / width
-                    v = (j - n / 2) * 2.0 * math.pi / height
-                    z += A[k][l] * math.cos(k * u + l * v) + B[k][l] * math.sin(
-                        k * u + l * v,
-                    )
-            bitmap[j][i] = z
+    # tabulky pro sloupce (k * u) a radky (l * v) bitmapy
+    k = np.arange(m)[:, np.newaxis]
+    u = (np.arange(width) - n / 2) * 2.0 * np.pi / width
+    v = (np.arange(height) - n / 2) * 2.0 * np.pi / height
+    cos_u = np.cos(k * u)
+    sin_u = np.sin(k * u)
+    cos_v = np.cos(k * v)
+    sin_v = np.sin(k * v)
+
+    # inverzni Fourierova transformace: z[j, i] = suma pres k, l
+    # A[k, l] * cos(k * u[i] + l * v[j]) + B[k, l] * sin(k * u[i] + l * v[j])
+    return (
+        cos_v.T @ (A.T @ cos_u + B.T @ sin_u)
+        + sin_v.T @ (B.T @ cos_u - A.T @ sin_u)
+    )
 
+
+# h ... Hurstuv exponent
+# n ... pocet koeficientu spektralni syntezy
+def spectral_synthesis(
+    image: Image.Image,
+    palette: tuple[tuple[int, int, int], ...],
+    n: int,
+    h: float,
+    seed: Seed = None,
+) -> None:
+    """Plasma texture computation using spectral synthesis."""
+    width, height = image.size  # rozmery obrazku
+    bitmap = calc_spectral_synthesis(width, height, n, h, seed)
     convert_to_image(bitmap, image, width, height, palette)
 
 
@@ -156,22 +138,22 @@ def main() -> None:
 
     image = Image.new("RGB", (IMAGE_WIDTH, IMAGE_HEIGHT))
 
-    spectral_synthesis(image, palette_greens.palette, 4, 0.5)
+    spectral_synthesis(image, palette_greens.palette, 4, 0.5, seed=1)
     image.save("patternD_plasma1.png")
 
-    spectral_synthesis(image, palette_blues.palette, 10, 0.5)
+    spectral_synthesis(image, palette_blues.palette, 10, 0.5, seed=2)
     image.save("patternD_plasma2.png")
 
-    spectral_synthesis(image, palette_mandmap.palette, 5, 0.1)
+    spectral_synthesis(image, palette_mandmap.palette, 5, 0.1, seed=3)
     image.save("patternD_plasma3.png")
 
-    spectral_synthesis(image, palette_mandmap.palette, 5, 1.0)
+    spectral_synthesis(image, palette_mandmap.palette, 5, 1.0, seed=4)
     image.save("patternD_plasma4.png")
 
-    spectral_synthesis(image, palette_gold.palette, 15, 0.5)
+    spectral_synthesis(image, palette_gold.palette, 15, 0.5, seed=5)
     image.save("patternD_plasma5.png")
 
-    spectral_synthesis(image, palette_ice.palette, 15, 0.8)
+    spectral_synthesis(image, palette_ice.palette, 15, 0.8, seed=6)
     image.save("patternD_plasma6.png")
 
 